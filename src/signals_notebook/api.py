@@ -96,6 +96,7 @@ class SignalsNotebookApi:
         data: _Data = None,
         json: Optional[Union[list, Dict[str, Any]]] = None,
         headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """Makes an API call
 
@@ -110,6 +111,7 @@ class SignalsNotebookApi:
             json:  (optional) A request body
             headers: (optional) A mapping of request headers where a key is the
                 header name and its value is the header value.
+            stream: (optional) if False, the response content will be immediately downloaded.
 
         Returns:
             Response object
@@ -132,6 +134,7 @@ class SignalsNotebookApi:
                 params=params,
                 json=json,
                 headers=headers,
+                stream=stream,
             )
         elif data:
             response = self._session.request(
@@ -140,6 +143,7 @@ class SignalsNotebookApi:
                 params=params,
                 data=data,
                 headers=headers,
+                stream=stream,
             )
         else:
             response = self._session.request(
@@ -147,6 +151,7 @@ class SignalsNotebookApi:
                 url=self._prepare_path(path),
                 params=params,
                 headers=headers,
+                stream=stream,
             )
 
         if not response.ok:
@@ -1 +1,3 @@
 from signals_notebook.attributes.attribute import Attribute  # noqa
+from signals_notebook.attributes.attribute_registry import AttributeRegistry  # noqa
+from signals_notebook.attributes.attribute_sync import AttributeSync, AttributeSyncReport, OptionDiff  # noqa
@@ -1,6 +1,6 @@
 import logging
 from enum import Enum
-from typing import cast, Generator, Literal, Optional
+from typing import cast, Generator, Iterable, Literal, Mapping, Optional
 
 from pydantic import BaseModel
 from pydantic.fields import PrivateAttr
@@ -10,6 +10,8 @@ from signals_notebook.common_types import AttrID, ObjectType, Response, Response
 
 log = logging.getLogger(__name__)
 
+OPTIONS_PATCH_CHUNK_SIZE = 100
+
 
 class Action(str, Enum):
     UPDATE = 'update'
@@ -209,6 +211,61 @@ class Attribute(BaseModel):
         log.debug('Patching Option: %s...', self.id)
         self._patch_options(option)
 
+    def apply_option_changes(
+        self,
+        creates: Iterable[str] = (),
+        updates: Optional[Mapping[str, str]] = None,
+        deletes: Iterable[str] = (),
+        chunk_size: int = OPTIONS_PATCH_CHUNK_SIZE,
+    ) -> None:
+        """Create, update and delete many options of Attribute.
+
+        Changes are sent in chunks of chunk_size options per request and applied to loaded options locally,
+        options are reloaded only if one of requests has failed.
+
+        Args:
+            creates: new options
+            updates: new option values by old option values
+            deletes: options which will be deleted
+            chunk_size: max number of options changed with one request
+
+        Returns:
+
+        """
+        updates = dict(updates or {})
+        deletes = list(dict.fromkeys(deletes))
+        creates = list(dict.fromkeys(creates))
+        changes = [
+            *[_OptionRepresentation(id=option, attributes=_Attributes(action=Action.DELETE)) for option in deletes],
+            *[
+                _OptionRepresentation(id=old_option, attributes=_Attributes(action=Action.UPDATE, value=new_option))
+                for old_option, new_option in updates.items()
+            ],
+            *[_OptionRepresentation(attributes=_Attributes(action=Action.CREATE, value=option)) for option in creates],
+        ]
+        log.debug('Applying %s option changes of Attribute: %s...', len(changes), self.id)
+
+        api = SignalsNotebookApi.get_default_api()
+        try:
+            for i in range(0, len(changes), chunk_size):
+                api.call(
+                    method='PATCH',
+                    path=(self._get_endpoint(), self.id, 'options'),
+                    json={'data': [option.dict(exclude_none=True) for option in changes[i:i + chunk_size]]},
+                )
+        except Exception:
+            self._reload_options()
+            self._update_registry()
+            raise
+
+        if self._options:
+            deleted = set(deletes)
+            options = [updates.get(option, option) for option in self._options if option not in deleted]
+            self._options = options + [option for option in creates if option not in options]
+        self._update_registry()
+
+        log.debug('Option changes of Attribute: %s were applied successfully', self.id)
+
     def _patch_options(self, option: _OptionRepresentation) -> None:
         api = SignalsNotebookApi.get_default_api()
         api.call(
@@ -217,8 +274,14 @@ class Attribute(BaseModel):
             json={'data': [option.dict(exclude_none=True)]},
         )
         self._reload_options()
+        self._update_registry()
         log.debug('Attribute: %s was reloaded successfully', self.id)
 
+    def _update_registry(self) -> None:
+        from signals_notebook.attributes.attribute_registry import AttributeRegistry
+
+        AttributeRegistry.update(self)
+
     def _reload_options(self):
         self._options = []
         api = SignalsNotebookApi.get_default_api()
@@ -229,12 +292,18 @@ class Attribute(BaseModel):
         )
 
         result = _AttributeOptionResponse(**response.json())
+        options = [cast(_AttributeOption, cast(ResponseData, item).body).value for item in result.data]
+
+        while result.links and result.links.next:
+            response = api.call(
+                method='GET',
+                path=result.links.next,
+            )
 
-        for item in result.data:
-            body = cast(ResponseData, item).body
-            option = cast(_AttributeOption, body)
+            result = _AttributeOptionResponse(**response.json())
+            options.extend(cast(_AttributeOption, cast(ResponseData, item).body).value for item in result.data)
 
-            self._options.append(option.value)
+        self._options = options
 
     @property
     def options(self) -> list[str]:
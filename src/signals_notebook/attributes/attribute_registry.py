@@ -0,0 +1,59 @@
+import logging
+
+from signals_notebook.attributes.attribute import Attribute
+from signals_notebook.common_types import AttrID
+from signals_notebook.utils.registry import TTLRegistry
+
+log = logging.getLogger(__name__)
+
+
+class AttributeRegistry(TTLRegistry[Attribute]):
+    """Process-wide cache of attributes with their options keyed by attribute id.
+
+    Attributes referenced by material fields and table columns are fetched once and shared,
+    options of a cached attribute are loaded on first access. Attributes older than ttl seconds
+    are fetched again on next access.
+    """
+
+    @classmethod
+    def update(cls, attribute: Attribute) -> None:
+        """Replace cached attribute with changed one, attributes which are not cached are ignored
+
+        Args:
+            attribute: Attribute object
+
+        Returns:
+
+        """
+        with cls._lock:
+            if attribute.id in cls._items:
+                cls.put(attribute)
+
+    @classmethod
+    def get(cls, attribute_id: str) -> Attribute:
+        """Get attribute by id, it is fetched if it is not cached or is expired
+
+        Args:
+            attribute_id: attribute id
+
+        Returns:
+            Attribute
+        """
+        attribute = cls.lookup(attribute_id)
+        if attribute is None:
+            attribute = Attribute.get(AttrID(attribute_id, validate=False))
+            cls.put(attribute, attribute_id)
+
+        return attribute
+
+    @classmethod
+    def get_options(cls, attribute_id: str) -> list[str]:
+        """Get options of attribute, they are loaded once per cached attribute
+
+        Args:
+            attribute_id: attribute id
+
+        Returns:
+            list[str]
+        """
+        return list(cls.get(attribute_id).options)
@@ -0,0 +1,249 @@
+import logging
+import re
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from signals_notebook.attributes.attribute import Attribute, OPTIONS_PATCH_CHUNK_SIZE
+from signals_notebook.utils.concurrency import DEFAULT_CONCURRENCY, map_concurrently
+
+log = logging.getLogger(__name__)
+
+MAX_SIMILARITY_PAIRS = 250_000
+
+_SEPARATORS = re.compile(r'[\s_\-.,;:/]+')
+
+
+def _normalize(option: str) -> str:
+    return _SEPARATORS.sub(' ', option).strip().casefold()
+
+
+class OptionDiff(BaseModel):
+    creates: List[str] = Field(default_factory=list)
+    updates: Dict[str, str] = Field(default_factory=dict)
+    deletes: List[str] = Field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if there are no changes
+
+        Returns:
+            bool: True/False
+        """
+        return not (self.creates or self.updates or self.deletes)
+
+
+class AttributeSyncReport(BaseModel):
+    diffs: Dict[str, OptionDiff] = Field(default_factory=dict)
+    missing: List[str] = Field(default_factory=list)
+    failed: Dict[str, str] = Field(default_factory=dict)
+
+
+def _match_similar(removed: List[str], added: List[str], rename_threshold: float) -> Dict[str, str]:
+    # the most similar pairs are matched first
+    candidates: List[Tuple[float, str, str]] = []
+    for option in removed:
+        matcher = SequenceMatcher(None, b=_normalize(option))
+        for new_option in added:
+            matcher.set_seq1(_normalize(new_option))
+            if matcher.real_quick_ratio() >= rename_threshold and matcher.quick_ratio() >= rename_threshold:
+                ratio = matcher.ratio()
+                if ratio >= rename_threshold:
+                    candidates.append((ratio, option, new_option))
+
+    renames: Dict[str, str] = {}
+    matched = set()
+    for _, option, new_option in sorted(candidates, key=lambda candidate: -candidate[0]):
+        if option not in renames and new_option not in matched:
+            renames[option] = new_option
+            matched.add(new_option)
+
+    return renames
+
+
+def _match_renames(removed: List[str], added: List[str], rename_threshold: float) -> Dict[str, str]:
+    renames: Dict[str, str] = {}
+    added_by_key = {_normalize(option): option for option in added}
+    for option in removed:
+        new_option = added_by_key.pop(_normalize(option), None)
+        if new_option is not None:
+            renames[option] = new_option
+
+    removed = [option for option in removed if option not in renames]
+    added = list(added_by_key.values())
+    if rename_threshold < 1 and len(removed) * len(added) <= MAX_SIMILARITY_PAIRS:
+        renames.update(_match_similar(removed, added, rename_threshold))
+
+    return renames
+
+
+def diff_options(
+    current: Iterable[str],
+    desired: Iterable[str],
+    rename_threshold: float = 1,
+    renames: Optional[Mapping[str, str]] = None,
+) -> OptionDiff:
+    """Compute changes which turn current options into desired ones.
+
+    A removed option is renamed instead of being deleted when added option has the same value
+    ignoring case and separators. Similar options are treated as renamed only if rename_threshold is below 1,
+    since distinct values like Lot-2023-01 and Lot-2023-02 are similar as well.
+
+    Args:
+        current: current options of attribute
+        desired: options from the source
+        rename_threshold: min similarity ratio (0..1) of options which are treated as renamed,
+            1 (default) disables similarity matching
+        renames: known new option values by old option values
+
+    Returns:
+        OptionDiff
+    """
+    current = list(dict.fromkeys(current))
+    desired = list(dict.fromkeys(desired))
+    desired_set = set(desired)
+    current_set = set(current)
+    removed = [option for option in current if option not in desired_set]
+    added = [option for option in desired if option not in current_set]
+
+    matched = {
+        old_option: new_option
+        for old_option, new_option in (renames or {}).items()
+        if old_option in removed and new_option in added
+    }
+    matched.update(
+        _match_renames(
+            [option for option in removed if option not in matched],
+            [option for option in added if option not in matched.values()],
+            rename_threshold,
+        )
+    )
+
+    renamed = set(matched.values())
+    return OptionDiff(
+        creates=[option for option in added if option not in renamed],
+        updates=matched,
+        deletes=[option for option in removed if option not in matched],
+    )
+
+
+class AttributeSync:
+    """Synchronize options of attributes with an external source.
+
+    All attributes are listed once and their options are fetched concurrently, then options diffs are applied
+    as batched option patches, several attributes at a time.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        chunk_size: int = OPTIONS_PATCH_CHUNK_SIZE,
+        rename_threshold: float = 1,
+    ):
+        """
+        Args:
+            concurrency: max number of simultaneous api calls
+            chunk_size: max number of options changed with one request
+            rename_threshold: min similarity ratio (0..1) of options which are treated as renamed,
+                1 (default) disables similarity matching
+        """
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        self.rename_threshold = rename_threshold
+        self._attributes: Optional[Dict[str, Attribute]] = None
+
+    def load(self) -> Dict[str, Attribute]:
+        """Reload all attributes with their options
+
+        Returns:
+            attributes by names
+        """
+        attributes = list(Attribute.get_list())
+        results = map_concurrently(lambda attribute: attribute.options, attributes, self.concurrency)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+        self._attributes = {attribute.name: attribute for attribute in attributes}
+        log.debug('Options of %s attributes were loaded', len(attributes))
+
+        return self._attributes
+
+    @property
+    def attributes(self) -> Dict[str, Attribute]:
+        """Get attributes by names, they are loaded on first access
+
+        Returns:
+            attributes by names
+        """
+        if self._attributes is None:
+            return self.load()
+
+        return self._attributes
+
+    def plan(
+        self,
+        source: Mapping[str, Iterable[str]],
+        renames: Optional[Mapping[str, Mapping[str, str]]] = None,
+    ) -> AttributeSyncReport:
+        """Compute option changes of attributes without applying them
+
+        Args:
+            source: desired options by attribute names
+            renames: known new option values by old option values, by attribute names
+
+        Returns:
+            AttributeSyncReport
+        """
+        report = AttributeSyncReport()
+        for name, options in source.items():
+            attribute = self.attributes.get(name)
+            if attribute is None:
+                report.missing.append(name)
+                continue
+
+            diff = diff_options(attribute.options, options, self.rename_threshold, (renames or {}).get(name))
+            if not diff.is_empty:
+                report.diffs[name] = diff
+
+        return report
+
+    def _apply(self, name: str, diff: OptionDiff) -> None:
+        self.attributes[name].apply_option_changes(
+            creates=diff.creates, updates=diff.updates, deletes=diff.deletes, chunk_size=self.chunk_size
+        )
+
+    def sync(
+        self,
+        source: Mapping[str, Iterable[str]],
+        renames: Optional[Mapping[str, Mapping[str, str]]] = None,
+        dry_run: bool = False,
+    ) -> AttributeSyncReport:
+        """Make options of attributes equal to the source. Attributes which are missing in the source are not changed.
+
+        Args:
+            source: desired options by attribute names
+            renames: known new option values by old option values, by attribute names
+            dry_run: only compute changes
+
+        Returns:
+            AttributeSyncReport
+        """
+        report = self.plan(source, renames)
+        if dry_run:
+            return report
+
+        names = list(report.diffs)
+        results = map_concurrently(lambda name: self._apply(name, report.diffs[name]), names, self.concurrency)
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                report.failed[name] = str(result)
+
+        log.debug(
+            'Options of %s attributes were synchronized, %s failed, %s missing',
+            len(names) - len(report.failed),
+            len(report.failed),
+            len(report.missing),
+        )
+        return report
@@ -0,0 +1,149 @@
+import logging
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TYPE_CHECKING, Union
+
+import pandas as pd
+
+from signals_notebook.common_types import EID
+from signals_notebook.entities.stoichiometry.cell import ColumnDataType
+from signals_notebook.entities.stoichiometry.data_grid import (
+    Cell,
+    Condition,
+    DataGridKind,
+    Product,
+    Reactant,
+    Row,
+    Solvent,
+)
+
+if TYPE_CHECKING:
+    from signals_notebook.entities.stoichiometry.stoichiometry import Stoichiometry
+
+log = logging.getLogger(__name__)
+
+EXPERIMENT_EID_COLUMN = 'experiment_eid'
+STOICHIOMETRY_EID_COLUMN = 'stoichiometry_eid'
+UNITS_SUFFIX = '_units'
+
+_NUMERIC_COLUMN_TYPES = (ColumnDataType.NUMBER, ColumnDataType.INTEGER, ColumnDataType.UNIT)
+
+_ROW_MODELS: Dict[DataGridKind, Type[Row]] = {
+    DataGridKind.REACTANTS: Reactant,
+    DataGridKind.PRODUCTS: Product,
+    DataGridKind.SOLVENTS: Solvent,
+    DataGridKind.CONDITIONS: Condition,
+}
+
+StoichiometryResult = Union['Stoichiometry', List['Stoichiometry'], Exception]
+
+
+def _column_name(field_name: str) -> str:
+    return field_name.rstrip('_')
+
+
+def _to_float(value: Any) -> float:
+    if value is None:
+        return float('nan')
+    try:
+        # Cell parses numeric values 1 and 0 as bool, they are numbers in numeric columns
+        return float(value)
+    except ValueError:
+        log.debug('Non-numeric value %r in numeric column is dropped', value)
+        return float('nan')
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    return bool(value) if isinstance(value, (bool, Decimal)) else None
+
+
+def _to_array(values: List[Any], column_type: Optional[ColumnDataType]) -> Any:
+    if column_type in _NUMERIC_COLUMN_TYPES:
+        return pd.array([_to_float(value) for value in values], dtype='float64')
+    if column_type == ColumnDataType.BOOLEAN:
+        return pd.array([_to_bool(value) for value in values], dtype='boolean')
+
+    return pd.array([None if value is None else str(value) for value in values], dtype='object')
+
+
+class _GridTable:
+    def __init__(self, model: Type[Row]):
+        self.cell_fields = [name for name, field in model.__fields__.items() if field.type_ is Cell]
+        self.other_fields = [name for name, field in model.__fields__.items() if field.type_ is not Cell]
+        self.field_order = list(model.__fields__)
+        self.aliases = {name: field.alias for name, field in model.__fields__.items()}
+        self.column_types: Dict[str, ColumnDataType] = {}
+        self.keys: List[str] = []
+        self.stoichiometry_eids: List[str] = []
+        self.values: Dict[str, List[Any]] = {name: [] for name in model.__fields__}
+        self.units: Dict[str, List[Optional[str]]] = {name: [] for name in self.cell_fields}
+
+    def add(self, key: str, stoichiometry: 'Stoichiometry', grid_kind: DataGridKind) -> None:
+        grid = getattr(stoichiometry, grid_kind.value)
+        for column_definition in grid.column_definitions:
+            self.column_types.setdefault(column_definition.key, column_definition.type)
+
+        for row in grid:
+            self.keys.append(key)
+            self.stoichiometry_eids.append(stoichiometry.eid)
+            for name in self.cell_fields:
+                cell = getattr(row, name)
+                self.values[name].append(None if cell is None else cell.value)
+                self.units[name].append(None if cell is None else cell.units)
+            for name in self.other_fields:
+                value = getattr(row, name)
+                self.values[name].append(None if value is None else str(value))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        data: Dict[str, Any] = {
+            EXPERIMENT_EID_COLUMN: pd.Categorical(self.keys),
+            STOICHIOMETRY_EID_COLUMN: pd.Categorical(self.stoichiometry_eids),
+        }
+        for name in self.field_order:
+            if name in self.units:
+                data[_column_name(name)] = _to_array(self.values[name], self.column_types.get(self.aliases[name]))
+                data[f'{_column_name(name)}{UNITS_SUFFIX}'] = pd.array(self.units[name], dtype='object')
+            else:
+                data[_column_name(name)] = _to_array(self.values[name], None)
+
+        return pd.DataFrame(data)
+
+
+def _iter_items(
+    items: Iterable[Union['Stoichiometry', Tuple[EID, StoichiometryResult]]]
+) -> Iterable[Tuple[str, 'Stoichiometry']]:
+    for item in items:
+        if not isinstance(item, tuple):
+            yield item.eid, item
+            continue
+
+        key, result = item
+        if isinstance(result, Exception):
+            log.debug('Stoichiometry of %s is skipped: %s', key, result)
+        elif isinstance(result, list):
+            yield from ((key, stoichiometry) for stoichiometry in result)
+        else:
+            yield key, result
+
+
+def to_dataframes(
+    items: Iterable[Union['Stoichiometry', Tuple[EID, StoichiometryResult]]]
+) -> Dict[DataGridKind, pd.DataFrame]:
+    """Build one columnar table per data grid kind from many stoichiometry objects.
+
+    Each row is keyed by experiment EID. Types of cell columns are taken from column definitions of the grids,
+    so they do not depend on values: number, integer and unit columns are float64, boolean columns are
+    nullable booleans and other columns are strings. Every cell column has a separate '<column>_units' column.
+
+    Args:
+        items: Stoichiometry objects or (entity EID, result) pairs produced by Stoichiometry.fetch_many,
+            failed results are skipped
+
+    Returns:
+        DataFrame of reactants, products, solvents and conditions by data grid kind
+    """
+    tables = {grid_kind: _GridTable(model) for grid_kind, model in _ROW_MODELS.items()}
+    for key, stoichiometry in _iter_items(items):
+        for grid_kind, table in tables.items():
+            table.add(key, stoichiometry, grid_kind)
+
+    return {grid_kind: table.to_dataframe() for grid_kind, table in tables.items()}
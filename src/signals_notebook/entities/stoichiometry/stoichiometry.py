@@ -1,8 +1,13 @@
 import abc
 import cgi
 import logging
-from typing import cast, ClassVar, Optional, Union
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import cast, ClassVar, Iterable, Iterator, Optional, Union
 
+import pandas as pd
 from pydantic import BaseModel, Field
 
 from signals_notebook.api import SignalsNotebookApi
@@ -17,7 +22,9 @@ from signals_notebook.entities.stoichiometry.data_grid import (
     Rows,
     Solvents,
 )
+from signals_notebook.entities.stoichiometry.dataframes import to_dataframes
 from signals_notebook.jinja_env import env
+from signals_notebook.utils.concurrency import DEFAULT_CONCURRENCY, map_concurrently
 
 log = logging.getLogger(__name__)
 
@@ -39,6 +46,12 @@ class Stoichiometry(BaseModel, abc.ABC):
     solvents: Solvents = Field(default=Solvents(__root__=[]))
     conditions: Conditions = Field(default=Conditions(__root__=[]))
     _template_name: ClassVar = 'stoichiometry.html'
+    column_definitions_ttl: ClassVar[float] = 300
+    """time (seconds) after which cached column definitions are fetched again (float)
+    """
+    _column_definitions_cache: ClassVar[dict[tuple[str, DataGridKind], tuple[float, list[ColumnDefinition]]]] = {}
+    _column_definitions_pending: ClassVar[dict[tuple[str, DataGridKind], Future]] = {}
+    _column_definitions_lock: ClassVar[threading.Lock] = threading.Lock()
 
     class Config:
         validate_assignment = True
@@ -61,6 +74,60 @@ class Stoichiometry(BaseModel, abc.ABC):
     def _get_endpoint(cls) -> str:
         return 'stoichiometry'
 
+    @classmethod
+    def _fetch_column_definitions(cls, stoichiometry: 'Stoichiometry', fetched: dict[DataGridKind, Future]) -> None:
+        log.debug('Fetching column definitions of %s grids for: %s...', len(fetched), stoichiometry.eid)
+        results = map_concurrently(stoichiometry.get_column_definitions, list(fetched), len(fetched))
+        for (grid_kind, future), result in zip(fetched.items(), results):
+            key = (SignalsNotebookApi._api_host, grid_kind)
+            with cls._column_definitions_lock:
+                if not isinstance(result, Exception):
+                    cls._column_definitions_cache[key] = (time.monotonic(), result)
+                cls._column_definitions_pending.pop(key, None)
+
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @classmethod
+    def _get_cached_column_definitions(
+        cls, stoichiometry: 'Stoichiometry'
+    ) -> dict[DataGridKind, list[ColumnDefinition]]:
+        now = time.monotonic()
+        column_definitions: dict[DataGridKind, list[ColumnDefinition]] = {}
+        # column definitions of a grid are fetched by one thread at a time, other threads wait for its result
+        fetched: dict[DataGridKind, Future] = {}
+        awaited: dict[DataGridKind, Future] = {}
+        with cls._column_definitions_lock:
+            for grid_kind in DataGridKind:
+                key = (SignalsNotebookApi._api_host, grid_kind)
+                cached = cls._column_definitions_cache.get(key)
+                if cached is not None and now - cached[0] <= cls.column_definitions_ttl:
+                    column_definitions[grid_kind] = cached[1]
+                elif key in cls._column_definitions_pending:
+                    awaited[grid_kind] = cls._column_definitions_pending[key]
+                else:
+                    fetched[grid_kind] = cls._column_definitions_pending[key] = Future()
+
+        if fetched:
+            cls._fetch_column_definitions(stoichiometry, fetched)
+
+        for grid_kind, future in {**fetched, **awaited}.items():
+            column_definitions[grid_kind] = future.result()
+
+        return column_definitions
+
+    @classmethod
+    def invalidate_column_definitions(cls) -> None:
+        """Drop cached column definitions of all grids, they are fetched again on next use
+
+        Returns:
+
+        """
+        with cls._column_definitions_lock:
+            cls._column_definitions_cache = {}
+
     @classmethod
     def _get_stoichiometry(cls, data: ResponseData) -> 'Stoichiometry':
         body = cast(DataGrids, data.body)
@@ -73,12 +140,11 @@ class Stoichiometry(BaseModel, abc.ABC):
             conditions=body.conditions,
         )
 
+        # column definitions are tenant configuration, they are shared by all stoichiometry objects
+        column_definitions = cls._get_cached_column_definitions(stoichiometry)
         for grid_kind in DataGridKind:
-            grid_kind = cast(DataGridKind, grid_kind)
-            grid = getattr(stoichiometry, grid_kind.value)
-            grid = cast(Rows, grid)
-            column_definitions = stoichiometry.get_column_definitions(grid_kind)
-            grid.set_column_definitions(column_definitions)
+            grid = cast(Rows, getattr(stoichiometry, grid_kind.value))
+            grid.set_column_definitions(column_definitions[grid_kind])
 
         return stoichiometry
 
@@ -119,6 +185,61 @@ class Stoichiometry(BaseModel, abc.ABC):
 
             return stoichiometry
 
+    @classmethod
+    def fetch_many(
+        cls,
+        entity_eids: Iterable[EID],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = True,
+    ) -> Iterator[tuple[EID, Union['Stoichiometry', list['Stoichiometry'], Exception]]]:
+        """Fetch stoichiometry data of many experiments or chemicalDrawings concurrently.
+
+        Entity ids are consumed lazily and results are yielded as soon as they are fetched,
+        so at most concurrency requests are in flight and finished results are not held.
+
+        Args:
+            entity_eids: Unique entity identifiers
+            concurrency: max number of simultaneous api calls
+            return_exceptions: yield an exception raised for an entity in place of its result, otherwise raise it
+
+        Returns:
+            (entity_eid, result) pairs in order of completion, result is the same as of fetch_data
+        """
+        eids = iter(entity_eids)
+        concurrency = max(concurrency, 1)
+        log.debug('Fetching stoichiometry data of many entities, concurrency: %s...', concurrency)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending: dict[Future, EID] = {
+                executor.submit(cls.fetch_data, eid): eid for eid in islice(eids, concurrency)
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entity_eid = pending.pop(future)
+                    for next_eid in islice(eids, 1):
+                        pending[executor.submit(cls.fetch_data, next_eid)] = next_eid
+
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        if not return_exceptions:
+                            for pending_future in pending:
+                                pending_future.cancel()
+                            raise
+                        log.debug('Cannot fetch stoichiometry data of %s: %s', entity_eid, e)
+                        result = e
+
+                    yield entity_eid, result
+
+    def to_dataframes(self) -> dict[DataGridKind, pd.DataFrame]:
+        """Get data grids as DataFrames. Use dataframes.to_dataframes to combine many stoichiometry objects.
+
+        Returns:
+            DataFrame of reactants, products, solvents and conditions by data grid kind
+        """
+        return to_dataframes([self])
+
     def fetch_structure(self, row_id: str, format: Optional[ChemicalDrawingFormat] = None) -> File:
         """Fetch structure of reactants/products. Accepted entity types: chemicalDrawing.
 
@@ -0,0 +1,180 @@
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Sequence, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from signals_notebook.entities.tables.cell import (
+    AttributeListColumnDefinition,
+    CellContentDict,
+    ColumnDataType,
+    GenericColumnDefinition,
+)
+from signals_notebook.entities.tables.compact_row import CompactRow
+from signals_notebook.entities.tables.row import Row
+
+AnyRow = Union[Row, CompactRow]
+
+DEFAULT_ROW_GROUP_SIZE = 10000
+
+_ARROW_TYPES: Dict[ColumnDataType, pa.DataType] = {
+    ColumnDataType.NUMBER: pa.float64(),
+    ColumnDataType.UNIT: pa.float64(),
+    ColumnDataType.INTEGER: pa.int64(),
+    ColumnDataType.BOOLEAN: pa.bool_(),
+    ColumnDataType.DATE_TIME: pa.timestamp('us', tz='UTC'),
+    ColumnDataType.MULTI_SELECT: pa.list_(pa.string()),
+}
+
+
+def _to_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+
+    return value.astimezone(timezone.utc)
+
+
+_CONVERTERS: Dict[ColumnDataType, Callable[[Any], Any]] = {
+    ColumnDataType.NUMBER: float,
+    ColumnDataType.UNIT: float,
+    ColumnDataType.INTEGER: lambda value: int(float(value)),
+    ColumnDataType.BOOLEAN: bool,
+    ColumnDataType.DATE_TIME: _to_utc,
+}
+
+
+def is_multi_value(column_definition: GenericColumnDefinition) -> bool:
+    """Check if the column keeps several values in a cell
+
+    Args:
+        column_definition: column definition
+
+    Returns:
+        bool: True/False
+    """
+    if isinstance(column_definition, AttributeListColumnDefinition):
+        return column_definition.multi_select
+
+    return column_definition.type == ColumnDataType.MULTI_SELECT
+
+
+def get_arrow_schema(column_definitions: Sequence[GenericColumnDefinition], use_labels: bool = True) -> pa.Schema:
+    """Get Arrow schema of the table
+
+    Args:
+        column_definitions: column definitions of the table
+        use_labels: use column titles as field names, column keys otherwise
+
+    Returns:
+        pa.Schema
+    """
+    fields = []
+    for column_definition in column_definitions:
+        if is_multi_value(column_definition):
+            arrow_type = pa.list_(pa.string())
+        else:
+            arrow_type = _ARROW_TYPES.get(column_definition.type, pa.string())
+
+        fields.append(
+            pa.field(
+                column_definition.title if use_labels else str(column_definition.key),
+                arrow_type,
+                metadata={'key': str(column_definition.key), 'type': column_definition.type.value},
+            )
+        )
+
+    return pa.schema(fields)
+
+
+def _get_column(rows: Sequence[AnyRow], column_definition: GenericColumnDefinition) -> List[Any]:
+    key = column_definition.key
+    multi_value = is_multi_value(column_definition)
+    convert = _CONVERTERS.get(column_definition.type, str)
+
+    values: List[Any] = []
+    for row in rows:
+        value = row.get_value(key)
+        if value is None:
+            values.append(None)
+        elif multi_value:
+            values.append([str(item) for item in value] if isinstance(value, list) else [str(value)])
+        elif isinstance(value, list):
+            values.append(', '.join(str(item) for item in value))
+        else:
+            values.append(convert(value))
+
+    return values
+
+
+def iter_record_batches(
+    rows: Sequence[AnyRow],
+    column_definitions: Sequence[GenericColumnDefinition],
+    schema: pa.Schema,
+    batch_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> Iterator[pa.RecordBatch]:
+    """Convert rows to record batches column by column
+
+    Args:
+        rows: table rows
+        column_definitions: column definitions of the table
+        schema: Arrow schema built by get_arrow_schema
+        batch_size: number of rows in one batch
+
+    Returns:
+        Iterator[pa.RecordBatch]
+    """
+    for i in range(0, len(rows), batch_size):
+        chunk = rows[i:i + batch_size]
+        arrays = [
+            pa.array(_get_column(chunk, column_definition), type=field.type)
+            for column_definition, field in zip(column_definitions, schema)
+        ]
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def write_parquet(
+    where: Union[str, IO[bytes]],
+    rows: Sequence[AnyRow],
+    column_definitions: Sequence[GenericColumnDefinition],
+    use_labels: bool = True,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> None:
+    """Write rows to Parquet file writing one row group at a time
+
+    Args:
+        where: path or binary file-like object
+        rows: table rows
+        column_definitions: column definitions of the table
+        use_labels: use column titles as field names, column keys otherwise
+        row_group_size: number of rows in one row group
+
+    Returns:
+
+    """
+    schema = get_arrow_schema(column_definitions, use_labels)
+    with pq.ParquetWriter(where, schema) as writer:
+        for batch in iter_record_batches(rows, column_definitions, schema, row_group_size):
+            writer.write_batch(batch, row_group_size=row_group_size)
+
+
+def read_parquet_content(source: Union[str, IO[bytes]]) -> Iterable[Dict[str, CellContentDict]]:
+    """Read Parquet file as table content one row group at a time
+
+    Args:
+        source: path or binary file-like object
+
+    Returns:
+        Iterable[Dict[str, CellContentDict]]
+    """
+    parquet_file = pq.ParquetFile(source)
+    for batch in parquet_file.iter_batches():
+        for record in batch.to_pylist():
+            row: Dict[str, Any] = {}
+            for column, value in record.items():
+                if value is None:
+                    continue
+                if isinstance(value, list):
+                    row[column] = {'value': ', '.join(value), 'values': value}
+                else:
+                    row[column] = {'value': value}
+            yield row
@@ -5,6 +5,7 @@ from uuid import UUID
 from pydantic import BaseModel, Field, PrivateAttr
 from pydantic.generics import GenericModel
 
+from signals_notebook.attributes import Attribute, AttributeRegistry
 from signals_notebook.common_types import DateTime, EID, EntityType, MaterialType, MID, ObjectType
 from signals_notebook.entities import Entity
 from signals_notebook.entities.entity_store import EntityStore
@@ -49,6 +50,15 @@ class AttributeListColumnDefinition(ColumnDefinition):
     attribute_list_eid: EID = Field(alias='attributeListEid')
     multi_select: bool = Field(alias='multiSelect')
 
+    @property
+    def attribute(self) -> Attribute:
+        """Get Attribute of the column with current options, it is shared through AttributeRegistry
+
+        Returns:
+            Attribute
+        """
+        return AttributeRegistry.get(self.attribute_list_eid)
+
 
 class AutotextListColumnDefinition(ColumnDefinition):
     type: Literal[ColumnDataType.AUTOTEXT_LIST]
@@ -0,0 +1,248 @@
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from uuid import UUID
+
+from pydantic.validators import bool_validator, str_validator
+
+from signals_notebook.common_types import DateTime
+from signals_notebook.entities.tables.cell import ColumnDataType, GenericCell
+from signals_notebook.entities.tables.row import ChangeRowRequest, Row
+
+# values are coerced as cell models do, so compact rows and Row views hold the same values
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    ColumnDataType.NUMBER.value: float,
+    ColumnDataType.UNIT.value: float,
+    ColumnDataType.INTEGER.value: lambda value: int(float(value)),
+    ColumnDataType.DATE_TIME.value: DateTime._validate_date,
+    ColumnDataType.BOOLEAN.value: bool_validator,
+    ColumnDataType.TEXT.value: str_validator,
+    ColumnDataType.LIST.value: str_validator,
+    ColumnDataType.MULTI_SELECT.value: str_validator,
+    ColumnDataType.ATTRIBUTE_LIST.value: str_validator,
+    ColumnDataType.AUTOTEXT_LIST.value: str_validator,
+    ColumnDataType.EXTERNAL_LINK.value: str_validator,
+}
+
+
+class ColumnSchema:
+    """Columns of the table shared by all its compact rows. Columns are only appended."""
+
+    __slots__ = ('keys', 'names', 'types', '_positions')
+
+    def __init__(self) -> None:
+        self.keys: List[UUID] = []
+        self.names: List[str] = []
+        self.types: List[str] = []
+        self._positions: Dict[Union[UUID, str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add_column(self, key: UUID, name: str, _type: str) -> int:
+        """Get position of the column adding it to the schema if needed
+
+        Args:
+            key: column key
+            name: column title
+            _type: column type
+
+        Returns:
+            int position
+        """
+        position = self._positions.get(key)
+        if position is not None:
+            return position
+
+        position = len(self.keys)
+        name = sys.intern(name)
+        self.keys.append(key)
+        self.names.append(name)
+        self.types.append(sys.intern(_type))
+        self._positions[key] = position
+        self._positions.setdefault(name, position)
+        self._positions.setdefault(str(key), position)
+
+        return position
+
+    def get_position(self, index: Union[str, UUID]) -> Optional[int]:
+        """Get position of the column by title or key
+
+        Args:
+            index: column title or key
+
+        Returns:
+            Optional[int]
+        """
+        return self._positions.get(index)
+
+
+class PackedContent:
+    """Cell content which has more than a plain value"""
+
+    __slots__ = ('value', 'values', 'display', 'type')
+
+    def __init__(self, value: Any, values: Optional[List[Any]], display: Optional[str], _type: Optional[str]):
+        self.value = value
+        self.values = values
+        self.display = display
+        self.type = _type
+
+    def dict(self) -> Dict[str, Any]:
+        return {'value': self.value, 'values': self.values, 'display': self.display, 'type': self.type}
+
+
+def _pack_content(content: Dict[str, Any], _type: str) -> Any:
+    value = content.get('value')
+    values = content.get('values')
+    convert = _CONVERTERS.get(_type)
+    if convert:
+        if value is not None:
+            value = convert(value)
+        if values is not None:
+            values = [convert(item) for item in values]
+
+    display = content.get('display')
+    content_type = content.get('type')
+    if values is None and display is None and content_type is None:
+        return value
+
+    return PackedContent(value, values, display, content_type)
+
+
+class CompactRow:
+    """Table row which keeps cell values in a tuple aligned with the table ColumnSchema.
+    Row with pydantic cells is built lazily on first access and used afterwards.
+    """
+
+    __slots__ = ('id', 'schema', 'contents', '_row')
+
+    def __init__(self, row_id: UUID, schema: ColumnSchema, contents: Tuple[Any, ...]):
+        self.id = row_id
+        self.schema = schema
+        self.contents = contents
+        self._row: Optional[Row] = None
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any], schema: ColumnSchema) -> 'CompactRow':
+        """Build compact row from a row of adt response adding unknown columns to schema
+
+        Args:
+            data: attributes of adtRow object
+            schema: column schema of the table
+
+        Returns:
+            CompactRow
+        """
+        cells = data.get('cells', [])
+        positions = [schema.add_column(UUID(cell['key']), cell['name'], cell['type']) for cell in cells]
+
+        contents: List[Any] = [None] * (max(positions) + 1 if positions else 0)
+        for position, cell in zip(positions, cells):
+            contents[position] = _pack_content(cell.get('content') or {}, cell['type'])
+
+        return cls(UUID(data['id']), schema, tuple(contents))
+
+    @property
+    def is_materialized(self) -> bool:
+        """Check if the Row view has been built
+
+        Returns:
+            bool: True/False
+        """
+        return self._row is not None
+
+    @property
+    def row(self) -> Row:
+        """Get Row view of the compact row, it is built once on first access
+
+        Returns:
+            Row
+        """
+        if self._row is None:
+            cells = []
+            for position, content in enumerate(self.contents):
+                if content is None:
+                    continue
+                cells.append(
+                    {
+                        'key': self.schema.keys[position],
+                        'type': self.schema.types[position],
+                        'name': self.schema.names[position],
+                        'content': content.dict() if isinstance(content, PackedContent) else {'value': content},
+                    }
+                )
+            self._row = Row(id=self.id, cells=cells)
+
+        return self._row
+
+    def _get_content(self, index: Union[str, UUID]) -> Any:
+        position = self.schema.get_position(index)
+        if position is None or position >= len(self.contents):
+            return None
+
+        return self.contents[position]
+
+    def get_value(self, index: Union[str, UUID], default: Any = None) -> Any:
+        """Get cell value by column title or key without building Row view
+
+        Args:
+            index: column title or key
+            default: default value if cell doesn't exist
+
+        Returns:
+            Any
+        """
+        if self._row is not None:
+            return self._row.get_value(index, default)
+
+        content = self._get_content(index)
+        if content is None:
+            return default
+
+        if isinstance(content, PackedContent):
+            return content.values or content.value
+
+        return content
+
+    def get_values(self, use_labels: bool = True) -> Dict[str, Any]:
+        """Get row values
+
+        Args:
+            use_labels: use cels names
+
+        Returns:
+            Dict[str, Any]
+        """
+        if self._row is not None:
+            return self._row.get_values(use_labels)
+
+        keys = self.schema.names if use_labels else self.schema.keys
+        values = {}
+        for position, content in enumerate(self.contents):
+            if content is None:
+                continue
+            if isinstance(content, PackedContent):
+                content = content.values or content.value
+            values[keys[position]] = content
+
+        return values
+
+    def get(self, value: Union[str, UUID], default: Any = None) -> Union[GenericCell, Any]:
+        return self.row.get(value, default)
+
+    def __getitem__(self, index: Union[int, str, UUID]) -> GenericCell:
+        return self.row[index]
+
+    def __iter__(self) -> Iterator[GenericCell]:
+        return self.row.__iter__()
+
+    def get_change_request(self) -> Optional[ChangeRowRequest]:
+        """Get ChangeRowRequest of the Row view, unchanged if the view hasn't been built
+
+        Returns:
+            Optional[ChangeRowRequest]
+        """
+        if self._row is None:
+            return None
+
+        return self._row.get_change_request()
@@ -0,0 +1,272 @@
+import abc
+import operator
+from bisect import bisect_left, bisect_right
+from enum import Enum
+from numbers import Number
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Sequence, Tuple, Union
+
+from signals_notebook.entities.tables.compact_row import CompactRow
+from signals_notebook.entities.tables.row import Row
+
+AnyRow = Union[Row, CompactRow]
+
+
+class IndexKind(str, Enum):
+    HASH = 'hash'
+    SORTED = 'sorted'
+
+
+class QueryOperator(str, Enum):
+    EQ = '=='
+    NE = '!='
+    LT = '<'
+    LE = '<='
+    GT = '>'
+    GE = '>='
+    IN = 'in'
+
+
+OPERATORS: Dict[QueryOperator, Callable[[Any, Any], bool]] = {
+    QueryOperator.EQ: operator.eq,
+    QueryOperator.NE: operator.ne,
+    QueryOperator.LT: operator.lt,
+    QueryOperator.LE: operator.le,
+    QueryOperator.GT: operator.gt,
+    QueryOperator.GE: operator.ge,
+    QueryOperator.IN: lambda value, options: value in options,
+}
+
+
+def get_cell_values(row: AnyRow, column: str) -> List[Any]:
+    """Get values of the row cell, a cell with several values (multi select) gives each of them
+
+    Args:
+        row: table row
+        column: column title or key
+
+    Returns:
+        List[Any]
+    """
+    value = row.get_value(column)
+    if isinstance(value, list):
+        return [item for item in value if item is not None]
+
+    return [] if value is None else [value]
+
+
+def compare(op: QueryOperator, cell_value: Any, value: Any) -> bool:
+    """Compare cell value with the query value. Values which cannot be compared do not satisfy the condition.
+
+    Args:
+        op: comparison operator
+        cell_value: value of the cell
+        value: value to compare with
+
+    Returns:
+        bool: True/False
+    """
+    try:
+        return bool(OPERATORS[op](cell_value, value))
+    except TypeError:
+        return False
+
+
+def match(row: AnyRow, column: str, op: QueryOperator, value: Any) -> bool:
+    """Check if the row satisfies the condition without using an index
+
+    Args:
+        row: table row
+        column: column title or key
+        op: comparison operator
+        value: value to compare with
+
+    Returns:
+        bool: True/False
+    """
+    return any(compare(op, cell_value, value) for cell_value in get_cell_values(row, column))
+
+
+def _get_sort_family(value: Any) -> type:
+    # values of one family can be ordered between each other, e.g. int, float and Decimal
+    if isinstance(value, Number):
+        return Number
+    if isinstance(value, str):
+        return str
+
+    return type(value)
+
+
+class ColumnIndex(abc.ABC):
+    """Base class of secondary indexes over a table column. Positions of the rows are stored.
+
+    Indexes give the same rows as a scan: cell values which cannot be compared with the query value
+    do not satisfy the condition.
+    """
+
+    kind: IndexKind
+    operators: Sequence[QueryOperator] = ()
+
+    def __init__(self, column: str):
+        self.column = column
+        self.is_built = False
+
+    @abc.abstractmethod
+    def build(self, rows: Sequence[AnyRow]) -> None:
+        """Build the index over rows
+
+        Args:
+            rows: table rows
+
+        Returns:
+
+        """
+
+    def invalidate(self) -> None:
+        """Mark index as stale, it will be rebuilt on the next lookup
+
+        Returns:
+
+        """
+        self.is_built = False
+
+    def supports(self, op: QueryOperator) -> bool:
+        """Check if the index can answer the operator
+
+        Args:
+            op: comparison operator
+
+        Returns:
+            bool: True/False
+        """
+        return op in self.operators
+
+    @abc.abstractmethod
+    def lookup(self, op: QueryOperator, value: Any) -> Iterable[int]:
+        """Get positions of the rows satisfying the condition
+
+        Args:
+            op: comparison operator
+            value: value to compare with
+
+        Returns:
+            Iterable[int]
+        """
+
+
+class HashColumnIndex(ColumnIndex):
+    kind = IndexKind.HASH
+    operators = (QueryOperator.EQ, QueryOperator.IN)
+
+    def __init__(self, column: str):
+        super().__init__(column)
+        self._positions: Dict[Any, List[int]] = {}
+        self._unhashable: List[Tuple[Any, int]] = []
+
+    def build(self, rows: Sequence[AnyRow]) -> None:
+        self._positions = {}
+        self._unhashable = []
+        for position, row in enumerate(rows):
+            for value in get_cell_values(row, self.column):
+                if isinstance(value, Hashable):
+                    self._positions.setdefault(value, []).append(position)
+                else:
+                    self._unhashable.append((value, position))
+        self.is_built = True
+
+    def _lookup_value(self, value: Any) -> List[int]:
+        positions = [
+            position for cell_value, position in self._unhashable if compare(QueryOperator.EQ, cell_value, value)
+        ]
+        if isinstance(value, Hashable):
+            positions.extend(self._positions.get(value, []))
+        else:
+            positions.extend(
+                position
+                for cell_value, cell_positions in self._positions.items()
+                if compare(QueryOperator.EQ, cell_value, value)
+                for position in cell_positions
+            )
+
+        return positions
+
+    def lookup(self, op: QueryOperator, value: Any) -> Iterable[int]:
+        values = value if op == QueryOperator.IN else [value]
+        positions = set()
+        for item in values:
+            positions.update(self._lookup_value(item))
+
+        return positions
+
+
+class SortedColumnIndex(ColumnIndex):
+    kind = IndexKind.SORTED
+    operators = (
+        QueryOperator.EQ,
+        QueryOperator.IN,
+        QueryOperator.LT,
+        QueryOperator.LE,
+        QueryOperator.GT,
+        QueryOperator.GE,
+    )
+
+    def __init__(self, column: str):
+        super().__init__(column)
+        self._values: Dict[type, List[Any]] = {}
+        self._positions: Dict[type, List[int]] = {}
+        self._unordered: List[Tuple[Any, int]] = []
+
+    def build(self, rows: Sequence[AnyRow]) -> None:
+        # values are sorted within families of mutually comparable types
+        pairs_by_family: Dict[type, List[Tuple[Any, int]]] = {}
+        for position, row in enumerate(rows):
+            for value in get_cell_values(row, self.column):
+                pairs_by_family.setdefault(_get_sort_family(value), []).append((value, position))
+
+        self._values = {}
+        self._positions = {}
+        self._unordered = []
+        for family, pairs in pairs_by_family.items():
+            try:
+                pairs.sort(key=operator.itemgetter(0))
+            except TypeError:
+                self._unordered.extend(pairs)
+                continue
+            self._values[family] = [value for value, _ in pairs]
+            self._positions[family] = [position for _, position in pairs]
+        self.is_built = True
+
+    def _lookup_sorted(self, op: QueryOperator, value: Any) -> List[int]:
+        family = _get_sort_family(value)
+        values = self._values.get(family, [])
+        positions = self._positions.get(family, [])
+        try:
+            if op == QueryOperator.EQ:
+                return positions[bisect_left(values, value):bisect_right(values, value)]
+            if op == QueryOperator.LT:
+                return positions[:bisect_left(values, value)]
+            if op == QueryOperator.LE:
+                return positions[:bisect_right(values, value)]
+            if op == QueryOperator.GT:
+                return positions[bisect_right(values, value):]
+
+            return positions[bisect_left(values, value):]
+        except TypeError:
+            return [position for cell_value, position in zip(values, positions) if compare(op, cell_value, value)]
+
+    def lookup(self, op: QueryOperator, value: Any) -> Iterable[int]:
+        if op == QueryOperator.IN:
+            positions = set()
+            for item in value:
+                positions.update(self.lookup(QueryOperator.EQ, item))
+            return positions
+
+        found = self._lookup_sorted(op, value)
+        found.extend(position for cell_value, position in self._unordered if compare(op, cell_value, value))
+
+        return found
+
+
+INDEX_CLASSES: Dict[IndexKind, Callable[[str], ColumnIndex]] = {
+    IndexKind.HASH: HashColumnIndex,
+    IndexKind.SORTED: SortedColumnIndex,
+}
@@ -95,6 +95,22 @@ class Row(BaseModel):
             log.debug('KeyError were caught. Default value returned')
             return default
 
+    def get_value(self, index: Union[str, UUID], default: Any = None) -> Any:
+        """Get value of one of the GenericCell objects
+
+        Args:
+            index: key or name of the cell
+            default: default value if key doesn't exist
+
+        Returns:
+            Any
+        """
+        cell = self.get(index)
+        if cell is None:
+            return default
+
+        return cell.value
+
     @property
     def is_deleted(self) -> bool:
         """Get is_deleted field
@@ -1,8 +1,10 @@
 import cgi
+import io
 import json
 import logging
 from enum import Enum
-from typing import Any, cast, Dict, List, Literal, Optional, Union
+from types import ModuleType
+from typing import Any, cast, Dict, IO, Iterable, List, Literal, Optional, Tuple, TYPE_CHECKING, Union
 from uuid import UUID
 
 import pandas as pd
@@ -12,13 +14,96 @@ from signals_notebook.api import SignalsNotebookApi
 from signals_notebook.common_types import DataList, EntityType, File, Response, ResponseData
 from signals_notebook.entities import Entity, EntityStore
 from signals_notebook.entities.container import Container
-from signals_notebook.entities.tables.cell import Cell, CellContentDict, ColumnDefinitions, GenericColumnDefinition
-from signals_notebook.entities.tables.row import ChangeRowRequest, Row
+from signals_notebook.entities.tables.cell import (
+    Cell,
+    CellContentDict,
+    ColumnDataType,
+    ColumnDefinitions,
+    GenericColumnDefinition,
+    UpdateCellRequest,
+)
+from signals_notebook.entities.tables.compact_row import ColumnSchema, CompactRow
+from signals_notebook.entities.tables.index import ColumnIndex, INDEX_CLASSES, IndexKind, match, QueryOperator
+from signals_notebook.entities.tables.row import (
+    ChangeRowRequest,
+    CreateRowActionBody,
+    CreateRowRequest,
+    DeleteRowRequest,
+    Row,
+    UpdateRowActionBody,
+    UpdateRowRequest,
+)
 from signals_notebook.jinja_env import env
 from signals_notebook.utils import FSHandler
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 log = logging.getLogger(__name__)
 
+MAX_ROW_REQUESTS_PER_PATCH = 1000
+
+
+def _import_arrow() -> ModuleType:
+    try:
+        from signals_notebook.entities.tables import arrow
+    except ImportError as e:
+        raise ImportError('pyarrow is required for Arrow/Parquet support: pip install pesn-sdk[parquet]') from e
+
+    return arrow
+
+
+def _to_comparable_numbers(values: pd.Series) -> pd.Series:
+    numbers = pd.to_numeric(values, errors='coerce')
+    # values which are not numbers are compared as strings
+    return numbers.astype(object).where(numbers.notna(), values.astype(str))
+
+
+def _to_comparable_datetimes(values: pd.Series) -> pd.Series:
+    timestamps = pd.to_datetime(values, errors='coerce', utc=True, format='mixed')
+    # naive datetimes are treated as UTC, values which are not datetimes are compared as strings
+    return timestamps.astype(object).where(timestamps.notna(), values.astype(str))
+
+
+def _to_comparable_list(value: Any) -> Any:
+    values = value if isinstance(value, (list, tuple)) else [value]
+    return tuple(str(item) for item in values)
+
+
+def _to_comparable_lists(values: pd.Series) -> pd.Series:
+    return values.map(_to_comparable_list, na_action='ignore')
+
+
+def _to_comparable_strings(values: pd.Series) -> pd.Series:
+    return values.astype(str)
+
+
+_COMPARABLE_CONVERTERS = {
+    ColumnDataType.NUMBER: _to_comparable_numbers,
+    ColumnDataType.INTEGER: _to_comparable_numbers,
+    ColumnDataType.UNIT: _to_comparable_numbers,
+    ColumnDataType.DATE_TIME: _to_comparable_datetimes,
+    ColumnDataType.LIST: _to_comparable_lists,
+    ColumnDataType.MULTI_SELECT: _to_comparable_lists,
+    ColumnDataType.ATTRIBUTE_LIST: _to_comparable_lists,
+}
+
+
+def _to_comparable(values: pd.Series, column_type: ColumnDataType) -> pd.Series:
+    # cells and data frames hold values of different types, e.g. lists, datetimes and strings, int and float
+    converter = _COMPARABLE_CONVERTERS.get(column_type, _to_comparable_strings)
+    return converter(values.astype(object))
+
+
+def _get_changed(old_values: pd.Series, new_values: pd.Series, column_type: ColumnDataType) -> pd.Series:
+    old_comparable = _to_comparable(old_values, column_type)
+    new_comparable = _to_comparable(new_values, column_type)
+    return new_values.notna() & (old_values.isna() | old_comparable.ne(new_comparable))
+
+
+def _to_comparable_index(values: pd.Series, column_type: ColumnDataType) -> pd.Index:
+    return pd.Index(_to_comparable(values, column_type), name=values.name, dtype=object, tupleize_cols=False)
+
 
 class TableDataResponse(Response[Row]):
     pass
@@ -36,10 +121,14 @@ class Table(Entity):
     class ContentType(str, Enum):
         JSON = 'application/json'
         CSV = 'text/csv'
+        PARQUET = 'application/vnd.apache.parquet'
 
     type: Literal[EntityType.GRID] = Field(allow_mutation=False)
-    _rows: List[Row] = PrivateAttr(default=[])
-    _rows_by_id: Dict[UUID, Row] = PrivateAttr(default={})
+    _rows: List[Union[Row, CompactRow]] = PrivateAttr(default=[])
+    _rows_by_id: Dict[UUID, Union[Row, CompactRow]] = PrivateAttr(default={})
+    _indexes: Dict[str, ColumnIndex] = PrivateAttr(default={})
+    _compact_rows: bool = PrivateAttr(default=False)
+    _column_schema: ColumnSchema = PrivateAttr(default_factory=ColumnSchema)
     _template_name = 'table.html'
 
     @classmethod
@@ -62,18 +151,123 @@ class Table(Entity):
             },
         )
 
-        result = TableDataResponse(**response.json())
-
         self._rows = []
         self._rows_by_id = {}
-        for item in result.data:
-            row = cast(Row, cast(ResponseData, item).body)
+        if self._compact_rows:
+            self._column_schema = ColumnSchema()
+            rows: List[Union[Row, CompactRow]] = [
+                CompactRow.from_json(item['attributes'], self._column_schema) for item in response.json()['data']
+            ]
+        else:
+            result = TableDataResponse(**response.json())
+            rows = [cast(Row, cast(ResponseData, item).body) for item in result.data]
+
+        for row in rows:
             assert row.id
 
             self._rows.append(row)
             self._rows_by_id[row.id] = row
+        self._invalidate_indexes()
         log.debug('Data in Table: %s were reloaded', self.eid)
 
+    def use_compact_rows(self, enabled: bool = True) -> None:
+        """Keep rows in compact form: cell values are stored in tuples sharing one column schema
+        and Row objects are built lazily when rows are accessed by index or iteration.
+        Loaded rows are dropped and reloaded on next access.
+
+        Args:
+            enabled: use compact rows
+
+        Returns:
+
+        """
+        self._compact_rows = enabled
+        self._rows = []
+        self._rows_by_id = {}
+        self._invalidate_indexes()
+
+    @staticmethod
+    def _as_row(row: Union[Row, CompactRow]) -> Row:
+        return row.row if isinstance(row, CompactRow) else row
+
+    def _invalidate_indexes(self) -> None:
+        for index in self._indexes.values():
+            index.invalidate()
+
+    def create_index(self, column: str, kind: Union[str, IndexKind] = IndexKind.HASH) -> None:
+        """Create secondary index over column values used by query and where
+
+        Hash index answers "==" and "in" conditions, sorted index answers range conditions as well.
+        Indexes are rebuilt lazily after the table data is reloaded, saved or a row is added.
+
+        Args:
+            column: column title or key
+            kind: index kind (hash or sorted)
+
+        Returns:
+
+        """
+        self._indexes[column] = INDEX_CLASSES[IndexKind(kind)](column)
+        log.debug('%s index over column: %s was created in Table: %s', kind, column, self.eid)
+
+    def drop_index(self, column: str) -> None:
+        """Drop secondary index over column values
+
+        Args:
+            column: column title or key
+
+        Returns:
+
+        """
+        self._indexes.pop(column, None)
+
+    def _find_positions(self, column: str, op: QueryOperator, value: Any) -> Iterable[int]:
+        index = self._indexes.get(column)
+        if index and index.supports(op):
+            if not index.is_built:
+                index.build(self._rows)
+            return index.lookup(op, value)
+
+        return (position for position, row in enumerate(self._rows) if match(row, column, op, value))
+
+    def query(self, *conditions: Tuple[str, Union[str, QueryOperator], Any]) -> List[Row]:
+        """Get rows satisfying all conditions. Indexes created by create_index are used when possible.
+
+        Args:
+            conditions: (column, operator, value) tuples, operator is one of
+                "==", "!=", "<", "<=", ">", ">=", "in"
+
+        Returns:
+            List[Row] in table order
+        """
+        if not self._rows:
+            self._reload_data()
+
+        positions: Optional[set] = None
+        for column, op, value in conditions:
+            found = set(self._find_positions(column, QueryOperator(op), value))
+            positions = found if positions is None else positions & found
+            if not positions:
+                return []
+
+        if positions is None:
+            return [self._as_row(row) for row in self._rows]
+
+        return [self._as_row(self._rows[position]) for position in sorted(positions)]
+
+    def where(self, column: str, op: Union[str, QueryOperator], value: Any) -> List[Row]:
+        """Get rows satisfying the condition
+
+        Args:
+            column: column title or key
+            op: one of "==", "!=", "<", "<=", ">", ">=", "in"
+            value: value to compare with
+
+        Returns:
+            List[Row] in table order
+        """
+        return self.query((column, op, value))
+
     def get_column_definitions_list(self) -> List[GenericColumnDefinition]:
         """Fetch column definitions
 
@@ -146,13 +340,13 @@ class Table(Entity):
             self._reload_data()
 
         if isinstance(index, int):
-            return self._rows[index]
+            return self._as_row(self._rows[index])
 
         if isinstance(index, str):
-            return self._rows_by_id[UUID(index)]
+            return self._as_row(self._rows_by_id[UUID(index)])
 
         if isinstance(index, UUID):
-            return self._rows_by_id[index]
+            return self._as_row(self._rows_by_id[index])
 
         raise IndexError('Invalid index')
 
@@ -160,6 +354,9 @@ class Table(Entity):
         if not self._rows:
             self._reload_data()
 
+        if self._compact_rows:
+            return (self._as_row(row) for row in self._rows)
+
         return self._rows.__iter__()
 
     def delete_row_by_id(self, row_id: Union[str, UUID], digest: Optional[str] = None, force: bool = True) -> None:
@@ -194,6 +391,67 @@ class Table(Entity):
         log.debug('Row %s was deleted', row_id)
         self._reload_data()
 
+    def delete_rows(
+        self,
+        row_ids: Iterable[Union[str, UUID]],
+        digest: Optional[str] = None,
+        force: bool = True,
+        reload: bool = True,
+    ) -> None:
+        """Delete several rows using batched PATCH requests
+
+        Args:
+            row_ids: ids of the rows
+            digest: Indicate digest of entity. It is used to avoid conflict while concurrent editing.
+            If the parameter 'force' is true, this parameter is optional.
+            If the parameter 'force' is false, this parameter is required.
+            force: Force to update properties without digest check.
+            Without force, at most MAX_ROW_REQUESTS_PER_PATCH rows can be changed, otherwise ValueError is raised.
+            reload: Reload table data once all rows are deleted. If False, deleted rows are
+            removed from the local data instead.
+
+        Returns:
+
+        """
+        _row_ids = [row_id if isinstance(row_id, UUID) else UUID(row_id) for row_id in row_ids]
+        if not _row_ids:
+            return
+
+        self._patch_rows([DeleteRowRequest(id=row_id) for row_id in _row_ids], digest=digest, force=force)
+        log.debug('%s rows were deleted from Table: %s', len(_row_ids), self.eid)
+
+        if reload:
+            self._reload_data()
+            return
+
+        deleted_ids = set(_row_ids)
+        self._rows = [row for row in self._rows if row.id not in deleted_ids]
+        for row_id in deleted_ids:
+            self._rows_by_id.pop(row_id, None)
+        self._invalidate_indexes()
+
+    def _patch_rows(self, row_requests: List[ChangeRowRequest], digest: Optional[str], force: bool) -> None:
+        if not force and len(row_requests) > MAX_ROW_REQUESTS_PER_PATCH:
+            # each chunk changes the table digest, so concurrent edits could be detected only by the first one
+            raise ValueError(
+                f'Digest can be checked for at most {MAX_ROW_REQUESTS_PER_PATCH} row changes, '
+                f'{len(row_requests)} changes require force=True'
+            )
+
+        api = SignalsNotebookApi.get_default_api()
+
+        for i in range(0, len(row_requests), MAX_ROW_REQUESTS_PER_PATCH):
+            request = ChangeTableDataRequest(data=row_requests[i:i + MAX_ROW_REQUESTS_PER_PATCH])
+            api.call(
+                method='PATCH',
+                path=(self._get_adt_endpoint(), self.eid),
+                params={
+                    'digest': digest,
+                    'force': json.dumps(force),
+                },
+                data=request.json(exclude_none=True, by_alias=True),
+            )
+
     def add_row(self, data: Dict[str, CellContentDict]) -> None:
         """Add row in the table
 
@@ -222,6 +480,7 @@ class Table(Entity):
 
         row = Row(cells=prepared_data)
         self._rows.append(row)
+        self._invalidate_indexes()
         log.debug('Row: %s was added to Table', row)
 
     def save(self, force: bool = True) -> None:
@@ -229,11 +488,13 @@ class Table(Entity):
 
         Args:
             force: Force to update properties without digest check.
+            Without force, at most MAX_ROW_REQUESTS_PER_PATCH rows can be changed, otherwise ValueError is raised.
 
         Returns:
 
         """
         super().save(force)
+        self._invalidate_indexes()
 
         row_requests: List[ChangeRowRequest] = []
         for row in self._rows:
@@ -244,19 +505,142 @@ class Table(Entity):
         if not row_requests:
             return
 
-        request = ChangeTableDataRequest(data=row_requests)
-        api = SignalsNotebookApi.get_default_api()
+        self._patch_rows(row_requests, digest=None if force else self.digest, force=force)
 
-        api.call(
-            method='PATCH',
-            path=(self._get_adt_endpoint(), self.eid),
-            params={
-                'digest': None if force else self.digest,
-                'force': json.dumps(force),
-            },
-            data=request.json(exclude_none=True, by_alias=True),
-        )
+        self._reload_data()
 
+    @staticmethod
+    def _prepare_cell_content(value: Any) -> Dict[str, Any]:
+        if isinstance(value, (list, tuple)):
+            return {'value': ', '.join(str(item) for item in value), 'values': list(value)}
+
+        return {'value': value}
+
+    @staticmethod
+    def _is_empty(value: Any) -> bool:
+        return not isinstance(value, (list, tuple)) and pd.isna(value)
+
+    def _get_keyed_dataframe(self, key_column: str, columns: List[str], key_type: ColumnDataType) -> pd.DataFrame:
+        data = [row.get_values(use_labels=True) for row in self._rows]
+        current = pd.DataFrame(data=data, index=[row.id for row in self._rows], columns=[key_column, *columns])
+        current = current[current[key_column].notna()].reset_index(names='_row_id')
+        # keys of the table and of the data frame are matched by values converted to the key column type
+        current.index = _to_comparable_index(current.pop(key_column), key_type)
+        if current.index.duplicated().any():
+            raise ValueError(f'Key column {key_column} of the table contains duplicated values')
+
+        return current
+
+    def _get_update_row_requests(
+        self,
+        current: pd.DataFrame,
+        target: pd.DataFrame,
+        column_definitions_map: Dict[str, GenericColumnDefinition],
+    ) -> List[ChangeRowRequest]:
+        common_keys = target.index.intersection(current.index)
+        old_values = current.loc[common_keys, target.columns]
+        new_values = target.loc[common_keys]
+
+        changed_cells = {
+            column: _get_changed(old_values[column], new_values[column], column_definitions_map[column].type)
+            for column in target.columns
+        }
+        changed = pd.DataFrame(changed_cells, index=common_keys, columns=target.columns).to_numpy(dtype=bool)
+
+        row_requests: List[ChangeRowRequest] = []
+        for i in changed.any(axis=1).nonzero()[0]:
+            cells = [
+                UpdateCellRequest(
+                    key=column_definitions_map[column].key,
+                    content=self._prepare_cell_content(new_values.iat[i, j]),
+                )
+                for j, column in enumerate(target.columns)
+                if changed[i, j]
+            ]
+            row_id = current.at[common_keys[i], '_row_id']
+            row_requests.append(UpdateRowRequest(id=row_id, attributes=UpdateRowActionBody(cells=cells)))
+
+        return row_requests
+
+    def _get_create_row_requests(
+        self,
+        current: pd.DataFrame,
+        target: pd.DataFrame,
+        keys: pd.Series,
+        column_definitions_map: Dict[str, GenericColumnDefinition],
+    ) -> List[ChangeRowRequest]:
+        key_definition = column_definitions_map[str(target.index.name)]
+
+        row_requests: List[ChangeRowRequest] = []
+        for key, values in target.loc[target.index.difference(current.index, sort=False)].iterrows():
+            cells = [UpdateCellRequest(key=key_definition.key, content=self._prepare_cell_content(keys[key]))]
+            for column, value in values.items():
+                if not self._is_empty(value):
+                    cells.append(
+                        UpdateCellRequest(
+                            key=column_definitions_map[str(column)].key,
+                            content=self._prepare_cell_content(value),
+                        )
+                    )
+            row_requests.append(CreateRowRequest(attributes=CreateRowActionBody(cells=cells)))
+
+        return row_requests
+
+    def update_from_dataframe(
+        self,
+        df: pd.DataFrame,
+        key_column: str,
+        delete_missing: bool = True,
+        force: bool = True,
+    ) -> None:
+        """Synchronize the table with a data frame sending only the differences
+
+        Rows are matched by the value of key_column. Rows missing in the table are created,
+        changed cells are updated and, if delete_missing is set, rows absent from the data frame
+        are deleted. Empty values in the data frame are not pushed to the table.
+
+        Args:
+            df: data frame which columns are column titles of the table
+            key_column: title of the column which identifies rows
+            delete_missing: delete table rows which keys are absent from the data frame
+            force: Force to update properties without digest check.
+            Without force, at most MAX_ROW_REQUESTS_PER_PATCH rows can be changed, otherwise ValueError is raised.
+
+        Returns:
+
+        """
+        column_definitions_map = self.get_column_definitions_map()
+        if key_column not in df.columns or key_column not in column_definitions_map:
+            raise ValueError(f'Key column {key_column} must be present in data frame and table')
+        if df[key_column].isna().any() or df[key_column].duplicated().any():
+            raise ValueError(f'Key column {key_column} must contain unique non-empty values')
+
+        value_columns = [
+            str(column) for column in df.columns if column != key_column and column in column_definitions_map
+        ]
+        key_type = column_definitions_map[key_column].type
+        target = df[value_columns].astype(object)
+        target.index = _to_comparable_index(df[key_column], key_type)
+        if target.index.duplicated().any():
+            raise ValueError(f'Key column {key_column} must contain unique non-empty values')
+        keys = pd.Series(df[key_column].to_numpy(), index=target.index)
+
+        self._reload_data()
+        current = self._get_keyed_dataframe(key_column, value_columns, key_type)
+
+        row_requests = [
+            *self._get_update_row_requests(current, target, column_definitions_map),
+            *self._get_create_row_requests(current, target, keys, column_definitions_map),
+        ]
+        if delete_missing:
+            for row_id in current.loc[current.index.difference(target.index, sort=False), '_row_id']:
+                row_requests.append(DeleteRowRequest(id=row_id))
+
+        log.debug('Table: %s will be synchronized with %s row requests', self.eid, len(row_requests))
+        if not row_requests:
+            return
+
+        self._patch_rows(row_requests, digest=None if force else self.digest, force=force)
         self._reload_data()
 
     def get(self, value: Union[str, UUID], default: Any = None) -> Union[Row, Any]:
@@ -297,6 +681,10 @@ class Table(Entity):
                 content=json.dumps({'data': rows}, default=str).encode('utf-8'),
                 content_type=content_type,
             )
+        if content_type == self.ContentType.PARQUET.value:
+            buffer = io.BytesIO()
+            self.to_parquet(buffer)
+            return File(name=f'{self.name}.parquet', content=buffer.getvalue(), content_type=content_type)
 
         api = SignalsNotebookApi.get_default_api()
         log.debug('Get content for: %s| %s', self.__class__.__name__, self.eid)
@@ -318,6 +706,83 @@ class Table(Entity):
             content_type=response.headers.get('content-type'),
         )
 
+    def to_arrow(self, use_labels: bool = True) -> 'pa.Table':
+        """Get as Apache Arrow table with typed columns built from column definitions.
+        Requires pyarrow to be installed.
+
+        Args:
+            use_labels: use column titles as field names, column keys otherwise
+
+        Returns:
+            pyarrow.Table
+        """
+        arrow = _import_arrow()
+        if not self._rows:
+            self._reload_data()
+
+        column_definitions = self.get_column_definitions_list()
+        schema = arrow.get_arrow_schema(column_definitions, use_labels)
+        batches = list(arrow.iter_record_batches(self._rows, column_definitions, schema))
+
+        return arrow.pa.Table.from_batches(batches, schema=schema)
+
+    def to_parquet(
+        self,
+        path: Union[str, IO[bytes]],
+        use_labels: bool = True,
+        row_group_size: Optional[int] = None,
+    ) -> None:
+        """Write table to Parquet file one row group at a time. Requires pyarrow to be installed.
+
+        Args:
+            path: path or binary file-like object
+            use_labels: use column titles as field names, column keys otherwise
+            row_group_size: number of rows in one row group
+
+        Returns:
+
+        """
+        arrow = _import_arrow()
+        if not self._rows:
+            self._reload_data()
+
+        arrow.write_parquet(
+            path,
+            self._rows,
+            self.get_column_definitions_list(),
+            use_labels=use_labels,
+            row_group_size=row_group_size or arrow.DEFAULT_ROW_GROUP_SIZE,
+        )
+        log.debug('Table: %s was written to Parquet', self.eid)
+
+    @classmethod
+    def create_from_parquet(
+        cls,
+        *,
+        container: Container,
+        name: str,
+        path: Union[str, IO[bytes]],
+        template: Optional[str] = None,
+        force: bool = True,
+    ) -> Entity:
+        """Create Table Entity from Parquet file which columns are column titles of the table.
+        Requires pyarrow to be installed.
+
+        Args:
+            container: Container where create new Table
+            name: file name
+            path: path or binary file-like object
+            template: template for table creation
+            force: Force to post attachment
+
+        Returns:
+            Table
+        """
+        arrow = _import_arrow()
+        content = list(arrow.read_parquet_content(path))
+
+        return cls.create(container=container, name=name, content=content, template=template, force=force)
+
     @classmethod
     def create(
         cls,
@@ -383,6 +848,39 @@ class Table(Entity):
             force=force,
         )
 
+    @classmethod
+    def from_dataframe(
+        cls,
+        *,
+        container: Container,
+        name: str,
+        df: pd.DataFrame,
+        template: Optional[str] = None,
+        force: bool = True,
+    ) -> Entity:
+        """Create Table Entity from data frame
+
+        Args:
+            container: Container where create new Table
+            name: file name
+            df: data frame which columns are column titles of the table
+            template: template for table creation
+            force: Force to post attachment
+
+        Returns:
+            Table
+        """
+        content: List[Dict[str, CellContentDict]] = [
+            {
+                str(column): cast(CellContentDict, cls._prepare_cell_content(value))
+                for column, value in row.items()
+                if not cls._is_empty(value)
+            }
+            for row in df.astype(object).to_dict(orient='records')
+        ]
+
+        return cls.create(container=container, name=name, content=content, template=template, force=force)
+
     def get_html(self) -> str:
         """Get in HTML format
 
@@ -412,20 +910,27 @@ class Table(Entity):
 
         return template.render(name=self.name, table_head=table_head, rows=rows)
 
-    def dump(self, base_path: str, fs_handler: FSHandler, alias: Optional[List[str]] = None) -> None:
+    def dump(
+        self,
+        base_path: str,
+        fs_handler: FSHandler,
+        alias: Optional[List[str]] = None,
+        content_type: str = ContentType.JSON.value,
+    ) -> None:
         """Dump Table entity
 
         Args:
             base_path: content path where create dump
             fs_handler: FSHandler
             alias: Backup alias
+            content_type: content format, JSON or Parquet
 
         Returns:
 
         """
         log.debug('Dumping table: %s with name: %s...', self.eid, self.name)
 
-        content = self.get_content(content_type=self.ContentType.JSON)
+        content = self.get_content(content_type=content_type)
         column_definitions = self.get_column_definitions_list()
 
         metadata = {
@@ -469,8 +974,10 @@ class Table(Entity):
         metadata = json.loads(fs_handler.read(metadata_path))
         content_path = fs_handler.join_path(path, metadata['file_name'])
         content_bytes = fs_handler.read(content_path)
-        content = json.loads(content_bytes)
-        rows = content['data']
+        if metadata.get('content_type') == cls.ContentType.PARQUET:
+            rows = list(_import_arrow().read_parquet_content(io.BytesIO(content_bytes)))
+        else:
+            rows = json.loads(content_bytes)['data']
         column_definitions = metadata.get('columns')
         templates = EntityStore.get_list(
             include_types=[EntityType.GRID], include_options=[EntityStore.IncludeOptions.TEMPLATE]
@@ -2,3 +2,7 @@ from signals_notebook.materials.material_store import MaterialStore  # noqa
 from signals_notebook.materials.library import Library  # noqa
 from signals_notebook.materials.asset import Asset  # noqa
 from signals_notebook.materials.batch import Batch  # noqa
+from signals_notebook.materials.library_registry import LibraryRegistry  # noqa
+from signals_notebook.materials.material_index import MaterialIndex  # noqa
+from signals_notebook.materials.media_downloader import MaterialMedia, MediaDownloadReport  # noqa
+from signals_notebook.materials.bulk_export import BulkExportManager, ExportJob, ExportJobStatus  # noqa
@@ -1,17 +1,53 @@
-from typing import Any, Literal
+import logging
+from typing import cast, Generator, List, Literal, Optional, Sequence, TYPE_CHECKING, Union
 
 from pydantic import Field
 
-from signals_notebook.common_types import MaterialType
-from signals_notebook.materials.field import FieldContainer
+from signals_notebook.api import SignalsNotebookApi
+from signals_notebook.common_types import MaterialType, Response, ResponseData
+from signals_notebook.materials.field import GenericFieldDefinition
 from signals_notebook.materials.material import Material
 
+if TYPE_CHECKING:
+    from signals_notebook.materials.library import Library
+
+log = logging.getLogger(__name__)
+
 
 class Batch(Material):
     type: Literal[MaterialType.BATCH] = Field(allow_mutation=False, default=MaterialType.BATCH)
 
-    def __init__(self, **data: Any):
-        fields = data.pop('fields', {})
-        super().__init__(**data)
+    def _get_field_definitions(self) -> List[GenericFieldDefinition]:
+        return self.library.batch_config.fields
+
+
+class BatchListResponse(Response[Batch]):
+    pass
+
+
+def iter_batch_pages(library: 'Library', path: Sequence[str]) -> Generator[Batch, None, None]:
+    """Fetch batches page by page following links.next, next page is requested when previous one is consumed.
+    Fields of batches are parsed on first access.
+
+    Args:
+        library: library of batches
+        path: path of the first page
+
+    Returns:
+        Batch generator
+    """
+    api = SignalsNotebookApi.get_default_api()
+    next_path: Optional[Union[str, Sequence[str]]] = path
+
+    while next_path:
+        log.debug('Get page of Batches: %s', next_path)
+        response = api.call(
+            method='GET',
+            path=next_path,
+        )
+
+        result = BatchListResponse(_context={'_library': library}, **response.json())
+        items = result.data if isinstance(result.data, list) else [result.data]
+        yield from (cast(ResponseData, item).body for item in items)
 
-        self._material_fields = FieldContainer(self, self.library.batch_config.fields, **fields)
+        next_path = result.links.next if result.links and result.links.next else None
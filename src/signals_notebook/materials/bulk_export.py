@@ -0,0 +1,262 @@
+import cgi
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from enum import Enum
+from typing import Dict, Iterable, List, Optional
+
+from signals_notebook.exceptions import BulkExportJobAlreadyRunningError
+from signals_notebook.materials.library import EXPORT_ERROR_LIBRARY_EMPTY, Library
+from signals_notebook.utils.fs_handler import FSHandler, write_chunks
+
+log = logging.getLogger(__name__)
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class ExportJobStatus(str, Enum):
+    QUEUED = 'QUEUED'
+    RUNNING = 'RUNNING'
+    DOWNLOADING = 'DOWNLOADING'
+    COMPLETED = 'COMPLETED'
+    FAILED = 'FAILED'
+
+
+class ExportJob:
+    """Bulk export of one library tracked by BulkExportManager"""
+
+    def __init__(self, library: Library):
+        self.library = library
+        self.status = ExportJobStatus.QUEUED
+        self.file_id: Optional[str] = None
+        self.report_id: Optional[str] = None
+        self.path: Optional[str] = None
+        self.error: Optional[Exception] = None
+        self.queued_at: Optional[float] = None
+        self.started_at: Optional[float] = None
+        self.interval = 0.0
+        self.next_check_at = 0.0
+
+    @property
+    def is_done(self) -> bool:
+        """Check if the job is completed or failed
+
+        Returns:
+            bool: True/False
+        """
+        return self.status in (ExportJobStatus.COMPLETED, ExportJobStatus.FAILED)
+
+    def _fail(self, error: Exception) -> None:
+        log.debug('Bulk export of %s has failed: %s', self.library.eid, error)
+        self.status = ExportJobStatus.FAILED
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} library={self.library.name} status={self.status.value}>'
+
+
+class BulkExportManager:
+    """Export content of many libraries to files written with FSHandler.
+
+    All jobs are driven by one scheduler loop: export reports are polled with exponentially growing intervals,
+    every ready file is downloaded and written in a background thread while other jobs keep being polled.
+    Files are prefixed with asset type id of the library, so libraries exported under the same name
+    do not overwrite each other.
+    Server processes one bulk export at a time, so a library rejected with BulkExportJobAlreadyRunningError
+    stays queued and is submitted again later.
+    """
+
+    def __init__(
+        self,
+        fs_handler: FSHandler,
+        base_path: str = 'exports',
+        timeout: float = 600,
+        min_period: float = 1,
+        max_period: float = 30,
+        backoff: float = 2,
+        download_concurrency: int = 4,
+    ):
+        """
+        Args:
+            fs_handler: FSHandler where exported files are written
+            base_path: path where exported files are written
+            timeout: max available time(seconds) to export one library since its job is started
+            min_period: first interval(seconds) between api calls for a job
+            max_period: max interval(seconds) between api calls for a job
+            backoff: multiplier of the interval after each unsuccessful check
+            download_concurrency: max number of simultaneous downloads
+        """
+        self.fs_handler = fs_handler
+        self.base_path = base_path
+        self.timeout = timeout
+        self.min_period = min_period
+        self.max_period = max_period
+        self.backoff = backoff
+        self.download_concurrency = download_concurrency
+        self._jobs: List[ExportJob] = []
+
+    @property
+    def jobs(self) -> List[ExportJob]:
+        """Get all submitted jobs
+
+        Returns:
+            list of ExportJob objects
+        """
+        return list(self._jobs)
+
+    def submit(self, library: Library) -> ExportJob:
+        """Add library to the export queue
+
+        Args:
+            library: Library object
+
+        Returns:
+            ExportJob
+        """
+        job = ExportJob(library)
+        self._jobs.append(job)
+        log.debug('Bulk export of %s is queued', library.eid)
+
+        return job
+
+    def export(self, libraries: Iterable[Library]) -> List[ExportJob]:
+        """Export content of libraries and wait for all of them
+
+        Args:
+            libraries: Library objects
+
+        Returns:
+            list of ExportJob objects in order of libraries
+        """
+        jobs = [self.submit(library) for library in libraries]
+        self.run()
+
+        return jobs
+
+    def _schedule(self, job: ExportJob, now: float) -> None:
+        job.next_check_at = now + job.interval
+        job.interval = min(job.interval * self.backoff, self.max_period)
+
+    def _wake_queued_jobs(self, now: float) -> None:
+        for job in self._jobs:
+            if job.status == ExportJobStatus.QUEUED:
+                job.queued_at = now
+                job.interval = 0
+                job.next_check_at = now
+
+    def _start_queued_jobs(self, now: float) -> None:
+        for job in self._jobs:
+            if job.status != ExportJobStatus.QUEUED or job.next_check_at > now:
+                continue
+            if job.queued_at is None:
+                job.queued_at = now
+            try:
+                job.file_id, job.report_id = job.library._start_export()
+            except BulkExportJobAlreadyRunningError as e:
+                if now - job.queued_at >= self.timeout:
+                    job._fail(e)
+                    continue
+                log.debug('Bulk export of %s is postponed, another job is running', job.library.eid)
+                job.interval = max(job.interval, self.min_period)
+                self._schedule(job, now)
+                return
+            except Exception as e:
+                job._fail(e)
+                continue
+
+            log.debug('Bulk export of %s is started', job.library.eid)
+            job.status = ExportJobStatus.RUNNING
+            job.started_at = now
+            job.interval = self.min_period
+            self._schedule(job, now)
+
+    def _check_running_job(self, job: ExportJob, now: float) -> bool:
+        assert job.report_id is not None and job.started_at is not None
+
+        result = job.library._is_file_ready(job.report_id)
+        if result['error'] == EXPORT_ERROR_LIBRARY_EMPTY:
+            job._fail(FileNotFoundError('Library is empty'))
+        elif result['success'] and not result['error']:
+            job.status = ExportJobStatus.DOWNLOADING
+            return True
+        elif now - job.started_at >= self.timeout:
+            job._fail(TimeoutError('Time is over to get file'))
+        else:
+            self._schedule(job, now)
+
+        return False
+
+    def _download(self, job: ExportJob) -> str:
+        assert job.file_id is not None
+
+        response = job.library._download_file(job.file_id, stream=True)
+        try:
+            _, params = cgi.parse_header(response.headers.get('content-disposition', ''))
+            file_name = params.get('filename') or job.library.name
+            path = self.fs_handler.join_path(self.base_path, f'{job.library.asset_type_id}_{file_name}')
+
+            write_chunks(self.fs_handler, path, response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE))
+        finally:
+            response.close()
+        log.debug('Content of %s is saved to %s', job.library.eid, path)
+
+        return path
+
+    def _finish_downloads(self, downloads: Dict[Future, ExportJob]) -> None:
+        for future in [future for future in downloads if future.done()]:
+            job = downloads.pop(future)
+            try:
+                job.path = future.result()
+                job.status = ExportJobStatus.COMPLETED
+            except Exception as e:
+                job._fail(e)
+
+    def _poll(self, executor: ThreadPoolExecutor, downloads: Dict[Future, ExportJob]) -> None:
+        now = time.monotonic()
+        self._start_queued_jobs(now)
+
+        for job in self._jobs:
+            if job.status != ExportJobStatus.RUNNING or job.next_check_at > now:
+                continue
+            try:
+                is_ready = self._check_running_job(job, now)
+            except Exception as e:
+                job._fail(e)
+                is_ready = False
+            if is_ready:
+                downloads[executor.submit(self._download, job)] = job
+            if job.status != ExportJobStatus.RUNNING:
+                # export slot on the server is free, queued jobs are tried without waiting
+                self._wake_queued_jobs(now)
+                self._start_queued_jobs(now)
+
+    def _wait(self, downloads: Dict[Future, ExportJob]) -> None:
+        pending = [
+            job.next_check_at for job in self._jobs if job.status in (ExportJobStatus.QUEUED, ExportJobStatus.RUNNING)
+        ]
+        delay = max(min(pending) - time.monotonic(), 0) if pending else None
+
+        if downloads:
+            wait(list(downloads), timeout=delay, return_when=FIRST_COMPLETED)
+            self._finish_downloads(downloads)
+        elif delay:
+            time.sleep(delay)
+
+    def run(self) -> List[ExportJob]:
+        """Process submitted jobs until all of them are completed or failed
+
+        Returns:
+            list of ExportJob objects
+        """
+        downloads: Dict[Future, ExportJob] = {}
+
+        with ThreadPoolExecutor(max_workers=self.download_concurrency) as executor:
+            while not all(job.is_done for job in self._jobs):
+                self._poll(executor, downloads)
+                self._wait(downloads)
+
+        log.debug(
+            'Bulk export is finished, failed jobs: %s', sum(job.status == ExportJobStatus.FAILED for job in self._jobs)
+        )
+
+        return self.jobs
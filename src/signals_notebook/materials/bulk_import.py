@@ -0,0 +1,156 @@
+import io
+import json
+import logging
+import os
+import zipfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from signals_notebook.common_types import File
+
+log = logging.getLogger(__name__)
+
+SDF_RECORD_END = b'$$$$'
+SDF_EXTENSIONS = ('.sdf', '.sd')
+CSV_EXTENSIONS = ('.csv',)
+ZIP_CONTENT_TYPE = 'application/zip'
+
+ImportChunk = Union[File, List[Dict[str, Any]]]
+
+
+def iter_json_chunks(items: Iterable[Dict[str, Any]], max_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Split request items of json import into chunks which fit into one request
+
+    Args:
+        items: request items, materials are consumed lazily
+        max_size: max size(bytes) of serialized chunk
+
+    Returns:
+        Iterator[List[Dict[str, Any]]]
+    """
+    chunk: List[Dict[str, Any]] = []
+    chunk_size = 2
+    for item in items:
+        item_size = len(json.dumps(item, default=str).encode()) + 2
+        if item_size + 2 > max_size:
+            raise ValueError(f'Material is too large to be imported: {item_size} bytes')
+        if chunk and chunk_size + item_size > max_size:
+            yield chunk
+            chunk = []
+            chunk_size = 2
+        chunk.append(item)
+        chunk_size += item_size
+
+    if chunk:
+        yield chunk
+
+
+def _iter_sdf_records(content: bytes) -> Iterator[bytes]:
+    record: List[bytes] = []
+    for line in content.splitlines(keepends=True):
+        record.append(line)
+        if line.rstrip() == SDF_RECORD_END:
+            yield b''.join(record)
+            record = []
+
+    if b''.join(record).strip():
+        yield b''.join(record)
+
+
+def _iter_csv_records(content: bytes) -> Iterator[bytes]:
+    record: List[bytes] = []
+    quotes = 0
+    for line in content.splitlines(keepends=True):
+        record.append(line)
+        quotes += line.count(b'"')
+        # line break inside of quoted value doesn't end the record
+        if quotes % 2 == 0:
+            yield b''.join(record)
+            record = []
+            quotes = 0
+
+    if record:
+        yield b''.join(record)
+
+
+def _get_text_file(file: File) -> Tuple[str, bytes]:
+    extension = os.path.splitext(file.name)[1].lower()
+    if extension in SDF_EXTENSIONS + CSV_EXTENSIONS:
+        return file.name, file.content
+
+    if zipfile.is_zipfile(io.BytesIO(file.content)):
+        with zipfile.ZipFile(io.BytesIO(file.content)) as zip_file:
+            names = [name for name in zip_file.namelist() if not name.endswith('/')]
+            if len(names) == 1 and os.path.splitext(names[0])[1].lower() in SDF_EXTENSIONS + CSV_EXTENSIONS:
+                return names[0], zip_file.read(names[0])
+
+    raise ValueError('Available file size is 50Mb, only SD and CSV files without attachments can be split')
+
+
+def _zip_chunk(file_name: str, records: List[bytes], number: int) -> File:
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, False) as zip_file:
+        zip_file.writestr(os.path.basename(file_name), b''.join(records))
+
+    stem = os.path.splitext(os.path.basename(file_name))[0]
+    return File(name=f'{stem}_{number}.zip', content=zip_buffer.getvalue(), content_type=ZIP_CONTENT_TYPE)
+
+
+def iter_file_chunks(file: File, max_size: int) -> Iterator[File]:
+    """Split SD or CSV file (plain or the only file of zip archive) into zip files which fit into one request.
+    Header of CSV file is repeated in each chunk.
+
+    Args:
+        file: file to import
+        max_size: max size(bytes) of uncompressed content of chunk
+
+    Returns:
+        Iterator[File]
+    """
+    if file.size <= max_size:
+        yield file
+        return
+
+    file_name, content = _get_text_file(file)
+    is_sdf = os.path.splitext(file_name)[1].lower() in SDF_EXTENSIONS
+    records = _iter_sdf_records(content) if is_sdf else _iter_csv_records(content)
+    header = [] if is_sdf else [next(records, b'')]
+
+    chunk = list(header)
+    chunk_size = sum(len(line) for line in header)
+    number = 0
+    for record in records:
+        if chunk_size + len(record) > max_size:
+            if len(chunk) == len(header):
+                raise ValueError(f'Material is too large to be imported: {len(record)} bytes')
+            yield _zip_chunk(file_name, chunk, number)
+            number += 1
+            chunk = list(header)
+            chunk_size = sum(len(line) for line in header)
+        chunk.append(record)
+        chunk_size += len(record)
+
+    if len(chunk) > len(header):
+        yield _zip_chunk(file_name, chunk, number)
+
+
+def merge_failure_reports(reports: List[File]) -> Optional[File]:
+    """Merge failure reports of chunks into one file, repeated header line is kept once
+
+    Args:
+        reports: failure reports in order of chunks
+
+    Returns:
+        Optional[File]
+    """
+    if len(reports) <= 1:
+        return reports[0] if reports else None
+
+    header, _, _ = reports[0].content.partition(b'\n')
+    contents = [reports[0].content]
+    for report in reports[1:]:
+        first_line, _, rest = report.content.partition(b'\n')
+        contents.append(rest if first_line == header else report.content)
+
+    content = b''.join(content if content.endswith(b'\n') else content + b'\n' for content in contents)
+
+    return File(name=reports[0].name, content=content, content_type=reports[0].content_type)
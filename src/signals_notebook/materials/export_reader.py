@@ -0,0 +1,159 @@
+import cgi
+import csv
+import logging
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from signals_notebook.materials.field import AssetConfig, BatchConfig, MaterialFieldType
+
+log = logging.getLogger(__name__)
+
+MOLFILE_KEY = 'molfile'
+SDF_RECORD_END = '$$$$'
+SDF_MOLFILE_END = 'M  END'
+
+_SDF_DATA_HEADER = re.compile(r'^>.*<(?P<name>[^>]+)>')
+_SDF_UNSUPPORTED_CHARACTERS = re.compile(r'[-.<>=% ]')
+
+BOM = '\ufeff'
+DEFAULT_ENCODING = 'utf-8'
+
+
+def get_encoding(content_type: Optional[str]) -> str:
+    """Get encoding of exported file from its content type, utf-8 is used if charset is not given
+
+    Args:
+        content_type: value of content-type header
+
+    Returns:
+        str
+    """
+    _, params = cgi.parse_header(content_type or '')
+
+    return params.get('charset') or DEFAULT_ENCODING
+
+
+def _iter_raw_lines(chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+    tail = b''
+    for chunk in chunks:
+        lines = (tail + chunk).splitlines(keepends=True)
+        tail = lines.pop() if lines and not lines[-1].endswith((b'\n', b'\r')) else b''
+        # \r\n may be split between chunks
+        if lines and lines[-1].endswith(b'\r'):
+            tail = lines.pop() + tail
+        for line in lines:
+            yield line.decode(encoding)
+
+    if tail:
+        yield tail.decode(encoding)
+
+
+def iter_lines(chunks: Iterable[bytes], encoding: str = DEFAULT_ENCODING) -> Iterator[str]:
+    """Split stream of bytes into decoded lines, line endings are kept. Byte order mark is stripped.
+
+    Args:
+        chunks: content chunks
+        encoding: content encoding
+
+    Returns:
+        Iterator[str]
+    """
+    lines = _iter_raw_lines(chunks, encoding)
+    first_line = next(lines, None)
+    if first_line is None:
+        return
+
+    yield first_line[len(BOM):] if first_line.startswith(BOM) else first_line
+    yield from lines
+
+
+class FieldNameMapper:
+    """Map column names of exported file to names of library fields.
+    SD file names have unsupported characters replaced by '_'.
+    """
+
+    def __init__(self, configs: Sequence[Union[AssetConfig, BatchConfig]]):
+        self._names: Dict[str, str] = {}
+        self.molfile_field: Optional[str] = None
+
+        for config in configs:
+            for field in config.fields:
+                self._names.setdefault(field.name, field.name)
+                self._names.setdefault(_SDF_UNSUPPORTED_CHARACTERS.sub('_', field.name), field.name)
+                if self.molfile_field is None and field.data_type == MaterialFieldType.CHEMICAL_DRAWING:
+                    self.molfile_field = field.name
+
+    def __call__(self, name: str) -> str:
+        return self._names.get(name, name)
+
+
+def iter_sdf_records(lines: Iterable[str], field_name: FieldNameMapper) -> Iterator[Dict[str, str]]:
+    """Parse SD file records one by one
+
+    Args:
+        lines: lines of SD file
+        field_name: mapper of data item names to field names
+
+    Returns:
+        Iterator[Dict[str, str]]
+    """
+    molfile_key = field_name.molfile_field or MOLFILE_KEY
+    molfile: List[str] = []
+    record: Dict[str, str] = {}
+    name: Optional[str] = None
+    value: List[str] = []
+    in_molfile = True
+
+    for line in lines:
+        stripped = line.rstrip('\r\n')
+        if stripped == SDF_RECORD_END:
+            if name is not None:
+                record[name] = '\n'.join(value)
+            yield {molfile_key: ''.join(molfile), **record}
+            molfile, record, name, value, in_molfile = [], {}, None, [], True
+        elif in_molfile:
+            molfile.append(line)
+            in_molfile = stripped != SDF_MOLFILE_END
+        elif name is None:
+            header = _SDF_DATA_HEADER.match(stripped)
+            if header:
+                name = field_name(header.group('name'))
+        elif stripped:
+            value.append(stripped)
+        else:
+            record[name] = '\n'.join(value)
+            name, value = None, []
+
+
+def iter_csv_records(lines: Iterable[str], field_name: FieldNameMapper) -> Iterator[Dict[str, str]]:
+    """Parse CSV file rows one by one, empty values are skipped
+
+    Args:
+        lines: lines of CSV file
+        field_name: mapper of column names to field names
+
+    Returns:
+        Iterator[Dict[str, str]]
+    """
+    reader = csv.reader(lines)
+    header = [field_name(column) for column in next(reader, [])]
+
+    for row in reader:
+        if row:
+            yield {column: value for column, value in zip(header, row) if value != ''}
+
+
+def is_sdf(file_name: str, content_type: Optional[str]) -> bool:
+    """Check if exported file is SD file
+
+    Args:
+        file_name: name of exported file
+        content_type: content type of exported file
+
+    Returns:
+        bool: True/False
+    """
+    if file_name:
+        return file_name.lower().endswith(('.sdf', '.sd'))
+
+    return 'csv' not in (content_type or '')
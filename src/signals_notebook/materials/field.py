@@ -1,11 +1,12 @@
 import logging
 from enum import Enum
-from typing import Annotated, Any, List, Literal, Optional, TYPE_CHECKING, Union
+from typing import Annotated, Any, Dict, Iterable, List, Literal, Optional, Tuple, TYPE_CHECKING, Union
 
 from pydantic import BaseModel, Field
 
-from signals_notebook.attributes import Attribute
+from signals_notebook.attributes import Attribute, AttributeRegistry
 from signals_notebook.common_types import AttrID, File
+from signals_notebook.utils.concurrency import DEFAULT_CONCURRENCY, map_concurrently
 
 if TYPE_CHECKING:
     from signals_notebook.materials.material import Material
@@ -187,12 +188,12 @@ class AttributeFieldDefinition(BaseFieldDefinition):
 
     @property
     def attribute(self) -> Attribute:
-        """Get Attribute object by id
+        """Get Attribute object by id, it is shared through AttributeRegistry and follows its refreshes
 
         Returns:
             Attribute
         """
-        return Attribute.get(self.attribute_id)
+        return AttributeRegistry.get(self.attribute_id)
 
 
 GenericFieldDefinition = Union[
@@ -256,6 +257,7 @@ class MaterialField(BaseModel):
 class FieldContainer:
     def __init__(self, material: 'Material', field_definitions: List[GenericFieldDefinition], **data):
         self._data: dict[str, MaterialField] = {}
+        self._representations: Dict[str, Any] = {}
         self._material = material
 
         for field_definition in field_definitions:
@@ -276,7 +278,10 @@ class FieldContainer:
     def __getitem__(self, key: str) -> Any:
         field = self._data[key]
 
-        return field.definition.to_representation(field.value, self._material)
+        if key not in self._representations:
+            self._representations[key] = field.definition.to_representation(field.value, self._material)
+
+        return self._representations[key]
 
     def __setitem__(self, key: str, value: Any):
         if key not in self._data:
@@ -286,3 +291,49 @@ class FieldContainer:
 
         field.value = field.definition.to_internal_value(value)
         field.is_changed = True
+        self._representations.pop(key, None)
+
+    def is_resolved(self, key: str) -> bool:
+        """Check if representation of the field is memoized
+
+        Args:
+            key: field name
+
+        Returns:
+            bool: True/False
+        """
+        return key in self._representations
+
+
+def prefetch_representations(containers: Iterable[FieldContainer], concurrency: int = DEFAULT_CONCURRENCY) -> None:
+    """Resolve link and attachment fields of many materials concurrently.
+    Entity referenced by several link fields is fetched once. Fields which cannot be resolved are skipped
+    and resolved again on access.
+
+    Args:
+        containers: fields of materials
+        concurrency: max number of simultaneous requests
+
+    Returns:
+
+    """
+    links: Dict[str, List[Tuple[FieldContainer, str]]] = {}
+    attachments: List[List[Tuple[FieldContainer, str]]] = []
+
+    for container in containers:
+        for key, field in container.items():
+            if not field.value or container.is_resolved(key):
+                continue
+            if isinstance(field.definition, LinkFieldDefinition):
+                links.setdefault(field.value['eid'], []).append((container, key))
+            elif isinstance(field.definition, AttachedFileFieldDefinition):
+                attachments.append([(container, key)])
+
+    def _resolve(fields: List[Tuple[FieldContainer, str]]) -> None:
+        container, key = fields[0]
+        representation = container[key]
+        for other_container, other_key in fields[1:]:
+            other_container._representations[other_key] = representation
+
+    log.debug('Prefetch %s links and %s attachments', len(links), len(attachments))
+    map_concurrently(_resolve, [*links.values(), *attachments], concurrency)
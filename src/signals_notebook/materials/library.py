@@ -4,24 +4,56 @@ import json
 import logging
 import time
 import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from enum import Enum
-from typing import Any, cast, List, Literal, Optional, Union
+from typing import Any, Callable, cast, Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Tuple, Union
 
 import requests
 from pydantic import BaseModel, Field, PrivateAttr
 
 from signals_notebook.api import SignalsNotebookApi
-from signals_notebook.common_types import File, Links, MaterialType, MID, Response, ResponseData
+from signals_notebook.common_types import (
+    ChemicalDrawingFormat,
+    File,
+    Links,
+    MaterialType,
+    MID,
+    Response,
+    ResponseData,
+)
 from signals_notebook.materials.asset import Asset
 from signals_notebook.materials.base_entity import BaseMaterialEntity
-from signals_notebook.materials.batch import Batch
+from signals_notebook.materials.batch import Batch, iter_batch_pages
+from signals_notebook.materials.bulk_import import (
+    ImportChunk,
+    iter_file_chunks,
+    iter_json_chunks,
+    merge_failure_reports,
+    ZIP_CONTENT_TYPE,
+)
+from signals_notebook.materials.export_reader import (
+    FieldNameMapper,
+    get_encoding,
+    is_sdf,
+    iter_csv_records,
+    iter_lines,
+    iter_sdf_records,
+)
 from signals_notebook.materials.field import AssetConfig, BatchConfig
+from signals_notebook.materials.material import Material
+from signals_notebook.materials.material_index import MaterialIndex
+from signals_notebook.materials.media_downloader import MaterialMedia, MediaDownloader, MediaDownloadReport
+from signals_notebook.utils.concurrency import DEFAULT_CONCURRENCY
 from signals_notebook.utils.fs_handler import FSHandler
 from signals_notebook.exceptions import SignalsNotebookError, BulkExportJobAlreadyRunningError
 
 MAX_MATERIAL_FILE_SIZE = 52428800
 EXPORT_ERROR_LIBRARY_EMPTY = 'Nothing to export.'
+EXPORT_CHUNK_SIZE = 1024 * 1024
+IMPORT_JOB_COMPLETED = 'COMPLETED'
+IMPORT_JOB_FAILED = 'FAILED'
+IMPORT_JOB_MIN_PERIOD = 1
 
 log = logging.getLogger(__name__)
 
@@ -101,21 +133,21 @@ class Library(BaseMaterialEntity):
     type: Literal[MaterialType.LIBRARY] = Field(allow_mutation=False, default=MaterialType.LIBRARY)
     _asset_config: Optional[AssetConfig] = PrivateAttr(default=None)
     _batch_config: Optional[BatchConfig] = PrivateAttr(default=None)
+    _index: Optional[MaterialIndex] = PrivateAttr(default=None)
 
     class Config:
         validate_assignment = True
 
     def _load_configs(self) -> None:
-        # the only way to get config is to fetch all libraries
+        # the only way to get config is to fetch all libraries, they are cached by LibraryRegistry
+        from signals_notebook.materials.library_registry import LibraryRegistry
+
         log.debug('Loading asset and batch configs to %s for %s', self.__class__.__name__, self.eid)
 
-        result = self._get_library_list_response()
-        for item in result.data:
-            data = cast(_LibraryListData, cast(ResponseData, item).body)
-            if data.id == self.asset_type_id:
-                self._asset_config = data.asset_config
-                self._batch_config = data.batch_config
-                return
+        library = LibraryRegistry.lookup(self.asset_type_id)
+        if library and library is not self:
+            self._asset_config = library._asset_config
+            self._batch_config = library._batch_config
 
     @property
     def asset_config(self) -> AssetConfig:
@@ -237,26 +269,29 @@ class Library(BaseMaterialEntity):
 
         return cast(ResponseData, result.data).body
 
-    def get_asset_batches(self, name: str) -> List[Batch]:
-        """Fetch batches of a specified Asset.
+    def iter_asset_batches(self, name: str) -> Iterator[Batch]:
+        """Fetch batches of a specified Asset lazily, page by page.
 
         Args:
             name: asset id
 
         Returns:
-            list of Batch objects
+            Batch iterator
         """
-        api = SignalsNotebookApi.get_default_api()
-        log.debug('Get Asset of Batches for %s with name: %s', self.eid, name)
+        log.debug('Iterate Batches of Asset for %s with name: %s', self.eid, name)
 
-        response = api.call(
-            method='GET',
-            path=(self._get_endpoint(), self.name, 'assets', name, 'batches'),
-        )
+        yield from iter_batch_pages(self, (self._get_endpoint(), self.name, 'assets', name, 'batches'))
 
-        result = BatchResponse(_context={'_library': self}, **response.json())
+    def get_asset_batches(self, name: str) -> List[Batch]:
+        """Fetch all batches of a specified Asset.
 
-        return [cast(ResponseData, item).body for item in result.data]
+        Args:
+            name: asset id
+
+        Returns:
+            list of Batch objects
+        """
+        return list(self.iter_asset_batches(name))
 
     def get_batch(self, name: str) -> Batch:
         """Fetch batch from a material library by batch ID.
@@ -386,29 +421,19 @@ class Library(BaseMaterialEntity):
 
         return result
 
-    def _download_file(self, file_id: str) -> requests.Response:
+    def _download_file(self, file_id: str, stream: bool = False) -> requests.Response:
         api = SignalsNotebookApi.get_default_api()
         log.debug('Get file content for: %s| %s', self.__class__.__name__, self.eid)
 
         return api.call(
             method='GET',
             path=(self._get_endpoint(), 'bulkExport', 'download', file_id),
+            stream=stream,
         )
 
-    def get_content(self, timeout: int = 600, period: int = 5) -> File:
-        """Get library content.
-        Compounds/Reagents (SNB) will be exported to SD file, others will be exported to CSV file.
-
-        Args:
-            timeout: max available time(seconds) to get file
-            period: each n seconds(default value=5) api call
-
-        Returns:
-            File
-        """
-        bulk_export_response = None
+    def _start_export(self) -> Tuple[str, str]:
         api = SignalsNotebookApi.get_default_api()
-        log.debug('Get content for: %s| %s', self.__class__.__name__, self.eid)
+        log.debug('Start bulk export for: %s| %s', self.__class__.__name__, self.eid)
 
         try:
             bulk_export_response = api.call(
@@ -421,27 +446,40 @@ class Library(BaseMaterialEntity):
                 raise BulkExportJobAlreadyRunningError()
             else:
                 raise
-        except Exception as e:
-            raise e
 
-        file_id, report_id = bulk_export_response.json()['data']['attributes'].values()
+        attributes = bulk_export_response.json()['data']['attributes']
 
-        initial_time = time.time()
+        return attributes['fileId'], attributes['reportId']
 
-        response = None
+    def _wait_for_export(self, report_id: str, timeout: float, period: float) -> None:
+        initial_time = time.time()
 
         while time.time() - initial_time < timeout:
             result = self._is_file_ready(report_id)
             if result['error'] == EXPORT_ERROR_LIBRARY_EMPTY:
                 raise FileNotFoundError('Library is empty')
             if result['success'] and not result['error']:
-                response = self._download_file(file_id)
-                break
-            else:
-                time.sleep(period)
+                return
+            time.sleep(period)
+
+        raise TimeoutError('Time is over to get file')
+
+    def get_content(self, timeout: int = 600, period: int = 5) -> File:
+        """Get library content.
+        Compounds/Reagents (SNB) will be exported to SD file, others will be exported to CSV file.
 
-        if not response:
-            raise TimeoutError('Time is over to get file')
+        Args:
+            timeout: max available time(seconds) to get file
+            period: each n seconds(default value=5) api call
+
+        Returns:
+            File
+        """
+        log.debug('Get content for: %s| %s', self.__class__.__name__, self.eid)
+
+        file_id, report_id = self._start_export()
+        self._wait_for_export(report_id, timeout, period)
+        response = self._download_file(file_id)
 
         content_disposition = response.headers.get('content-disposition', '')
         _, params = cgi.parse_header(content_disposition)
@@ -450,6 +488,75 @@ class Library(BaseMaterialEntity):
             name=params['filename'], content=response.content, content_type=response.headers.get('content-type')
         )
 
+    def iter_export_records(
+        self, timeout: int = 600, period: int = 5, chunk_size: int = EXPORT_CHUNK_SIZE
+    ) -> Iterator[Dict[str, str]]:
+        """Export library content and parse it record by record while it is downloaded.
+        Records of SD file contain molfile (under name of chemical drawing field) and data items,
+        records of CSV file contain non-empty values. Names are mapped to names of asset and batch fields.
+
+        Args:
+            timeout: max available time(seconds) to get file
+            period: each n seconds(default value=5) api call
+            chunk_size: size(bytes) of downloaded chunks
+
+        Returns:
+            Iterator[Dict[str, str]]
+        """
+        log.debug('Iterate exported records for: %s| %s', self.__class__.__name__, self.eid)
+
+        file_id, report_id = self._start_export()
+        self._wait_for_export(report_id, timeout, period)
+        response = self._download_file(file_id, stream=True)
+
+        _, params = cgi.parse_header(response.headers.get('content-disposition', ''))
+        field_name = FieldNameMapper([self.asset_config, self.batch_config])
+        # requests falls back to ISO-8859-1 for text content without charset, exports are utf-8 then
+        encoding = get_encoding(response.headers.get('content-type'))
+        lines = iter_lines(response.iter_content(chunk_size=chunk_size), encoding)
+
+        try:
+            if is_sdf(params.get('filename', ''), response.headers.get('content-type')):
+                yield from iter_sdf_records(lines, field_name)
+            else:
+                yield from iter_csv_records(lines, field_name)
+        finally:
+            response.close()
+
+    def get_index(self, refresh: bool = False, max_age: Optional[float] = None) -> MaterialIndex:
+        """Get local index of library records, it is built from library export on first call
+
+        Args:
+            refresh: reload records from library export
+            max_age: reload records if index is older than max_age seconds
+
+        Returns:
+            MaterialIndex
+        """
+        if self._index is None:
+            self._index = MaterialIndex(self)
+            refresh = True
+
+        refreshed_at = self._index.refreshed_at
+        if refresh or refreshed_at is None or (max_age is not None and time.monotonic() - refreshed_at > max_age):
+            log.debug('Refresh index of: %s| %s', self.__class__.__name__, self.eid)
+            self._index.refresh()
+
+        return self._index
+
+    def find(self, conditions: Optional[Dict[str, Any]] = None, **kwargs: Any) -> List[Dict[str, str]]:
+        """Find library records by field values using local index.
+        Use get_index for prefix and range queries or to refresh the index.
+
+        Args:
+            conditions: field values by field names, use it for names which are not valid python identifiers
+            **kwargs: field values by field names
+
+        Returns:
+            list of records
+        """
+        return self.get_index().find(conditions, **kwargs)
+
     def _get_import_job_completed_response(self, job_id: str) -> requests.Response:
         api = SignalsNotebookApi.get_default_api()
         log.debug('Check job status for: %s| %s', self.__class__.__name__, self.eid)
@@ -458,7 +565,7 @@ class Library(BaseMaterialEntity):
 
     def _import_materials(
         self,
-        materials: Union[File, list[dict[Literal[MaterialType.ASSET, MaterialType.BATCH], dict[str, Any]]]],
+        materials: ImportChunk,
         rule: MaterialImportRule = MaterialImportRule.TREAT_AS_UNIQUE,
         import_type: Literal['json', 'zip'] = 'json',
     ) -> requests.Response:
@@ -482,8 +589,6 @@ class Library(BaseMaterialEntity):
                 data=materials.content,
             )
 
-        request_body = [{'data': self._process_asset_with_batch_fields(material).dict()} for material in materials]
-
         return api.call(
             method='POST',
             path=(self._get_endpoint(), self.name, 'bulkImport'),
@@ -491,23 +596,95 @@ class Library(BaseMaterialEntity):
                 'rule': rule,
                 'importType': import_type,
             },
-            json=request_body,
+            json=materials,
         )
 
+    def _wait_import_job(self, job_id: str, timeout: float, period: float) -> Dict[str, Any]:
+        initial_time = time.time()
+        interval = min(IMPORT_JOB_MIN_PERIOD, period)
+
+        while True:
+            attributes = self._get_import_job_completed_response(job_id).json()['data']['attributes']
+            if attributes['status'] in (IMPORT_JOB_COMPLETED, IMPORT_JOB_FAILED):
+                return attributes
+            if time.time() - initial_time >= timeout:
+                raise TimeoutError(f'Bulk import job {job_id} is not finished in {timeout} seconds')
+
+            time.sleep(interval)
+            interval = min(interval * 2, period)
+
+    def _get_failure_report(self, job_id: str) -> File:
+        api = SignalsNotebookApi.get_default_api()
+        log.debug('Get failure report for: %s| %s', self.__class__.__name__, self.eid)
+
+        failure_report_response = api.call(
+            method='GET',
+            path=(self._get_endpoint(), 'bulkImport', 'jobs', job_id, 'failures'),
+            params={
+                'filename': f'{self.name}_failure_report',
+            },
+        )
+        content_disposition = failure_report_response.headers.get('content-disposition', '')
+        _, params = cgi.parse_header(content_disposition)
+
+        return File(
+            name=params['filename'],
+            content=failure_report_response.content,
+            content_type=failure_report_response.headers.get('content-type'),
+        )
+
+    def _import_chunk(
+        self,
+        chunk: ImportChunk,
+        rule: MaterialImportRule,
+        import_type: Literal['json', 'zip'],
+        timeout: float,
+        period: float,
+    ) -> Optional[File]:
+        if isinstance(chunk, File) and chunk.content_type == ZIP_CONTENT_TYPE:
+            import_type = 'zip'
+
+        bulk_import_response = self._import_materials(chunk, rule, import_type)
+        job_id = bulk_import_response.json()['data']['id']
+        log.debug('Bulk import job %s is started for: %s| %s', job_id, self.__class__.__name__, self.eid)
+
+        attributes = self._wait_import_job(job_id, timeout, period)
+        failed = (attributes.get('report') or {}).get('failed') or 0
+        if attributes['status'] == IMPORT_JOB_FAILED or failed:
+            return self._get_failure_report(job_id)
+
+        log.debug('Bulk import job %s is finished with status: %s', job_id, attributes['status'])
+        return None
+
+    def _iter_import_chunks(
+        self,
+        materials: Union[File, Iterable[dict[Literal[MaterialType.ASSET, MaterialType.BATCH], dict[str, Any]]]],
+        max_chunk_size: int,
+    ) -> Iterator[ImportChunk]:
+        if isinstance(materials, File):
+            return iter_file_chunks(materials, max_chunk_size)
+
+        request_items = ({'data': self._process_asset_with_batch_fields(material).dict()} for material in materials)
+        return iter_json_chunks(request_items, max_chunk_size)
+
     def bulk_import(  # type: ignore
         self,
-        materials: Union[File, list[dict[Literal[MaterialType.ASSET, MaterialType.BATCH], dict[str, Any]]]],
+        materials: Union[File, Iterable[dict[Literal[MaterialType.ASSET, MaterialType.BATCH], dict[str, Any]]]],
         rule: MaterialImportRule = MaterialImportRule.TREAT_AS_UNIQUE,
         import_type: Literal['json', 'zip'] = 'json',
         timeout: int = 30,
         period: int = 5,
+        max_chunk_size: int = MAX_MATERIAL_FILE_SIZE,
+        concurrency: int = 2,
     ) -> Optional[File]:
         """Bulk import materials into a specified material library. Support import data from json or zip file.
         Zip file should contain the sdf file or csv file and attachments. T
         he column name in each records of sdf/csv file should be match the asset field name.
         In sdf file, it doesn't support character '-', '.', '<', '>', '=', '%', ' ',
         please replace them to '_' in records.
-        Max materials size: 50MB.
+        Max size of one import request: 50MB. Larger inputs are split into chunks which are imported as
+        separate jobs: json materials (any iterable, e.g. generator) and sd/csv files (plain or the only file
+        of zip archive). Up to concurrency chunks are imported simultaneously.
 
         Rules of import:
         'TREAT_AS_UNIQUE', each item will be treated as a new asset. Selected by default.
@@ -518,53 +695,78 @@ class Library(BaseMaterialEntity):
             materials: materials in zip or json format
             rule: rule of import
             import_type: import type: json or zip
-            timeout: max available time(seconds) to get file
-            period: each n seconds(default value=5) api call
+            timeout: max available time(seconds) to import one chunk
+            period: max interval(seconds) between job status api calls, intervals grow from 1 second
+            max_chunk_size: max size(bytes) of one import request
+            concurrency: max number of simultaneously imported chunks
 
         Returns:
-            File or None
+            File with failure report (merged for all chunks) or None.
+            TimeoutError is raised if a chunk is not imported in time.
         """
-        api = SignalsNotebookApi.get_default_api()
-
-        bulk_import_response = self._import_materials(materials, rule, import_type)
-
-        job_id = bulk_import_response.json()['data']['id']
-
-        initial_time = time.time()
-
-        response = False
-        import_job_status = 'FAILED'
-
-        while time.time() - initial_time < timeout:
-            completed_import_response = self._get_import_job_completed_response(job_id)
-            import_job_status = completed_import_response.json()['data']['attributes']['status']
-            import_response_code = completed_import_response.status_code
-
-            if import_response_code != 200 and import_job_status != 'COMPLETED':
-                time.sleep(period)
-            else:
-                response = True
-                log.debug('Library import is completed')
-                break
+        reports: Dict[int, File] = {}
+        pending: Dict[Future, int] = {}
+
+        def _collect(futures: Iterable[Future]) -> None:
+            for future in futures:
+                report = future.result()
+                if report:
+                    reports[pending[future]] = report
+                del pending[future]
+
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            for number, chunk in enumerate(self._iter_import_chunks(materials, max_chunk_size)):
+                if len(pending) >= concurrency:
+                    done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                    _collect(done)
+                log.debug('Import chunk %s for: %s| %s', number, self.__class__.__name__, self.eid)
+                pending[executor.submit(self._import_chunk, chunk, rule, import_type, timeout, period)] = number
+            _collect(list(pending))
+
+        return merge_failure_reports([reports[number] for number in sorted(reports)])
+
+    def download_assets_media(
+        self,
+        assets: Iterable[Union[Material, str]],
+        fs_handler: FSHandler,
+        base_path: str,
+        media: Sequence[MaterialMedia] = (MaterialMedia.CHEMICAL_DRAWING,),
+        drawing_format: Optional[ChemicalDrawingFormat] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        skip_existing: bool = True,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> MediaDownloadReport:
+        """Download chemical drawings, images, bio sequences or attachments of many materials concurrently.
+        Files are written to <base_path>/<library name>/<material name>/<file name>.
+        Downloaded files are listed with material digests in <base_path>/<library name>/media.json,
+        files of unchanged materials are skipped next time.
 
-        if not response and import_job_status == 'FAILED':
-            log.debug('Time is over to import file')
+        Args:
+            assets: Material objects or asset names
+            fs_handler: FSHandler where files are written
+            base_path: base path
+            media: kinds of media to download
+            drawing_format: format of chemical drawings
+            concurrency: max number of simultaneously processed materials
+            skip_existing: skip files downloaded before for unchanged materials
+            progress: function which is called with numbers of processed and all materials
 
-            failure_report_reponse = api.call(
-                method='GET',
-                path=(self._get_endpoint(), 'bulkImport', 'jobs', job_id, 'failures'),
-                params={
-                    'filename': f'{self.name}_failure_report',
-                },
-            )
-            content_disposition = failure_report_reponse.headers.get('content-disposition', '')
-            _, params = cgi.parse_header(content_disposition)
+        Returns:
+            MediaDownloadReport
+        """
+        log.debug('Download media of assets for: %s| %s', self.__class__.__name__, self.eid)
+
+        downloader = MediaDownloader(
+            self,
+            fs_handler,
+            base_path,
+            media=media,
+            drawing_format=drawing_format,
+            skip_existing=skip_existing,
+            progress=progress,
+        )
 
-            return File(
-                name=params['filename'],
-                content=failure_report_reponse.content,
-                content_type=failure_report_reponse.headers.get('content-type'),
-            )
+        return downloader.download(assets, concurrency)
 
     def dump(self, base_path: str, fs_handler: FSHandler, alias: Optional[List[str]] = None):
         metadata = {
@@ -0,0 +1,54 @@
+import logging
+from typing import Iterable, Optional
+
+from signals_notebook.common_types import MaterialType, MID
+from signals_notebook.materials.library import Library
+from signals_notebook.utils.registry import ListedTTLRegistry
+
+log = logging.getLogger(__name__)
+
+
+class LibraryRegistry(ListedTTLRegistry[Library]):
+    """Process-wide cache of libraries with their asset and batch configs, keyed by asset type id.
+
+    All libraries and their configs are fetched with a single call of the libraries list.
+    On refresh, cached libraries with the same digest are kept, changed ones are replaced.
+    """
+
+    @classmethod
+    def _list(cls) -> Iterable[Library]:
+        return Library.get_list()
+
+    @classmethod
+    def _get_key(cls, item: Library) -> str:
+        return item.asset_type_id
+
+    @classmethod
+    def _merge(cls, cached_item: Optional[Library], item: Library) -> Library:
+        if cached_item and cached_item.digest == item.digest:
+            return cached_item
+
+        return item
+
+    @classmethod
+    def get(cls, asset_type_id: str) -> Library:
+        """Get library by asset type id. Falls back to fetching the library
+        if it is not present in the libraries list.
+
+        Args:
+            asset_type_id: asset type id of the library
+
+        Returns:
+            Library
+        """
+        library = cls.lookup(asset_type_id)
+        if library:
+            return library
+
+        from signals_notebook.materials.material_store import MaterialStore
+
+        library = MaterialStore.get(MID(f'{MaterialType.LIBRARY}:{asset_type_id}'))
+        assert isinstance(library, Library)
+        cls.put(library, asset_type_id)
+
+        return library
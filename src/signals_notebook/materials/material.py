@@ -1,14 +1,15 @@
 import cgi
 import json
 import logging
-from typing import Any, cast, Optional, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
 
 from pydantic import PrivateAttr
 
 from signals_notebook.api import SignalsNotebookApi
-from signals_notebook.common_types import ChemicalDrawingFormat, File, MaterialType, MID
+from signals_notebook.common_types import ChemicalDrawingFormat, File
 from signals_notebook.materials.base_entity import BaseMaterialEntity
-from signals_notebook.materials.field import FieldContainer
+from signals_notebook.materials.field import FieldContainer, GenericFieldDefinition, prefetch_representations
+from signals_notebook.utils.concurrency import DEFAULT_CONCURRENCY
 
 if TYPE_CHECKING:
     from signals_notebook.materials.library import Library
@@ -18,12 +19,27 @@ log = logging.getLogger(__name__)
 
 class Material(BaseMaterialEntity):
 
-    _material_fields: FieldContainer = PrivateAttr(default={})
+    _fields_container: Optional[FieldContainer] = PrivateAttr(default=None)
+    _raw_fields: Dict[str, Any] = PrivateAttr(default_factory=dict)
     _library: Optional['Library'] = PrivateAttr(default=None)
 
     def __init__(self, _library: Optional['Library'] = None, **data):
+        fields = data.pop('fields', {})
         super().__init__(**data)
         self._library = _library
+        self._raw_fields = fields or {}
+
+    def _get_field_definitions(self) -> List[GenericFieldDefinition]:
+        return []
+
+    @property
+    def _material_fields(self) -> FieldContainer:
+        # fields are parsed on first access, so listing materials doesn't require library configs
+        if self._fields_container is None:
+            self._fields_container = FieldContainer(self, self._get_field_definitions(), **self._raw_fields)
+            self._raw_fields = {}
+
+        return self._fields_container
 
     def __getitem__(self, key: str) -> Any:
         return self._material_fields[key]
@@ -39,13 +55,25 @@ class Material(BaseMaterialEntity):
             Library
         """
         if not self._library:
-            from signals_notebook.materials.material_store import MaterialStore
+            from signals_notebook.materials.library_registry import LibraryRegistry
 
-            library = MaterialStore.get(MID(f'{MaterialType.LIBRARY}:{self.asset_type_id}'))
-            self._library = cast('Library', library)
+            self._library = LibraryRegistry.get(self.asset_type_id)
 
         return self._library
 
+    @classmethod
+    def prefetch_fields(cls, materials: Iterable['Material'], concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        """Resolve link and attachment fields of materials concurrently, so access to them doesn't call api.
+
+        Args:
+            materials: Material objects
+            concurrency: max number of simultaneous requests
+
+        Returns:
+
+        """
+        prefetch_representations((material._material_fields for material in materials), concurrency)
+
     def get_chemical_drawing(self, format: Optional[ChemicalDrawingFormat] = None) -> File:
         """Export chemical drawing or image of a specified material.
 
@@ -148,18 +176,16 @@ class Material(BaseMaterialEntity):
         Returns:
 
         """
-        request_body = []
-
-        for field_name, field in self._material_fields.items():
-            if field.is_changed:
-                request_body.append(
-                    {
-                        'attributes': {
-                            'name': field_name,
-                            'value': field.value,
-                        }
-                    }
-                )
+        changed_fields = [(name, field) for name, field in self._material_fields.items() if field.is_changed]
+        request_body = [
+            {
+                'attributes': {
+                    'name': field_name,
+                    'value': field.value,
+                }
+            }
+            for field_name, field in changed_fields
+        ]
         log.debug('Save %s: %s', self.__class__.__name__, self.eid)
 
         api = SignalsNotebookApi.get_default_api()
@@ -176,6 +202,18 @@ class Material(BaseMaterialEntity):
             },
         )
 
+        for _, field in changed_fields:
+            field.is_changed = False
+
+    @property
+    def is_changed(self) -> bool:
+        """Check if any field has been changed since material was fetched or saved
+
+        Returns:
+            bool: True/False
+        """
+        return any(field.is_changed for _, field in self._material_fields.items())
+
     def delete(self, digest: Optional[str] = None, force: bool = True) -> None:
         """Delete Material by ID
 
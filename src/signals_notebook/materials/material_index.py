@@ -0,0 +1,215 @@
+import logging
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from signals_notebook.materials.field import MaterialFieldType
+
+if TYPE_CHECKING:
+    from signals_notebook.materials.library import Library
+
+log = logging.getLogger(__name__)
+
+Record = Dict[str, str]
+
+NUMERIC_FIELD_TYPES = (
+    MaterialFieldType.DECIMAL,
+    MaterialFieldType.INTEGER,
+    MaterialFieldType.MOLECULAR_MASS,
+    MaterialFieldType.DENSITY,
+    MaterialFieldType.TEMPERATURE,
+)
+
+_PREFIX_END = '\U0010ffff'
+
+
+def _to_float(value: str) -> Optional[float]:
+    try:
+        return float(value.split()[0])
+    except (ValueError, IndexError):
+        return None
+
+
+class _SortedFieldIndex:
+    def __init__(self, pairs: Iterable[Tuple[Any, int]]):
+        sorted_pairs = sorted(pairs, key=lambda pair: pair[0])
+        self.values = [value for value, _ in sorted_pairs]
+        self.positions = [position for _, position in sorted_pairs]
+
+    def range(self, low: Any = None, high: Any = None, include_high: bool = True) -> Set[int]:
+        start = 0 if low is None else bisect_left(self.values, low)
+        if high is None:
+            end = len(self.values)
+        else:
+            end = bisect_right(self.values, high) if include_high else bisect_left(self.values, high)
+
+        return set(self.positions[start:end])
+
+
+class MaterialIndex:
+    """In-memory index of field values of library records for lookups without api calls.
+
+    Records are read from streamed library export. Equality lookups use hash indexes of all fields,
+    prefix and range lookups use sorted indexes which are built on first use. Values of numeric fields
+    are compared as numbers. On refresh only added and removed records are reindexed.
+    """
+
+    def __init__(self, library: 'Library'):
+        """
+        Args:
+            library: indexed library
+        """
+        self.library = library
+        self.refreshed_at: Optional[float] = None
+        self._records: Dict[int, Record] = {}
+        self._positions: Dict[FrozenSet[Tuple[str, str]], int] = {}
+        self._hash: Dict[str, Dict[str, Set[int]]] = {}
+        self._sorted: Dict[Tuple[str, bool], _SortedFieldIndex] = {}
+        self._numeric_fields: Optional[Set[str]] = None
+        self._next_position = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _is_numeric(self, field: str) -> bool:
+        if self._numeric_fields is None:
+            self._numeric_fields = {
+                definition.name
+                for config in (self.library.asset_config, self.library.batch_config)
+                for definition in config.fields
+                if definition.data_type in NUMERIC_FIELD_TYPES
+            }
+
+        return field in self._numeric_fields
+
+    def _add(self, record: Record) -> None:
+        fingerprint = frozenset(record.items())
+        if fingerprint in self._positions:
+            return
+
+        position = self._next_position
+        self._next_position += 1
+        self._positions[fingerprint] = position
+        self._records[position] = record
+        for field, value in record.items():
+            self._hash.setdefault(field, {}).setdefault(value.strip(), set()).add(position)
+
+    def _remove(self, fingerprint: FrozenSet[Tuple[str, str]]) -> None:
+        position = self._positions.pop(fingerprint)
+        record = self._records.pop(position)
+        for field, value in record.items():
+            positions = self._hash[field][value.strip()]
+            positions.discard(position)
+            if not positions:
+                del self._hash[field][value.strip()]
+
+    def update(self, records: Iterable[Record]) -> Tuple[int, int]:
+        """Make index contain exactly given records, unchanged records are kept as is
+
+        Args:
+            records: all records of the library
+
+        Returns:
+            numbers of added and removed records
+        """
+        with self._lock:
+            seen = set()
+            added = 0
+            for record in records:
+                fingerprint = frozenset(record.items())
+                seen.add(fingerprint)
+                if fingerprint not in self._positions:
+                    self._add(record)
+                    added += 1
+
+            removed = [fingerprint for fingerprint in self._positions if fingerprint not in seen]
+            for fingerprint in removed:
+                self._remove(fingerprint)
+
+            if added or removed:
+                self._sorted = {}
+            self.refreshed_at = time.monotonic()
+
+        log.debug('Index of %s is updated: %s added, %s removed', self.library.eid, added, len(removed))
+        return added, len(removed)
+
+    def refresh(self, timeout: int = 600, period: int = 5) -> Tuple[int, int]:
+        """Reload records from library export
+
+        Args:
+            timeout: max available time(seconds) to get export file
+            period: each n seconds(default value=5) api call
+
+        Returns:
+            numbers of added and removed records
+        """
+        return self.update(self.library.iter_export_records(timeout=timeout, period=period))
+
+    def _get_sorted_index(self, field: str, numeric: bool) -> _SortedFieldIndex:
+        if (field, numeric) not in self._sorted:
+            convert: Callable[[str], Any] = _to_float if numeric else str
+            pairs = []
+            for value, positions in self._hash.get(field, {}).items():
+                converted = convert(value)
+                if converted is not None:
+                    pairs.extend((converted, position) for position in positions)
+            self._sorted[(field, numeric)] = _SortedFieldIndex(pairs)
+
+        return self._sorted[(field, numeric)]
+
+    def _get_records(self, positions: Set[int]) -> List[Record]:
+        return [self._records[position] for position in sorted(positions)]
+
+    def find(self, conditions: Optional[Dict[str, Any]] = None, **kwargs: Any) -> List[Record]:
+        """Find records which have all given field values
+
+        Args:
+            conditions: field values by field names, use it for names which are not valid python identifiers
+            **kwargs: field values by field names
+
+        Returns:
+            list of records in order of indexing
+        """
+        conditions = {**(conditions or {}), **kwargs}
+        with self._lock:
+            positions: Optional[Set[int]] = None
+            for field, value in conditions.items():
+                matched = self._hash.get(field, {}).get(str(value).strip(), set())
+                positions = set(matched) if positions is None else positions & matched
+                if not positions:
+                    return []
+
+            return self._get_records(positions if positions is not None else set(self._records))
+
+    def find_prefix(self, field: str, prefix: str) -> List[Record]:
+        """Find records which field value starts with prefix
+
+        Args:
+            field: field name
+            prefix: value prefix
+
+        Returns:
+            list of records in order of indexing
+        """
+        with self._lock:
+            index = self._get_sorted_index(field, numeric=False)
+
+            return self._get_records(index.range(prefix, prefix + _PREFIX_END, include_high=False))
+
+    def find_range(self, field: str, low: Any = None, high: Any = None) -> List[Record]:
+        """Find records which field value is between low and high inclusive
+
+        Args:
+            field: field name
+            low: lower bound, if None range is not bounded from below
+            high: upper bound, if None range is not bounded from above
+
+        Returns:
+            list of records in order of indexing
+        """
+        with self._lock:
+            index = self._get_sorted_index(field, numeric=self._is_numeric(field))
+
+            return self._get_records(index.range(low, high))
@@ -1,12 +1,15 @@
 import logging
-from typing import cast, Union
+import threading
+from typing import Any, Callable, cast, Dict, Iterable, List, Optional, Union
 
 from signals_notebook.api import SignalsNotebookApi
-from signals_notebook.common_types import MID, Response, ResponseData
+from signals_notebook.common_types import MaterialType, MID, Response, ResponseData
 from signals_notebook.materials.asset import Asset
 from signals_notebook.materials.batch import Batch
 from signals_notebook.materials.library import Library
+from signals_notebook.materials.library_registry import LibraryRegistry
 from signals_notebook.materials.material import Material
+from signals_notebook.utils.concurrency import DEFAULT_CONCURRENCY, map_concurrently
 
 log = logging.getLogger(__name__)
 
@@ -41,3 +44,115 @@ class MaterialStore:
         result = MaterialResponse(**response.json())
 
         return cast(ResponseData, result.data).body
+
+    @classmethod
+    def _get_raw(cls, eid: MID) -> Dict[str, Any]:
+        api = SignalsNotebookApi.get_default_api()
+        log.debug('Get raw Material for %s', eid)
+
+        response = api.call(
+            method='GET',
+            path=(cls._get_endpoint(), eid),
+        )
+
+        return response.json()
+
+    @classmethod
+    def get_many(
+        cls,
+        eids: Iterable[MID],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = True,
+    ) -> List[Union[Material, Exception]]:
+        """Fetch many materials by entity IDs using concurrent requests.
+        Materials of the same library share one Library object, so library and its configs are resolved once.
+
+        Args:
+            eids: Unique material identifiers
+            concurrency: max number of simultaneous requests
+            return_exceptions: return an exception in place of material which cannot be fetched,
+                otherwise the first exception is raised
+
+        Returns:
+            list of Material objects (or exceptions) in order of eids
+        """
+        eids = [MID(eid) for eid in eids]
+        unique_eids = list(dict.fromkeys(eids))
+        log.debug('Get %s Materials with concurrency: %s', len(unique_eids), concurrency)
+
+        raw_materials = dict(zip(unique_eids, map_concurrently(cls._get_raw, unique_eids, concurrency)))
+
+        materials: Dict[MID, Union[Material, Exception]] = {}
+        for eid, raw_material in raw_materials.items():
+            if isinstance(raw_material, Exception):
+                materials[eid] = raw_material
+                continue
+            try:
+                materials[eid] = cls._parse_material(eid, raw_material)
+            except Exception as e:
+                log.debug('Cannot parse Material %s: %s', eid, e)
+                materials[eid] = e
+
+        results = [materials[eid] for eid in eids]
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+
+        return results
+
+    @classmethod
+    def _parse_material(cls, eid: MID, raw_material: Dict[str, Any]) -> Material:
+        if eid.type == MaterialType.LIBRARY:
+            return cast(ResponseData, MaterialResponse(**raw_material).data).body
+
+        library = LibraryRegistry.get(raw_material['data']['attributes']['assetTypeId'])
+        result = MaterialResponse(_context={'_library': library}, **raw_material)
+
+        return cast(ResponseData, result.data).body
+
+    @classmethod
+    def save_many(
+        cls,
+        materials: Iterable[Material],
+        force: bool = True,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[Optional[Exception]]:
+        """Save changed fields of many materials using concurrent requests.
+        Materials without changes are skipped.
+
+        Args:
+            materials: Material objects
+            force: Force to update properties without digest check.
+            concurrency: max number of simultaneous requests
+            progress: function which is called with numbers of saved and all changed materials
+
+        Returns:
+            list of None (saved or nothing to save) or exception in order of materials
+        """
+        materials = list(materials)
+        changed_materials = list({id(material): material for material in materials if material.is_changed}.values())
+        log.debug('Save %s changed Materials with concurrency: %s', len(changed_materials), concurrency)
+
+        lock = threading.Lock()
+        saved = 0
+
+        def _save(material: Material) -> None:
+            nonlocal saved
+            try:
+                material.save(force=force)
+            finally:
+                with lock:
+                    saved += 1
+                    if progress:
+                        progress(saved, len(changed_materials))
+
+        results = dict(
+            zip(
+                (id(material) for material in changed_materials),
+                map_concurrently(_save, changed_materials, concurrency),
+            )
+        )
+
+        return [cast(Optional[Exception], results.get(id(material))) for material in materials]
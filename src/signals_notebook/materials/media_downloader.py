@@ -0,0 +1,126 @@
+import logging
+from enum import Enum
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING, Union
+
+from pydantic import BaseModel, Field
+
+from signals_notebook.common_types import ChemicalDrawingFormat, File
+from signals_notebook.materials.field import AttachedFileFieldDefinition
+from signals_notebook.materials.material import Material
+from signals_notebook.utils.concurrency import DEFAULT_CONCURRENCY
+from signals_notebook.utils.file_exporter import ManifestFileExporter
+from signals_notebook.utils.fs_handler import FSHandler
+
+if TYPE_CHECKING:
+    from signals_notebook.materials.library import Library
+
+log = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = 'media.json'
+
+
+class MaterialMedia(str, Enum):
+    CHEMICAL_DRAWING = 'drawing'
+    IMAGE = 'image'
+    BIO_SEQUENCE = 'bioSequence'
+    ATTACHMENTS = 'attachments'
+
+
+class MediaDownloadReport(BaseModel):
+    downloaded: List[str] = Field(default_factory=list)
+    skipped: List[str] = Field(default_factory=list)
+    failed: Dict[str, str] = Field(default_factory=dict)
+
+
+class MediaDownloader(ManifestFileExporter[Union[Material, str]]):
+    """Download media files of library materials to FSHandler using a bounded pool of threads.
+
+    Downloaded files are recorded with material digests in manifest file, so files of unchanged materials
+    are skipped when download is repeated.
+    """
+
+    def __init__(
+        self,
+        library: 'Library',
+        fs_handler: FSHandler,
+        base_path: str,
+        media: Sequence[MaterialMedia] = (MaterialMedia.CHEMICAL_DRAWING,),
+        drawing_format: Optional[ChemicalDrawingFormat] = None,
+        skip_existing: bool = True,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ):
+        """
+        Args:
+            library: library of materials
+            fs_handler: FSHandler where files are written
+            base_path: base path of library media
+            media: kinds of media to download
+            drawing_format: format of chemical drawings
+            skip_existing: skip files downloaded before for unchanged materials
+            progress: function which is called with numbers of processed and all materials
+        """
+        super().__init__(fs_handler, fs_handler.join_path(base_path, library.name), MANIFEST_FILE_NAME, progress)
+        self.library = library
+        self.media = media
+        self.drawing_format = drawing_format
+        self.skip_existing = skip_existing
+
+    def _get_files(self, material: Material) -> Iterable[Tuple[str, Callable[[], File]]]:
+        for media in self.media:
+            key = f'{material.eid}/{media.value}'
+            if media == MaterialMedia.CHEMICAL_DRAWING:
+                yield key, lambda: material.get_chemical_drawing(self.drawing_format)
+            elif media == MaterialMedia.IMAGE:
+                yield key, material.get_image
+            elif media == MaterialMedia.BIO_SEQUENCE:
+                yield key, material.get_bio_sequence
+            else:
+                for _, field in material._material_fields.items():
+                    if field.value and isinstance(field.definition, AttachedFileFieldDefinition):
+                        field_id = field.definition.id
+                        yield f'{key}/{field_id}', lambda field_id=field_id: material.get_attachment(field_id)
+
+    def _download_file(self, material: Material, key: str, get_file: Callable[[], File]) -> None:
+        cached = self._get_entry(key)
+        if self.skip_existing and cached and cached['digest'] == material.digest:
+            self._skip(key)
+            return
+
+        try:
+            file = get_file()
+            path = self.fs_handler.join_path(self.base_path, material.name, file.name)
+            self._save(key, path, file.content, {'digest': material.digest})
+        except Exception as e:
+            self._fail(key, e)
+
+    def _get_key(self, item: Union[Material, str]) -> str:
+        return str(item)
+
+    def _export_item(self, item: Union[Material, str]) -> None:
+        material = self.library.get_asset(item) if isinstance(item, str) else item
+        for key, get_file in self._get_files(material):
+            self._download_file(material, key, get_file)
+
+    def download(
+        self, materials: Iterable[Union[Material, str]], concurrency: int = DEFAULT_CONCURRENCY
+    ) -> MediaDownloadReport:
+        """Download media files of materials
+
+        Args:
+            materials: Material objects or asset names
+            concurrency: max number of simultaneously processed materials
+
+        Returns:
+            MediaDownloadReport
+        """
+        self.run(materials, concurrency)
+        report = MediaDownloadReport(downloaded=self.written, skipped=self.skipped, failed=self.failed)
+
+        log.debug(
+            'Media of %s are downloaded: %s files, %s skipped, %s failed',
+            self.library.eid,
+            len(report.downloaded),
+            len(report.skipped),
+            len(report.failed),
+        )
+        return report
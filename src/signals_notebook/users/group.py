@@ -1,13 +1,15 @@
 import json
 import logging
 from datetime import datetime
-from typing import cast, Generator, Literal
+from typing import cast, Generator, Iterable, Literal
 
 from pydantic import BaseModel, Field
 
 from signals_notebook.api import SignalsNotebookApi
 from signals_notebook.common_types import ObjectType, Response, ResponseData
 from signals_notebook.users.user import User
+from signals_notebook.users.user_registry import UserRegistry
+from signals_notebook.utils.concurrency import DEFAULT_CONCURRENCY, map_concurrently
 
 
 log = logging.getLogger(__name__)
@@ -145,35 +147,53 @@ class Group(BaseModel):
         )
         log.debug('Group: %s was disabled successfully', self.id)
 
-    def get_members(self) -> list[User]:
-        """Get user group members
-
-        Returns:
-            Users
-        """
-        log.debug('Get Group Members')
-
+    def _get_member_ids(self) -> list[str]:
         api = SignalsNotebookApi.get_default_api()
         response = api.call(
             method='GET',
             path=(self._get_endpoint(), self.id, 'members'),
         )
+        result = response.json()
+        member_ids = [user['id'] for user in result['data']]
 
-        log.debug('Group members were got successfully.')
-        return [User.get(user['id']) for user in response.json()['data']]
+        while (result.get('links') or {}).get('next'):
+            response = api.call(
+                method='GET',
+                path=result['links']['next'],
+            )
+            result = response.json()
+            member_ids.extend(user['id'] for user in result['data'])
 
-    def add_user(self, user: User, force: bool = True) -> list[User]:
-        """Add user to user group
+        return list(dict.fromkeys(member_ids))
+
+    def get_members(self, concurrency: int = DEFAULT_CONCURRENCY) -> list[User]:
+        """Get user group members.
+
+        Users which are not present in UserRegistry are fetched concurrently.
 
         Args:
-            user: User object
-            force: Force to update
+            concurrency: max number of simultaneous api calls
 
         Returns:
-            list[User]
+            Users
         """
-        log.debug('Adding members to group')
+        log.debug('Get Group Members')
+
+        member_ids = self._get_member_ids()
+        members = cast(list[User], UserRegistry.get_many(member_ids, concurrency=concurrency))
+
+        log.debug('Group members were got successfully.')
+        return members
+
+    @staticmethod
+    def _invalidate_groups_of(user: User) -> None:
+        # groups of users are memoized, the same user may be cached in UserRegistry as another object
+        user.invalidate_groups()
+        cached_user = UserRegistry.lookup(user.id)
+        if cached_user is not None:
+            cached_user.invalidate_groups()
 
+    def _post_member(self, user: User, force: bool = True) -> None:
         api = SignalsNotebookApi.get_default_api()
 
         api.call(
@@ -190,9 +210,53 @@ class Group(BaseModel):
         )
 
         log.debug('Group member: %s was added successfully', user.id)
+        self._invalidate_groups_of(user)
+
+    def add_user(self, user: User, force: bool = True) -> list[User]:
+        """Add user to user group
+
+        Args:
+            user: User object
+            force: Force to update
+
+        Returns:
+            list[User]
+        """
+        log.debug('Adding members to group')
+
+        self._post_member(user, force)
 
         return self.get_members()
 
+    def add_users(
+        self, users: Iterable[User], force: bool = True, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> list[User]:
+        """Add users to user group. Members are posted concurrently and member list is fetched once at the end,
+        given users are put to UserRegistry, so they are not fetched again.
+
+        Args:
+            users: User objects
+            force: Force to update
+            concurrency: max number of simultaneous api calls
+
+        Returns:
+            list[User]
+        """
+        users = list({user.id: user for user in users}.values())
+        log.debug('Adding %s members to group', len(users))
+
+        results = map_concurrently(lambda user: self._post_member(user, force), users, concurrency)
+        for user, result in zip(users, results):
+            if not isinstance(result, Exception):
+                UserRegistry.put(user)
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            log.debug('%s of %s members were not added', len(errors), len(users))
+            raise errors[0]
+
+        return self.get_members(concurrency=concurrency)
+
     def delete_user(self, user: User) -> None:
         """Delete user from user group.
 
@@ -211,6 +275,7 @@ class Group(BaseModel):
             path=(self._get_endpoint(), self.id, 'members', user.id),
         )
         log.debug('Group member: %s was deleted successfully', user.id)
+        self._invalidate_groups_of(user)
 
 
 class GroupResponse(Response[Group]):
@@ -0,0 +1,219 @@
+import logging
+import threading
+from typing import cast, Dict, Iterable, List, Optional, Set
+
+from signals_notebook.users.group import Group
+from signals_notebook.users.user import User
+from signals_notebook.users.user_registry import UserRegistry
+from signals_notebook.utils.concurrency import DEFAULT_CONCURRENCY, map_concurrently
+
+log = logging.getLogger(__name__)
+
+
+class MembershipGraph:
+    """Group-user membership graph for answering membership questions without api calls.
+
+    The graph is built from the groups list and member listings of all groups, which are fetched concurrently.
+    Members are held as sets of user ids per group with a reverse index of group ids per user.
+    Single groups can be refreshed without rebuilding the whole graph.
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Args:
+            concurrency: max number of simultaneous api calls
+        """
+        self.concurrency = concurrency
+        self._groups: Dict[str, Group] = {}
+        self._members: Dict[str, Set[str]] = {}
+        self._user_groups: Dict[str, Set[str]] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def build(cls, concurrency: int = DEFAULT_CONCURRENCY) -> 'MembershipGraph':
+        """Build graph of all groups
+
+        Args:
+            concurrency: max number of simultaneous api calls
+
+        Returns:
+            MembershipGraph
+        """
+        graph = cls(concurrency=concurrency)
+        graph.refresh()
+
+        return graph
+
+    def _set_members(self, group: Group, member_ids: Iterable[str]) -> None:
+        self._unlink(group.id)
+        self._groups[group.id] = group
+        self._members[group.id] = set(member_ids)
+        for member_id in self._members[group.id]:
+            self._user_groups.setdefault(member_id, set()).add(group.id)
+
+    def _unlink(self, group_id: str) -> None:
+        for member_id in self._members.pop(group_id, set()):
+            group_ids = self._user_groups[member_id]
+            group_ids.discard(group_id)
+            if not group_ids:
+                del self._user_groups[member_id]
+
+    def _fetch_members(self, groups: List[Group]) -> None:
+        results = map_concurrently(lambda group: group._get_member_ids(), groups, self.concurrency)
+
+        with self._lock:
+            for group, member_ids in zip(groups, results):
+                if isinstance(member_ids, Exception):
+                    raise member_ids
+                self._set_members(group, member_ids)
+
+    def refresh(self) -> None:
+        """Reload all groups and their members
+
+        Returns:
+
+        """
+        log.debug('Building %s...', self.__class__.__name__)
+        groups = list(Group.get_list())
+        self._fetch_members(groups)
+
+        with self._lock:
+            group_ids = {group.id for group in groups}
+            for group_id in [group_id for group_id in self._groups if group_id not in group_ids]:
+                self.remove_group(group_id)
+
+        log.debug('%s contains %s groups and %s users', self.__class__.__name__, len(groups), len(self._user_groups))
+
+    def refresh_group(self, group: Group) -> None:
+        """Reload members of one group
+
+        Args:
+            group: Group object
+
+        Returns:
+
+        """
+        self._fetch_members([group])
+
+    def refresh_groups(self, groups: Iterable[Group]) -> None:
+        """Reload members of given groups concurrently
+
+        Args:
+            groups: Group objects
+
+        Returns:
+
+        """
+        self._fetch_members(list(groups))
+
+    def remove_group(self, group_id: str) -> None:
+        """Drop group from the graph, e.g. after it is deleted
+
+        Args:
+            group_id: group id
+
+        Returns:
+
+        """
+        with self._lock:
+            self._unlink(group_id)
+            self._groups.pop(group_id, None)
+
+    @property
+    def groups(self) -> List[Group]:
+        """Get all groups of the graph
+
+        Returns:
+            list[Group]
+        """
+        return list(self._groups.values())
+
+    def get_group(self, group_id: str) -> Optional[Group]:
+        """Get group of the graph by id
+
+        Args:
+            group_id: group id
+
+        Returns:
+            Optional[Group]
+        """
+        return self._groups.get(group_id)
+
+    def get_member_ids(self, group_id: str) -> Set[str]:
+        """Get ids of group members
+
+        Args:
+            group_id: group id
+
+        Returns:
+            set of user ids
+        """
+        with self._lock:
+            return set(self._members.get(group_id, set()))
+
+    def get_group_ids(self, user_id: str) -> Set[str]:
+        """Get ids of groups where user is a member
+
+        Args:
+            user_id: user id
+
+        Returns:
+            set of group ids
+        """
+        with self._lock:
+            return set(self._user_groups.get(user_id, set()))
+
+    def get_groups(self, user_id: str) -> List[Group]:
+        """Get groups where user is a member
+
+        Args:
+            user_id: user id
+
+        Returns:
+            list[Group]
+        """
+        with self._lock:
+            group_ids = self._user_groups.get(user_id, set())
+
+            return [group for group_id, group in self._groups.items() if group_id in group_ids]
+
+    def users_in_any(self, group_ids: Iterable[str]) -> Set[str]:
+        """Get ids of users which are members of at least one of given groups
+
+        Args:
+            group_ids: group ids
+
+        Returns:
+            set of user ids
+        """
+        with self._lock:
+            return set().union(*(self._members.get(group_id, set()) for group_id in group_ids))
+
+    def users_in_all(self, group_ids: Iterable[str]) -> Set[str]:
+        """Get ids of users which are members of all given groups
+
+        Args:
+            group_ids: group ids
+
+        Returns:
+            set of user ids
+        """
+        with self._lock:
+            member_sets = sorted((self._members.get(group_id, set()) for group_id in group_ids), key=len)
+            if not member_sets:
+                return set()
+
+            return set(member_sets[0]).intersection(*member_sets[1:])
+
+    def get_members(self, group_id: str) -> List[User]:
+        """Get members of the group, users which are not present in UserRegistry are fetched concurrently
+
+        Args:
+            group_id: group id
+
+        Returns:
+            list[User]
+        """
+        member_ids = sorted(self.get_member_ids(group_id))
+
+        return cast(List[User], UserRegistry.get_many(member_ids, concurrency=self.concurrency))
@@ -0,0 +1,119 @@
+import hashlib
+import logging
+from http import HTTPStatus
+from typing import Callable, cast, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel, Field
+
+from signals_notebook.common_types import File
+from signals_notebook.users.user import User
+from signals_notebook.utils.concurrency import DEFAULT_CONCURRENCY
+from signals_notebook.utils.file_exporter import ManifestFileExporter
+from signals_notebook.utils.fs_handler import FSHandler
+
+log = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = 'pictures.json'
+
+
+class PictureExportReport(BaseModel):
+    exported: List[str] = Field(default_factory=list)
+    skipped: List[str] = Field(default_factory=list)
+    failed: Dict[str, str] = Field(default_factory=dict)
+
+
+class _PictureExporter(ManifestFileExporter[User]):
+    def __init__(
+        self,
+        fs_handler: FSHandler,
+        base_path: str,
+        skip_unchanged: bool,
+        progress: Optional[Callable[[int, int], None]],
+    ):
+        super().__init__(fs_handler, base_path, MANIFEST_FILE_NAME, progress)
+        self.skip_unchanged = skip_unchanged
+
+    def _get_headers(self, user: User) -> Dict[str, str]:
+        cached = self._get_entry(user.id)
+        if not self.skip_unchanged or not cached:
+            return {}
+
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        return headers
+
+    def _get_key(self, item: User) -> str:
+        return item.id
+
+    def _export_item(self, item: User) -> None:
+        response = item._get_picture(self._get_headers(item))
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            self._skip(item.id)
+            return
+
+        if response.content == b'':
+            self._forget(item.id)
+            return
+
+        picture = cast(File, item._set_picture(response))
+
+        path = self.fs_handler.join_path(self.base_path, item.id, picture.name)
+        digest = hashlib.sha256(picture.content).hexdigest()
+        cached = self._get_entry(item.id)
+        # server may not support conditional requests, unchanged content is not written again
+        is_unchanged = (
+            self.skip_unchanged and cached is not None and cached['path'] == path and cached.get('digest') == digest
+        )
+        entry = {
+            'digest': digest,
+            'etag': response.headers.get('etag', ''),
+            'last_modified': response.headers.get('last-modified', ''),
+        }
+        self._save(item.id, path, picture.content, entry, is_unchanged)
+
+    def export(self, users: List[User], concurrency: int) -> PictureExportReport:
+        self.run(users, concurrency)
+
+        return PictureExportReport(exported=self.written, skipped=self.skipped, failed=self.failed)
+
+
+def export_pictures(
+    users: Iterable[User],
+    fs_handler: FSHandler,
+    base_path: str = 'pictures',
+    concurrency: int = DEFAULT_CONCURRENCY,
+    skip_unchanged: bool = True,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> PictureExportReport:
+    """Download pictures of users concurrently and write them to FSHandler.
+
+    ETag and Last-Modified of downloaded pictures are recorded in manifest file and sent back
+    as conditional request headers, so unchanged pictures are not downloaded again.
+    Pictures with unchanged content are not written again.
+
+    Args:
+        users: User objects
+        fs_handler: FSHandler where files are written
+        base_path: base path of pictures
+        concurrency: max number of simultaneous downloads
+        skip_unchanged: send conditional requests for pictures which were exported before
+        progress: function which is called with numbers of processed and all users
+
+    Returns:
+        PictureExportReport
+    """
+    users = list({user.id: user for user in users}.values())
+    exporter = _PictureExporter(fs_handler, base_path, skip_unchanged, progress)
+    report = exporter.export(users, concurrency)
+
+    log.debug(
+        'Pictures are exported: %s files, %s skipped, %s failed',
+        len(report.exported),
+        len(report.skipped),
+        len(report.failed),
+    )
+    return report
@@ -56,6 +56,15 @@ class Role(BaseModel):
         result = RoleResponse(**response.json())
         yield from [cast(ResponseData, item).body for item in result.data]
 
+        while result.links and result.links.next:
+            response = api.call(
+                method='GET',
+                path=result.links.next,
+            )
+
+            result = RoleResponse(**response.json())
+            yield from [cast(ResponseData, item).body for item in result.data]
+
         log.debug('List of Roles were got successfully.')
 
     @classmethod
@@ -0,0 +1,37 @@
+import logging
+from typing import Iterable
+
+from signals_notebook.users.role import Role
+from signals_notebook.utils.registry import ListedTTLRegistry
+
+log = logging.getLogger(__name__)
+
+
+class RoleRegistry(ListedTTLRegistry[Role]):
+    """Process-wide cache of tenant roles keyed by role id.
+
+    All roles are fetched with a single call of the roles list and shared by all users.
+    """
+
+    @classmethod
+    def _list(cls) -> Iterable[Role]:
+        return Role.get_list()
+
+    @classmethod
+    def get(cls, role_id: str) -> Role:
+        """Get role by id. Falls back to fetching the role if it is not present in the roles list.
+
+        Args:
+            role_id: role id
+
+        Returns:
+            Role
+        """
+        role = cls.lookup(role_id)
+        if role:
+            return role
+
+        role = Role.get(role_id)
+        cls.put(role, role_id)
+
+        return role
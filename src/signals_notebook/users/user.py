@@ -3,18 +3,23 @@ import json
 import logging
 import mimetypes
 from datetime import datetime
-from typing import Any, cast, Generator, Optional, TYPE_CHECKING, Union
+from typing import Any, cast, Generator, Iterable, Optional, TYPE_CHECKING, Union
 
+import requests
 from pydantic import BaseModel, Field, PrivateAttr
 
 from signals_notebook.api import SignalsNotebookApi
 from signals_notebook.common_types import File, Response, ResponseData
 from signals_notebook.users.role import Role
+from signals_notebook.users.role_registry import RoleRegistry
+from signals_notebook.utils.concurrency import DEFAULT_CONCURRENCY
 
 log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from signals_notebook.users.group import Group
+    from signals_notebook.users.user_directory import UserDirectory
+    from signals_notebook.users.user_provisioning import UserRecord, UserUpsertResult
 
 
 class Licence(BaseModel):
@@ -61,7 +66,7 @@ class User(BaseUser):
     organization: str = Field(alias='organization')
     last_login_at: Optional[datetime] = Field(alias='lastLoginAt', allow_mutation=False)
     _picture: Optional[File] = PrivateAttr(default=None)
-    _groups: list['Group'] = PrivateAttr(default=[])
+    _groups: Optional[list['Group']] = PrivateAttr(default=None)
     _roles: list[Role] = PrivateAttr(default=[])
     _relationships: dict[str, Any] = PrivateAttr(default={})
 
@@ -72,7 +77,7 @@ class User(BaseUser):
     def roles(self) -> list[Role]:
         if self._roles:
             return self._roles
-        self._roles = [Role.get(role['id']) for role in self._relationships['roles']['data']]
+        self._roles = [RoleRegistry.get(role['id']) for role in self._relationships['roles']['data']]
         return self._roles
 
     @classmethod
@@ -230,6 +235,30 @@ class User(BaseUser):
 
         return user
 
+    @classmethod
+    def bulk_upsert(
+        cls,
+        records: Iterable['UserRecord'],
+        directory: Optional['UserDirectory'] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retries: int = 2,
+    ) -> list['UserUpsertResult']:
+        """Create users which don't exist and update existing ones, users are matched by email.
+        Roles of created users are resolved through RoleRegistry.
+
+        Args:
+            records: UserRecord objects
+            directory: snapshot of existing users, a new one is loaded if it is not given
+            concurrency: max number of simultaneously processed records
+            retries: max number of retries of one request failed with transient error
+
+        Returns:
+            list of UserUpsertResult in order of records
+        """
+        from signals_notebook.users.user_provisioning import bulk_upsert
+
+        return bulk_upsert(records, directory=directory, concurrency=concurrency, retries=retries)
+
     def refresh(self) -> None:
         """Refresh user with new changes values
 
@@ -287,16 +316,12 @@ class User(BaseUser):
         )
         log.debug('User: %s was disabled successfully', self.id)
 
-    @property
-    def picture(self) -> Optional[File]:
-        if self._picture:
-            return self._picture
-
+    def _get_picture(self, headers: Optional[dict[str, str]] = None) -> requests.Response:
         api = SignalsNotebookApi.get_default_api()
-        response = api.call(
-            method='GET',
-            path=(self._get_endpoint(), self.id, 'picture'),
-        )
+
+        return api.call(method='GET', path=(self._get_endpoint(), self.id, 'picture'), headers=headers)
+
+    def _set_picture(self, response: requests.Response) -> Optional[File]:
         if response.content == b'':
             return self._picture
 
@@ -309,11 +334,18 @@ class User(BaseUser):
         self._picture = File(name=file_name, content=response.content, content_type=content_type)
         return self._picture
 
+    @property
+    def picture(self) -> Optional[File]:
+        if self._picture:
+            return self._picture
+
+        return self._set_picture(self._get_picture())
+
     @property
     def groups(self) -> list['Group']:
         from signals_notebook.users.group import GroupResponse
 
-        if self._groups:
+        if self._groups is not None:
             return self._groups
 
         api = SignalsNotebookApi.get_default_api()
@@ -328,7 +360,16 @@ class User(BaseUser):
 
         log.debug('List of groups was got successfully.')
 
-        return [cast(ResponseData, item).body for item in result.data]
+        self._groups = [cast(ResponseData, item).body for item in result.data]
+        return self._groups
+
+    def invalidate_groups(self) -> None:
+        """Drop memoized groups, they are fetched again on next access
+
+        Returns:
+
+        """
+        self._groups = None
 
 
 class UserResponse(Response[User]):
@@ -0,0 +1,225 @@
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from signals_notebook.users.group import Group
+from signals_notebook.users.membership_graph import MembershipGraph
+from signals_notebook.users.user import User
+from signals_notebook.users.user_registry import UserRegistry
+from signals_notebook.utils.concurrency import DEFAULT_CONCURRENCY
+
+log = logging.getLogger(__name__)
+
+
+def _normalize(value: Optional[str]) -> str:
+    return (value or '').strip().lower()
+
+
+class UserDirectory:
+    """Local snapshot of all users of the tenant indexed by id, email, username and name.
+
+    Users are loaded once with paged User.get_list and lookups are answered without api calls.
+    The snapshot is refreshed on access when it is older than refresh_interval seconds,
+    only added, changed and removed users are reindexed. Group memberships are loaded in bulk on first use.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        refresh_interval: Optional[float] = 300,
+        page_size: int = 100,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        """
+        Args:
+            enabled: load activated or deactivated users
+            refresh_interval: max age(seconds) of the snapshot, if None the snapshot is refreshed only explicitly
+            page_size: number of users fetched with one api call
+            concurrency: max number of simultaneous api calls to load group memberships
+        """
+        self.enabled = enabled
+        self.refresh_interval = refresh_interval
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.refreshed_at: Optional[float] = None
+        self._users: Dict[str, User] = {}
+        self._by_email: Dict[str, User] = {}
+        self._by_username: Dict[str, User] = {}
+        self._by_name: Dict[str, Dict[str, User]] = {}
+        self._membership_graph: Optional[MembershipGraph] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        self._ensure_fresh()
+        return len(self._users)
+
+    def _ensure_fresh(self) -> None:
+        with self._lock:
+            if self.refreshed_at is None:
+                self.refresh()
+            elif self.refresh_interval is not None and time.monotonic() - self.refreshed_at > self.refresh_interval:
+                self.refresh()
+
+    def _index(self, user: User) -> None:
+        self._users[user.id] = user
+        self._by_email[_normalize(user.email)] = user
+        self._by_username[_normalize(user.username)] = user
+        self._by_name.setdefault(_normalize(f'{user.first_name} {user.last_name}'), {})[user.id] = user
+
+    def _unindex(self, user: User) -> None:
+        self._users.pop(user.id, None)
+        if self._by_email.get(_normalize(user.email)) is user:
+            del self._by_email[_normalize(user.email)]
+        if self._by_username.get(_normalize(user.username)) is user:
+            del self._by_username[_normalize(user.username)]
+        name = _normalize(f'{user.first_name} {user.last_name}')
+        self._by_name.get(name, {}).pop(user.id, None)
+        if not self._by_name.get(name):
+            self._by_name.pop(name, None)
+
+    def refresh(self) -> Tuple[int, int, int]:
+        """Reload users list and reindex users which were added, changed or removed since last refresh
+
+        Returns:
+            numbers of added, changed and removed users
+        """
+        log.debug('Refreshing %s...', self.__class__.__name__)
+        users = {user.id: user for user in User.get_list(enabled=self.enabled, limit=self.page_size)}
+
+        added = changed = 0
+        with self._lock:
+            removed = [user_id for user_id in self._users if user_id not in users]
+            for user_id in removed:
+                self._unindex(self._users[user_id])
+                UserRegistry.invalidate(user_id)
+
+            for user_id, user in users.items():
+                cached_user = self._users.get(user_id)
+                if (
+                    cached_user is not None
+                    and cached_user.dict() == user.dict()
+                    and cached_user._relationships == user._relationships
+                ):
+                    continue
+                if cached_user is None:
+                    added += 1
+                else:
+                    changed += 1
+                    self._unindex(cached_user)
+                self._index(user)
+                UserRegistry.put(user)
+
+            self.refreshed_at = time.monotonic()
+
+        log.debug(
+            '%s is refreshed: %s added, %s changed, %s removed', self.__class__.__name__, added, changed, len(removed)
+        )
+        return added, changed, len(removed)
+
+    def add(self, user: User) -> None:
+        """Add created or changed user to the snapshot without reloading it
+
+        Args:
+            user: User object
+
+        Returns:
+
+        """
+        with self._lock:
+            cached_user = self._users.get(user.id)
+            if cached_user is not None:
+                self._unindex(cached_user)
+            self._index(user)
+        UserRegistry.put(user)
+
+    def get(self, user_id: str) -> Optional[User]:
+        """Get user by id
+
+        Args:
+            user_id: user id
+
+        Returns:
+            Optional[User]
+        """
+        self._ensure_fresh()
+        return self._users.get(user_id)
+
+    def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email, case insensitive
+
+        Args:
+            email: email of the user
+
+        Returns:
+            Optional[User]
+        """
+        self._ensure_fresh()
+        return self._by_email.get(_normalize(email))
+
+    def get_by_username(self, username: str) -> Optional[User]:
+        """Get user by user name, case insensitive
+
+        Args:
+            username: user name
+
+        Returns:
+            Optional[User]
+        """
+        self._ensure_fresh()
+        return self._by_username.get(_normalize(username))
+
+    def find_by_name(self, first_name: str, last_name: str) -> List[User]:
+        """Find users by first and last name, case insensitive
+
+        Args:
+            first_name: first name of the user
+            last_name: last name of the user
+
+        Returns:
+            list[User]
+        """
+        self._ensure_fresh()
+        return list(self._by_name.get(_normalize(f'{first_name} {last_name}'), {}).values())
+
+    def get_list(self) -> List[User]:
+        """Get all users of the snapshot
+
+        Returns:
+            list[User]
+        """
+        self._ensure_fresh()
+        return list(self._users.values())
+
+    @property
+    def membership_graph(self) -> MembershipGraph:
+        """Get group membership graph, it is built on first access
+
+        Returns:
+            MembershipGraph
+        """
+        with self._lock:
+            if self._membership_graph is None:
+                self._membership_graph = MembershipGraph.build(concurrency=self.concurrency)
+
+            return self._membership_graph
+
+    def get_groups(self, user_id: str) -> List[Group]:
+        """Get groups of the user. Members of all groups are loaded concurrently on first call.
+
+        Args:
+            user_id: user id
+
+        Returns:
+            list[Group]
+        """
+        return self.membership_graph.get_groups(user_id)
+
+    def invalidate_groups(self) -> None:
+        """Drop loaded group memberships, they are loaded again on next access
+
+        Returns:
+
+        """
+        with self._lock:
+            self._membership_graph = None
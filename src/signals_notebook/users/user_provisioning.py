@@ -0,0 +1,193 @@
+import logging
+import time
+from enum import Enum
+from http import HTTPStatus
+from typing import Callable, cast, Dict, Iterable, List, Optional, TypeVar
+
+import requests
+from pydantic import BaseModel, Field
+
+from signals_notebook.exceptions import SignalsNotebookError
+from signals_notebook.users.role import Role
+from signals_notebook.users.role_registry import RoleRegistry
+from signals_notebook.users.user import User
+from signals_notebook.users.user_directory import UserDirectory
+from signals_notebook.utils.concurrency import DEFAULT_CONCURRENCY, map_concurrently
+
+log = logging.getLogger(__name__)
+
+ResultType = TypeVar('ResultType')
+
+UPDATABLE_FIELDS = ('alias', 'country', 'first_name', 'last_name', 'organization')
+
+
+class UserRecord(BaseModel):
+    email: str
+    first_name: str = Field(alias='firstName')
+    last_name: str = Field(alias='lastName')
+    country: str
+    organization: str
+    alias: Optional[str] = None
+    roles: List[str] = Field(default_factory=list)
+    """role ids or names, they are assigned to created users"""
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class UpsertAction(str, Enum):
+    CREATED = 'created'
+    UPDATED = 'updated'
+    UNCHANGED = 'unchanged'
+    FAILED = 'failed'
+
+
+class UserUpsertResult(BaseModel):
+    email: str
+    action: UpsertAction
+    user_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+def _is_transient(error: Exception) -> bool:
+    if isinstance(error, requests.RequestException):
+        return True
+    if isinstance(error, SignalsNotebookError):
+        status = error.parsed_response.errors[0].status
+        return status.isdigit() and (int(status) == HTTPStatus.TOO_MANY_REQUESTS or int(status) >= 500)
+
+    return False
+
+
+def _with_retries(
+    func: Callable[[], ResultType],
+    retries: int,
+    retry_delay: float,
+    before_retry: Optional[Callable[[], Optional[ResultType]]] = None,
+) -> ResultType:
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except Exception as e:
+            if attempt == retries or not _is_transient(e):
+                raise
+            log.debug('Retrying after error: %s', e)
+            time.sleep(retry_delay * 2**attempt)
+            # a request may have succeeded on server before the error
+            result = before_retry() if before_retry else None
+            if result is not None:
+                return result
+
+    raise AssertionError('unreachable')
+
+
+class _UserProvisioner:
+    def __init__(self, directory: UserDirectory, retries: int, retry_delay: float):
+        self.directory = directory
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self._roles: Dict[str, Role] = {}
+        for role in RoleRegistry.get_list():
+            self._roles[role.name.casefold()] = role
+            self._roles[role.id] = role
+
+    def _get_roles(self, record: UserRecord) -> List[Role]:
+        roles = []
+        for role_key in record.roles:
+            role = self._roles.get(role_key) or self._roles.get(role_key.casefold())
+            if role is None:
+                raise ValueError(f'Unknown role: {role_key}')
+            roles.append(role)
+
+        return roles
+
+    def _find_created_user(self, email: str) -> Optional[User]:
+        for user in User.get_list(q=email):
+            if user.email.casefold() == email.casefold():
+                return user
+
+        return None
+
+    def _create(self, record: UserRecord) -> UserUpsertResult:
+        roles = self._get_roles(record)
+        user = _with_retries(
+            lambda: User.create(
+                alias=record.alias or '',
+                country=record.country,
+                email=record.email,
+                first_name=record.first_name,
+                last_name=record.last_name,
+                organization=record.organization,
+                roles=roles,
+            ),
+            self.retries,
+            self.retry_delay,
+            before_retry=lambda: self._find_created_user(record.email),
+        )
+        self.directory.add(user)
+
+        return UserUpsertResult(email=record.email, action=UpsertAction.CREATED, user_id=user.id)
+
+    def _update(self, user: User, record: UserRecord) -> UserUpsertResult:
+        changes = {
+            field: getattr(record, field)
+            for field in UPDATABLE_FIELDS
+            if getattr(record, field) is not None and getattr(record, field) != getattr(user, field)
+        }
+        if not changes:
+            return UserUpsertResult(email=record.email, action=UpsertAction.UNCHANGED, user_id=user.id)
+
+        # the directory keeps indexing the cached user by its old values until the changed copy is saved
+        changed_user = user.copy(update=changes)
+        _with_retries(changed_user.save, self.retries, self.retry_delay)
+        self.directory.add(changed_user)
+
+        return UserUpsertResult(email=record.email, action=UpsertAction.UPDATED, user_id=user.id)
+
+    def upsert(self, record: UserRecord) -> UserUpsertResult:
+        try:
+            user = self.directory.get_by_email(record.email)
+            return self._create(record) if user is None else self._update(user, record)
+        except Exception as e:
+            log.debug('Cannot upsert user %s: %s', record.email, e)
+            return UserUpsertResult(email=record.email, action=UpsertAction.FAILED, error=str(e))
+
+
+def bulk_upsert(
+    records: Iterable[UserRecord],
+    directory: Optional[UserDirectory] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    retries: int = 2,
+    retry_delay: float = 1,
+) -> List[UserUpsertResult]:
+    """Create users which don't exist and update existing ones, users are matched by email.
+
+    Records are processed concurrently, requests failed with transient errors are retried
+    with exponential delay. Create is not repeated if the user has appeared since the failed request.
+
+    Args:
+        records: UserRecord objects
+        directory: snapshot of existing users, a new one is loaded if it is not given
+        concurrency: max number of simultaneously processed records
+        retries: max number of retries of one request
+        retry_delay: delay(seconds) before the first retry
+
+    Returns:
+        results in order of records, records with the same email get the same result
+    """
+    records = list(records)
+    if directory is None:
+        directory = UserDirectory()
+    provisioner = _UserProvisioner(directory, retries, retry_delay)
+
+    unique_records: Dict[str, UserRecord] = {}
+    for record in records:
+        unique_records.setdefault(record.email.casefold(), record)
+    results = map_concurrently(provisioner.upsert, unique_records.values(), concurrency)
+    results_by_email = dict(zip(unique_records, cast(List[UserUpsertResult], results)))
+
+    log.debug(
+        'Users were upserted: %s',
+        {action.value: sum(result.action == action for result in results_by_email.values()) for action in UpsertAction},
+    )
+    return [results_by_email[record.email.casefold()] for record in records]
@@ -0,0 +1,73 @@
+import logging
+from typing import cast, Dict, Iterable, List, Union
+
+from signals_notebook.users.user import User
+from signals_notebook.utils.concurrency import DEFAULT_CONCURRENCY, map_concurrently
+from signals_notebook.utils.registry import TTLRegistry
+
+log = logging.getLogger(__name__)
+
+
+class UserRegistry(TTLRegistry[User]):
+    """Process-wide cache of users keyed by user id.
+
+    Users which are not cached or are older than ttl seconds are fetched again,
+    missing users of one request are fetched concurrently.
+    """
+
+    @classmethod
+    def get(cls, user_id: str) -> User:
+        """Get user by id, the user is fetched if it is not cached or is expired
+
+        Args:
+            user_id: user id
+
+        Returns:
+            User
+        """
+        return cast(User, cls.get_many([user_id])[0])
+
+    @classmethod
+    def _fetch(cls, user_id: str) -> User:
+        user = User.get(user_id)
+        cls.put(user)
+
+        return user
+
+    @classmethod
+    def get_many(
+        cls,
+        user_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[User, Exception]]:
+        """Get users by ids, users which are not cached are fetched concurrently
+
+        Args:
+            user_ids: user ids
+            concurrency: max number of simultaneous api calls
+            return_exceptions: if True, an exception raised for a user is returned in its place,
+                otherwise the first one is raised
+
+        Returns:
+            list of User objects in order of user ids
+        """
+        user_ids = list(user_ids)
+        users: Dict[str, Union[User, Exception]] = {}
+        for user_id in user_ids:
+            user = cls.lookup(user_id)
+            if user is not None:
+                users[user_id] = user
+
+        missing = [user_id for user_id in dict.fromkeys(user_ids) if user_id not in users]
+        if missing:
+            log.debug('Fetching %s users which are not cached', len(missing))
+            users.update(zip(missing, map_concurrently(cls._fetch, missing, concurrency)))
+
+        result = [users[user_id] for user_id in user_ids]
+        if not return_exceptions:
+            for item in result:
+                if isinstance(item, Exception):
+                    raise item
+
+        return result
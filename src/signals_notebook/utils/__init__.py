@@ -1 +1,2 @@
 from signals_notebook.utils.fs_handler import FSHandler  # noqa
+from signals_notebook.utils.concurrency import map_concurrently  # noqa
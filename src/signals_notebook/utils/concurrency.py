@@ -0,0 +1,41 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar, Union
+
+log = logging.getLogger(__name__)
+
+ItemType = TypeVar('ItemType')
+ResultType = TypeVar('ResultType')
+
+DEFAULT_CONCURRENCY = 8
+
+
+def map_concurrently(
+    func: Callable[[ItemType], ResultType],
+    items: Iterable[ItemType],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> List[Union[ResultType, Exception]]:
+    """Call function for each item using a bounded pool of threads
+
+    Args:
+        func: function to call
+        items: function arguments
+        concurrency: max number of simultaneous calls
+
+    Returns:
+        results in order of items, an exception raised for an item is returned in its place
+    """
+
+    def _call(item: ItemType) -> Union[ResultType, Exception]:
+        try:
+            return func(item)
+        except Exception as e:
+            log.debug('Error has been occurred while processing %s: %s', item, e)
+            return e
+
+    _items = list(items)
+    if concurrency <= 1 or len(_items) <= 1:
+        return [_call(item) for item in _items]
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(_items))) as executor:
+        return list(executor.map(_call, _items))
@@ -0,0 +1,120 @@
+import abc
+import json
+import logging
+import threading
+from typing import Callable, Dict, Generic, Iterable, List, Optional, TypeVar
+
+from signals_notebook.utils.concurrency import map_concurrently
+from signals_notebook.utils.fs_handler import FSHandler
+
+log = logging.getLogger(__name__)
+
+ItemType = TypeVar('ItemType')
+
+ManifestEntry = Dict[str, str]
+
+
+class ManifestFileExporter(abc.ABC, Generic[ItemType]):
+    """Base of exporters which write files of many items to FSHandler using a bounded pool of threads.
+
+    Written files are recorded in a json manifest under the base path. Subclasses compare recorded entries
+    with current state of items to skip files which have not changed since the previous export.
+    """
+
+    def __init__(
+        self,
+        fs_handler: FSHandler,
+        base_path: str,
+        manifest_file_name: str,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ):
+        """
+        Args:
+            fs_handler: FSHandler where files are written
+            base_path: base path of exported files and manifest
+            manifest_file_name: name of manifest file
+            progress: function which is called with numbers of processed and all items
+        """
+        self.fs_handler = fs_handler
+        self.base_path = base_path
+        self.manifest_path = fs_handler.join_path(base_path, manifest_file_name)
+        self.progress = progress
+        self.written: List[str] = []
+        self.skipped: List[str] = []
+        self.failed: Dict[str, str] = {}
+        self._manifest: Dict[str, ManifestEntry] = {}
+        self._processed = 0
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def _read_manifest(self) -> Dict[str, ManifestEntry]:
+        try:
+            return json.loads(self.fs_handler.read(self.manifest_path))
+        except Exception:
+            return {}
+
+    def _write_manifest(self) -> None:
+        self.fs_handler.write(self.manifest_path, json.dumps(self._manifest, indent=2))
+
+    def _get_entry(self, key: str) -> Optional[ManifestEntry]:
+        with self._lock:
+            return self._manifest.get(key)
+
+    def _skip(self, key: str) -> None:
+        with self._lock:
+            self.skipped.append(self._manifest[key]['path'])
+
+    def _save(self, key: str, path: str, content: bytes, entry: ManifestEntry, is_unchanged: bool = False) -> None:
+        if not is_unchanged:
+            self.fs_handler.write(path, content)
+
+        with self._lock:
+            self._manifest[key] = {'path': path, **entry}
+            (self.skipped if is_unchanged else self.written).append(path)
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._manifest.pop(key, None)
+
+    def _fail(self, key: str, error: Exception) -> None:
+        log.debug('Cannot export %s: %s', key, error)
+        with self._lock:
+            self.failed[key] = str(error)
+
+    @abc.abstractmethod
+    def _get_key(self, item: ItemType) -> str:
+        """Get key of the item used in failures"""
+
+    @abc.abstractmethod
+    def _export_item(self, item: ItemType) -> None:
+        """Write files of one item"""
+
+    def _export(self, item: ItemType) -> None:
+        try:
+            self._export_item(item)
+        except Exception as e:
+            self._fail(self._get_key(item), e)
+        finally:
+            with self._lock:
+                self._processed += 1
+                if self.progress:
+                    self.progress(self._processed, self._total)
+
+    def run(self, items: Iterable[ItemType], concurrency: int) -> None:
+        """Export files of items, manifest is written even if export is interrupted
+
+        Args:
+            items: exported items
+            concurrency: max number of simultaneously processed items
+
+        Returns:
+
+        """
+        items = list(items)
+        self._total = len(items)
+        self._manifest = self._read_manifest()
+
+        try:
+            map_concurrently(self._export, items, concurrency)
+        finally:
+            self._write_manifest()
@@ -5,6 +5,9 @@ class FSHandler(Protocol):
     def write(self, path: str, data: Union[bytes, str], base_alias: Optional[Iterable[str]] = None):
         """Write file content into given path."""
 
+    def write_chunks(self, path: str, chunks: Iterable[bytes], base_alias: Optional[Iterable[str]] = None):
+        """Write file content into given path chunk by chunk, without holding the whole content."""
+
     def read(self, path: str) -> bytes:
         """Return file content from given path."""
 
@@ -14,3 +17,22 @@ class FSHandler(Protocol):
     @classmethod
     def join_path(cls, *paths: str) -> str:
         """Concatenate file paths."""
+
+
+def write_chunks(fs_handler: FSHandler, path: str, chunks: Iterable[bytes]) -> None:
+    """Write file content chunk by chunk. Handlers which don't implement write_chunks get the whole content.
+
+    Args:
+        fs_handler: FSHandler where file is written
+        path: path of the file
+        chunks: chunks of file content
+
+    Returns:
+
+    """
+    handler_write_chunks = getattr(fs_handler, 'write_chunks', None)
+    if handler_write_chunks is None:
+        fs_handler.write(path, b''.join(chunks))
+        return
+
+    handler_write_chunks(path, chunks)
@@ -0,0 +1,200 @@
+import logging
+import threading
+import time
+from typing import Any, cast, ClassVar, Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
+
+log = logging.getLogger(__name__)
+
+ItemType = TypeVar('ItemType')
+
+
+class TTLRegistry(Generic[ItemType]):
+    """Base of process-wide caches of objects keyed by id. Every subclass gets its own cache and lock.
+
+    Cached objects older than ttl seconds are treated as missing.
+    """
+
+    ttl: ClassVar[float] = 300
+    """time (seconds) after which a cached object expires (float)
+    """
+    _items: ClassVar[Dict[str, Tuple[float, Any]]] = {}
+    _lock: ClassVar[threading.RLock] = threading.RLock()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._items = {}
+        cls._lock = threading.RLock()
+
+    @classmethod
+    def _get_key(cls, item: ItemType) -> str:
+        return item.id  # type: ignore
+
+    @classmethod
+    def _is_fresh(cls, cached_at: float) -> bool:
+        return time.monotonic() - cached_at <= cls.ttl
+
+    @classmethod
+    def lookup(cls, key: str) -> Optional[ItemType]:
+        """Get cached object without api calls
+
+        Args:
+            key: object id
+
+        Returns:
+            None if the object is not cached or is expired
+        """
+        with cls._lock:
+            cached = cls._items.get(key)
+            if cached is None or not cls._is_fresh(cached[0]):
+                return None
+
+            return cast(ItemType, cached[1])
+
+    @classmethod
+    def put(cls, item: ItemType, key: Optional[str] = None) -> None:
+        """Add object to the cache or replace cached one
+
+        Args:
+            item: cached object
+            key: object id. If None, id of the object is used.
+
+        Returns:
+
+        """
+        with cls._lock:
+            cls._items[cls._get_key(item) if key is None else key] = (time.monotonic(), item)
+
+    @classmethod
+    def invalidate(cls, key: Optional[str] = None) -> None:
+        """Drop one object or whole cache
+
+        Args:
+            key: object id. If None, all objects are dropped.
+
+        Returns:
+
+        """
+        with cls._lock:
+            if key is None:
+                cls._items = {}
+            else:
+                cls._items.pop(key, None)
+
+
+class ListedTTLRegistry(TTLRegistry[ItemType]):
+    """Base of registries which are filled by a single listing call.
+
+    The listing is repeated when it is older than ttl seconds or an unknown object is requested.
+    Objects which are still unknown after a listing are remembered until the cache expires.
+    Only one thread lists objects at a time, cached objects are served meanwhile.
+    """
+
+    _loaded_at: ClassVar[Optional[float]] = None
+    _misses: ClassVar[Set[str]] = set()
+    _refresh_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._loaded_at = None
+        cls._misses = set()
+        cls._refresh_lock = threading.Lock()
+
+    @classmethod
+    def _list(cls) -> Iterable[ItemType]:
+        raise NotImplementedError
+
+    @classmethod
+    def _merge(cls, cached_item: Optional[ItemType], item: ItemType) -> ItemType:
+        return item
+
+    @classmethod
+    def _is_expired(cls) -> bool:
+        return cls._loaded_at is None or not cls._is_fresh(cls._loaded_at)
+
+    @classmethod
+    def refresh(cls) -> None:
+        """Reload all objects
+
+        Returns:
+
+        """
+        log.debug('Refreshing %s...', cls.__name__)
+        items = list(cls._list())
+
+        with cls._lock:
+            now = time.monotonic()
+            cached_items = cls._items
+            cls._items = {}
+            for item in items:
+                key = cls._get_key(item)
+                cached = cached_items.get(key)
+                cls._items[key] = (now, cls._merge(cached[1] if cached else None, item))
+            cls._misses = set()
+            cls._loaded_at = now
+
+        log.debug('%s contains %s objects', cls.__name__, len(items))
+
+    @classmethod
+    def _refresh_once(cls, loaded_at: Optional[float]) -> None:
+        # threads which have seen the same stale cache wait for a single refresh
+        with cls._refresh_lock:
+            if cls._loaded_at == loaded_at:
+                cls.refresh()
+
+    @classmethod
+    def lookup(cls, key: str) -> Optional[ItemType]:
+        """Get cached object, the cache is refreshed if it is expired or the object is unknown
+
+        Args:
+            key: object id
+
+        Returns:
+            None if the object is not listed
+        """
+        with cls._lock:
+            loaded_at = cls._loaded_at
+            if not cls._is_expired() and (key in cls._items or key in cls._misses):
+                cached = cls._items.get(key)
+                return cast(ItemType, cached[1]) if cached else None
+
+        cls._refresh_once(loaded_at)
+
+        with cls._lock:
+            cached = cls._items.get(key)
+            if cached is None:
+                cls._misses.add(key)
+                return None
+
+            return cast(ItemType, cached[1])
+
+    @classmethod
+    def get_list(cls) -> List[ItemType]:
+        """Get all cached objects, the cache is refreshed if it is expired
+
+        Returns:
+            list of cached objects
+        """
+        with cls._lock:
+            loaded_at = cls._loaded_at
+            is_expired = cls._is_expired()
+        if is_expired:
+            cls._refresh_once(loaded_at)
+
+        with cls._lock:
+            return [cast(ItemType, item) for _, item in cls._items.values()]
+
+    @classmethod
+    def put(cls, item: ItemType, key: Optional[str] = None) -> None:
+        with cls._lock:
+            super().put(item, key)
+            cls._misses.discard(cls._get_key(item) if key is None else key)
+
+    @classmethod
+    def invalidate(cls, key: Optional[str] = None) -> None:
+        with cls._lock:
+            super().invalidate(key)
+            if key is None:
+                cls._misses = set()
+                cls._loaded_at = None
+            else:
+                cls._misses.discard(key)
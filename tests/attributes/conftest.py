@@ -15,3 +15,18 @@ def get_response_object(mocker):
         return mock
 
     return _f
+
+
+@pytest.fixture()
+def options_response():
+    return {
+        'links': {
+            'self': 'https://example.com/api/rest/v1.0/attributes/attribute:18/options?page[offset]=0&page[limit]=20',
+            'first': 'https://example.com/api/rest/v1.0/attributes/attribute:18/options?page[offset]=0&page[limit]=20',
+        },
+        'data': [
+            {'type': 'option', 'id': 'ladflklsjdf', 'attributes': {'key': 'ladflklsjdf', 'value': 'ladflklsjdf'}},
+            {'type': 'option', 'id': 'option2', 'attributes': {'key': 'option2', 'value': 'option2'}},
+            {'type': 'option', 'id': 'option3', 'attributes': {'key': 'option3', 'value': 'option3'}},
+        ],
+    }
@@ -77,21 +77,6 @@ def attributes_response():
     }
 
 
-@pytest.fixture()
-def options_response():
-    return {
-        'links': {
-            'self': 'https://example.com/api/rest/v1.0/attributes/attribute:18/options?page[offset]=0&page[limit]=20',
-            'first': 'https://example.com/api/rest/v1.0/attributes/attribute:18/options?page[offset]=0&page[limit]=20',
-        },
-        'data': [
-            {'type': 'option', 'id': 'ladflklsjdf', 'attributes': {'key': 'ladflklsjdf', 'value': 'ladflklsjdf'}},
-            {'type': 'option', 'id': 'option2', 'attributes': {'key': 'option2', 'value': 'option2'}},
-            {'type': 'option', 'id': 'option3', 'attributes': {'key': 'option3', 'value': 'option3'}},
-        ],
-    }
-
-
 @pytest.fixture()
 def options_response_for_update():
     def wrapper(value: str):
@@ -382,3 +367,85 @@ def test_len(api_mock, options_response, attribute_factory):
         assert isinstance(item, str)
 
     assert attribute._options != []
+
+
+def test_apply_option_changes(api_mock, options_response, attribute_factory, mocker):
+    attribute = attribute_factory()
+    api_mock.call.return_value.json.return_value = options_response
+    _ = attribute.options
+    api_mock.call.reset_mock()
+
+    attribute.apply_option_changes(
+        creates=['new1', 'new2', 'option3'],
+        updates={'option2': 'renamed'},
+        deletes=['ladflklsjdf'],
+        chunk_size=2,
+    )
+
+    path = ('attributes', attribute.id, 'options')
+    assert api_mock.call.call_args_list == [
+        mocker.call(
+            method='PATCH',
+            path=path,
+            json={
+                'data': [
+                    {'id': 'ladflklsjdf', 'type': ObjectType.ATTRIBUTE_OPTION, 'attributes': {'action': Action.DELETE}},
+                    {
+                        'id': 'option2',
+                        'type': ObjectType.ATTRIBUTE_OPTION,
+                        'attributes': {'action': Action.UPDATE, 'value': 'renamed'},
+                    },
+                ]
+            },
+        ),
+        mocker.call(
+            method='PATCH',
+            path=path,
+            json={
+                'data': [
+                    {'type': ObjectType.ATTRIBUTE_OPTION, 'attributes': {'action': Action.CREATE, 'value': 'new1'}},
+                    {'type': ObjectType.ATTRIBUTE_OPTION, 'attributes': {'action': Action.CREATE, 'value': 'new2'}},
+                ]
+            },
+        ),
+        mocker.call(
+            method='PATCH',
+            path=path,
+            json={
+                'data': [
+                    {'type': ObjectType.ATTRIBUTE_OPTION, 'attributes': {'action': Action.CREATE, 'value': 'option3'}},
+                ]
+            },
+        ),
+    ]
+    assert attribute.options == ['renamed', 'option3', 'new1', 'new2']
+
+
+def test_apply_option_changes_failed(api_mock, options_response, attribute_factory, get_response_object, mocker):
+    attribute = attribute_factory()
+    api_mock.call.side_effect = [
+        get_response_object({}),
+        ValueError('Bad request'),
+        get_response_object(options_response),
+    ]
+
+    with pytest.raises(ValueError):
+        attribute.apply_option_changes(creates=['new1', 'new2'], chunk_size=1)
+
+    assert api_mock.call.call_count == 3
+    assert api_mock.call.call_args == mocker.call(method='GET', path=('attributes', attribute.id, 'options'))
+    assert attribute.options == ['ladflklsjdf', 'option2', 'option3']
+
+
+def test_reload_options_pages(api_mock, options_response, attribute_factory, get_response_object, mocker):
+    attribute = attribute_factory()
+    next_link = 'https://example.com/api/rest/v1.0/attributes/attribute:18/options?page[offset]=3&page[limit]=3'
+    first_page = {**options_response, 'links': {**options_response['links'], 'next': next_link}}
+    second_page = {
+        'links': {'self': next_link},
+        'data': [{'type': 'option', 'id': 'option4', 'attributes': {'key': 'option4', 'value': 'option4'}}],
+    }
+    api_mock.call.side_effect = [get_response_object(first_page), get_response_object(second_page)]
+
+    assert attribute.options == ['ladflklsjdf', 'option2', 'option3', 'option4']
+    api_mock.call.assert_called_with(method='GET', path=next_link)
@@ -0,0 +1,63 @@
+from uuid import uuid4
+
+from signals_notebook.attributes import AttributeRegistry
+from signals_notebook.entities.tables.cell import AttributeListColumnDefinition, ColumnDataType
+
+
+def test_get_cached(api_mock, attribute_factory, mocker):
+    attribute = attribute_factory()
+    attribute_get_mock = mocker.patch('signals_notebook.attributes.Attribute.get', return_value=attribute)
+
+    assert AttributeRegistry.get(attribute.id) is attribute
+    assert AttributeRegistry.get(attribute.id) is attribute
+    attribute_get_mock.assert_called_once_with(attribute.id)
+
+    mocker.patch.object(AttributeRegistry, 'ttl', -1)
+    AttributeRegistry.get(attribute.id)
+
+    assert attribute_get_mock.call_count == 2
+
+
+def test_get_options(api_mock, attribute_factory, options_response, mocker):
+    attribute = attribute_factory()
+    mocker.patch('signals_notebook.attributes.Attribute.get', return_value=attribute)
+    api_mock.call.return_value.json.return_value = options_response
+
+    assert AttributeRegistry.get_options(attribute.id) == ['ladflklsjdf', 'option2', 'option3']
+    assert AttributeRegistry.get_options(attribute.id) == ['ladflklsjdf', 'option2', 'option3']
+    api_mock.call.assert_called_once()
+
+
+def test_update_after_option_changes(api_mock, attribute_factory, mocker):
+    cached_attribute = attribute_factory()
+    mocker.patch('signals_notebook.attributes.Attribute.get', return_value=cached_attribute)
+    AttributeRegistry.get(cached_attribute.id)
+    attribute = attribute_factory(id=cached_attribute.id)
+    other_attribute = attribute_factory()
+
+    attribute.apply_option_changes(creates=['new'])
+    other_attribute.apply_option_changes(creates=['new'])
+
+    assert AttributeRegistry.lookup(attribute.id) is attribute
+    assert AttributeRegistry.lookup(other_attribute.id) is None
+
+
+def test_attribute_list_column(attribute_factory, mocker):
+    attribute = attribute_factory()
+    attribute_get_mock = mocker.patch('signals_notebook.attributes.Attribute.get', return_value=attribute)
+    attribute_list_eid = f'attributeList:{uuid4()}'
+    columns = [
+        AttributeListColumnDefinition(
+            key=uuid4(),
+            title='Site',
+            type=ColumnDataType.ATTRIBUTE_LIST,
+            options=[],
+            attributeListEid=attribute_list_eid,
+            multiSelect=False,
+        )
+        for _ in range(2)
+    ]
+
+    assert columns[0].attribute is attribute
+    assert columns[1].attribute is attribute
+    attribute_get_mock.assert_called_once_with(attribute_list_eid)
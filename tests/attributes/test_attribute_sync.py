@@ -0,0 +1,111 @@
+import pytest
+
+from signals_notebook.attributes import AttributeSync, OptionDiff
+from signals_notebook.attributes.attribute_sync import diff_options
+
+
+@pytest.mark.parametrize(
+    'current, desired, renames, expected',
+    [
+        (['a', 'b'], ['a', 'b'], None, OptionDiff()),
+        (['a', 'b'], ['b', 'c'], None, OptionDiff(creates=['c'], deletes=['a'])),
+        (['Site A', 'Lab'], ['site_a', 'Lab'], None, OptionDiff(updates={'Site A': 'site_a'})),
+        (
+            ['Boston Site', 'Lab'],
+            ['Boston Sites', 'Lab'],
+            None,
+            OptionDiff(creates=['Boston Sites'], deletes=['Boston Site']),
+        ),
+        (['Lot-2023-01'], ['Lot-2023-02'], None, OptionDiff(creates=['Lot-2023-02'], deletes=['Lot-2023-01'])),
+        (['Boston', 'Lab'], ['Chicago', 'Lab'], None, OptionDiff(creates=['Chicago'], deletes=['Boston'])),
+        (['Boston', 'Lab'], ['Chicago', 'Lab'], {'Boston': 'Chicago'}, OptionDiff(updates={'Boston': 'Chicago'})),
+    ],
+)
+def test_diff_options(current, desired, renames, expected):
+    assert diff_options(current, desired, renames=renames) == expected
+
+
+def test_diff_options_similarity_enabled():
+    diff = diff_options(['Boston Site', 'Lab'], ['Boston Sites', 'Lab'], rename_threshold=0.85)
+
+    assert diff == OptionDiff(updates={'Boston Site': 'Boston Sites'})
+
+
+def _attribute_item(attribute):
+    return {
+        'type': 'entity',
+        'id': attribute.id,
+        'attributes': {'id': attribute.id, 'eid': attribute.id, 'name': attribute.name, 'type': 'attribute'},
+    }
+
+
+def _options_response(options):
+    return {
+        'links': {'self': 'https://example.com/api/rest/v1.0/attributes/attribute:1/options'},
+        'data': [
+            {'type': 'option', 'id': option, 'attributes': {'key': option, 'value': option}} for option in options
+        ],
+    }
+
+
+@pytest.fixture()
+def attributes(attribute_factory):
+    return [attribute_factory(name=name) for name in ('Sites', 'Projects', 'Departments')]
+
+
+@pytest.fixture()
+def attributes_api(api_mock, get_response_object, attributes):
+    options = {
+        attributes[0].id: ['Boston', 'Chicago'],
+        attributes[1].id: ['P1', 'P2'],
+        attributes[2].id: ['R&D'],
+    }
+
+    def _call(method, path, **kwargs):
+        if method == 'PATCH':
+            if path[1] == attributes[1].id:
+                raise ValueError('Forbidden')
+            return get_response_object({})
+        if path == ('attributes',):
+            return get_response_object({'data': [_attribute_item(attribute) for attribute in attributes]})
+        return get_response_object(_options_response(options[path[1]]))
+
+    api_mock.call.side_effect = _call
+    return api_mock
+
+
+def test_plan(attributes_api, attributes):
+    sync = AttributeSync(concurrency=2)
+
+    report = sync.plan({'Sites': ['Boston', 'chicago', 'Denver'], 'Departments': ['R&D'], 'Unknown': ['x']})
+
+    assert report.diffs == {'Sites': OptionDiff(creates=['Denver'], updates={'Chicago': 'chicago'})}
+    assert report.missing == ['Unknown']
+    assert attributes_api.call.call_count == 4
+
+
+def test_sync(attributes_api, attributes, mocker):
+    sync = AttributeSync(concurrency=2, chunk_size=10)
+
+    report = sync.sync({'Sites': ['Boston', 'Denver'], 'Projects': ['P1'], 'Departments': ['R&D']})
+
+    assert set(report.diffs) == {'Sites', 'Projects'}
+    assert list(report.failed) == ['Projects']
+    assert sync.attributes['Sites'].options == ['Boston', 'Denver']
+    attributes_api.call.assert_any_call(
+        method='PATCH',
+        path=('attributes', attributes[0].id, 'options'),
+        json={
+            'data': [
+                {'id': 'Chicago', 'type': 'option', 'attributes': {'action': 'delete'}},
+                {'type': 'option', 'attributes': {'action': 'create', 'value': 'Denver'}},
+            ]
+        },
+    )
+
+
+def test_sync_dry_run(attributes_api):
+    report = AttributeSync().sync({'Sites': ['Boston']}, dry_run=True)
+
+    assert report.diffs == {'Sites': OptionDiff(deletes=['Chicago'])}
+    assert all(call.kwargs['method'] == 'GET' for call in attributes_api.call.call_args_list)
@@ -1,11 +1,78 @@
 import pytest
 
+from signals_notebook.attributes import AttributeRegistry
+from signals_notebook.entities.stoichiometry.stoichiometry import Stoichiometry
+from signals_notebook.materials import LibraryRegistry
+from signals_notebook.users.role_registry import RoleRegistry
+from signals_notebook.users.user_registry import UserRegistry
+
+
+class DictFSHandler:
+    def __init__(self):
+        self.files = {}
+
+    def write(self, path, data, base_alias=None):
+        self.files[path] = data
+
+    def write_chunks(self, path, chunks, base_alias=None):
+        self.files[path] = b''.join(chunks)
+
+    def read(self, path):
+        return self.files[path]
+
+    def list_subfolders(self, path):
+        return []
+
+    @classmethod
+    def join_path(cls, *paths):
+        return '/'.join(paths)
+
 
 @pytest.fixture()
 def api_mock(mocker):
     return mocker.Mock()
 
 
+@pytest.fixture()
+def dict_fs_handler():
+    return DictFSHandler()
+
+
 @pytest.fixture(autouse=True)
 def signals_notebook_api_mock(mocker, api_mock):
     return mocker.patch('signals_notebook.entities.entity.SignalsNotebookApi.get_default_api', return_value=api_mock)
+
+
+@pytest.fixture(autouse=True)
+def library_registry():
+    LibraryRegistry.invalidate()
+    yield LibraryRegistry
+    LibraryRegistry.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def user_registry():
+    UserRegistry.invalidate()
+    yield UserRegistry
+    UserRegistry.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def role_registry():
+    RoleRegistry.invalidate()
+    yield RoleRegistry
+    RoleRegistry.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def attribute_registry():
+    AttributeRegistry.invalidate()
+    yield AttributeRegistry
+    AttributeRegistry.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def stoichiometry_column_definitions():
+    Stoichiometry.invalidate_column_definitions()
+    yield
+    Stoichiometry.invalidate_column_definitions()
@@ -1,11 +1,15 @@
 import json
 import os
+import time
+from uuid import uuid4
 
+import pandas as pd
 import pytest
 
 from signals_notebook.common_types import ChemicalDrawingFormat, EID, File
-from signals_notebook.entities.stoichiometry.cell import ColumnDataType, ColumnDefinition
+from signals_notebook.entities.stoichiometry.cell import ColumnDataType, ColumnDefinition, ColumnDefinitions
 from signals_notebook.entities.stoichiometry.data_grid import DataGridKind
+from signals_notebook.entities.stoichiometry.dataframes import to_dataframes
 from signals_notebook.entities.stoichiometry.stoichiometry import Stoichiometry
 
 
@@ -162,3 +166,154 @@ def test_stoichiometry_get_html(api_mock, snapshot, stoichiometry_data_response,
     stoichiometry_html = stoichiometry.get_html()
 
     snapshot.assert_match(stoichiometry_html)
+
+
+def test_column_definitions_are_cached(api_mock, stoichiometry_data_response, get_column_definitions_mock, mocker):
+    api_mock.call.return_value.json.return_value = stoichiometry_data_response
+    entity_eid = stoichiometry_data_response['data']['id']
+
+    first = Stoichiometry.fetch_data(entity_eid)
+    second = Stoichiometry.fetch_data(entity_eid)
+
+    assert get_column_definitions_mock.call_count == len(DataGridKind)
+    assert {call.args[0] for call in get_column_definitions_mock.call_args_list} == set(DataGridKind)
+    assert second.reactants.column_definitions == first.reactants.column_definitions
+
+    mocker.patch.object(Stoichiometry, 'column_definitions_ttl', -1)
+    Stoichiometry.fetch_data(entity_eid)
+
+    assert get_column_definitions_mock.call_count == 2 * len(DataGridKind)
+
+
+def test_column_definitions_are_fetched_once_for_list(
+    api_mock, stoichiometry_data_response, get_column_definitions_mock
+):
+    response = {**stoichiometry_data_response, 'data': [stoichiometry_data_response['data']] * 3}
+    api_mock.call.return_value.json.return_value = response
+
+    result = Stoichiometry.fetch_data(stoichiometry_data_response['data']['id'])
+
+    assert len(result) == 3
+    assert get_column_definitions_mock.call_count == len(DataGridKind)
+
+
+def test_fetch_many(api_mock, stoichiometry_data_response, get_column_definitions_mock, mocker):
+    entity_eids = [f'experiment:{uuid4()}' for _ in range(5)]
+
+    def call(method, path, params):
+        if path[1] == entity_eids[3]:
+            raise ValueError('not found')
+        data = {**stoichiometry_data_response['data'], 'id': path[1]}
+        return mocker.Mock(json=mocker.Mock(return_value={**stoichiometry_data_response, 'data': data}))
+
+    api_mock.call.side_effect = call
+
+    results = dict(Stoichiometry.fetch_many(iter(entity_eids), concurrency=2))
+
+    assert api_mock.call.call_count == 5
+    assert set(results) == set(entity_eids)
+    assert isinstance(results[entity_eids[3]], ValueError)
+    assert results[entity_eids[0]].eid == entity_eids[0]
+
+    with pytest.raises(ValueError):
+        list(Stoichiometry.fetch_many([entity_eids[3]], return_exceptions=False))
+
+
+def test_column_definitions_are_fetched_once_for_concurrent_calls(
+    api_mock, stoichiometry_data_response, get_column_definitions_mock, mocker
+):
+    entity_eids = [f'experiment:{uuid4()}' for _ in range(8)]
+    column_definitions = get_column_definitions_mock.return_value
+
+    def get_column_definitions(data_grid_kind):
+        time.sleep(0.05)
+        return column_definitions
+
+    get_column_definitions_mock.side_effect = get_column_definitions
+    api_mock.call.side_effect = lambda method, path, params: mocker.Mock(
+        json=mocker.Mock(
+            return_value={**stoichiometry_data_response, 'data': {**stoichiometry_data_response['data'], 'id': path[1]}}
+        )
+    )
+
+    results = dict(Stoichiometry.fetch_many(entity_eids, concurrency=8, return_exceptions=False))
+
+    assert len(results) == 8
+    assert get_column_definitions_mock.call_count == len(DataGridKind)
+    assert Stoichiometry._column_definitions_pending == {}
+
+
+def test_column_definitions_fetch_error_is_not_cached(
+    api_mock, stoichiometry_data_response, get_column_definitions_mock
+):
+    api_mock.call.return_value.json.return_value = stoichiometry_data_response
+    column_definitions = get_column_definitions_mock.return_value
+    get_column_definitions_mock.side_effect = ValueError('Server error')
+
+    with pytest.raises(ValueError):
+        Stoichiometry.fetch_data(stoichiometry_data_response['data']['id'])
+
+    get_column_definitions_mock.side_effect = None
+    get_column_definitions_mock.return_value = column_definitions
+    Stoichiometry.fetch_data(stoichiometry_data_response['data']['id'])
+
+    assert get_column_definitions_mock.call_count == 2 * len(DataGridKind)
+
+
+@pytest.fixture()
+def grid_column_definitions_mock(get_column_definitions_mock, column_definitions_response):
+    column_definitions = ColumnDefinitions(**column_definitions_response['data']['attributes'])
+    get_column_definitions_mock.side_effect = lambda data_grid_kind: getattr(column_definitions, data_grid_kind.value)
+    return get_column_definitions_mock
+
+
+def test_to_dataframes(api_mock, stoichiometry_data_response, grid_column_definitions_mock):
+    api_mock.call.return_value.json.return_value = stoichiometry_data_response
+    stoichiometry = Stoichiometry.fetch_data(stoichiometry_data_response['data']['id'])
+    stoichiometry_list = [stoichiometry, stoichiometry]
+
+    dataframes = to_dataframes(
+        [('experiment:1', stoichiometry), ('experiment:2', stoichiometry_list), ('experiment:3', ValueError())]
+    )
+
+    assert set(dataframes) == set(DataGridKind)
+    reactants = dataframes[DataGridKind.REACTANTS]
+    assert len(reactants) == 6
+    assert list(reactants['experiment_eid']) == ['experiment:1'] * 2 + ['experiment:2'] * 4
+    assert reactants['mw'].dtype == 'float64'
+    assert list(reactants['mw'][:2]) == [36.46, 40.0]
+    assert list(reactants['mw_units'][:2]) == ['g/mol', 'g/mol']
+    assert list(reactants['eq'][:2]) == [1.0, 1.0]
+    assert list(reactants['name'][:2]) == ['HCl', 'NaOH']
+    assert list(reactants['row_id'][:2]) == ['1', '2']
+    assert reactants['name'].dtype == 'object'
+    assert list(reactants['name_units'][:2]) == [None, None]
+    assert reactants['limit'].dtype == 'boolean'
+    assert len(dataframes[DataGridKind.PRODUCTS]) == 6
+    assert 'yield' in dataframes[DataGridKind.PRODUCTS]
+
+    single = stoichiometry.to_dataframes()
+
+    assert len(single[DataGridKind.SOLVENTS]) == 1
+    assert list(single[DataGridKind.SOLVENTS]['experiment_eid']) == [stoichiometry.eid]
+    assert isinstance(single[DataGridKind.CONDITIONS], pd.DataFrame)
+
+
+def test_to_dataframes_types_do_not_depend_on_values(
+    api_mock, stoichiometry_data_response, grid_column_definitions_mock
+):
+    for reactant in stoichiometry_data_response['data']['attributes']['reactants']:
+        reactant['eq'] = {'value': 1, 'units': None}
+    api_mock.call.return_value.json.return_value = stoichiometry_data_response
+    stoichiometry = Stoichiometry.fetch_data(stoichiometry_data_response['data']['id'])
+
+    first = to_dataframes([stoichiometry])[DataGridKind.REACTANTS]
+    stoichiometry.reactants.__root__ = []
+    empty = to_dataframes([stoichiometry])[DataGridKind.REACTANTS]
+
+    assert first['eq'].dtype == 'float64'
+    assert list(first['eq']) == [1.0] * len(first)
+    assert 'eq_units' in first
+    assert list(empty.columns) == list(first.columns)
+    eid_columns = ['experiment_eid', 'stoichiometry_eid']
+    assert list(empty.dtypes.drop(eid_columns)) == list(first.dtypes.drop(eid_columns))
@@ -1,5 +1,6 @@
 import json
 import os.path
+import tracemalloc
 from uuid import UUID
 
 import arrow
@@ -9,6 +10,8 @@ import pytest
 from signals_notebook.common_types import EntityType, File, ObjectType
 from signals_notebook.entities import Table, UploadedResource
 from signals_notebook.entities.tables.cell import Cell, ColumnDataType, ColumnDefinition, DateTimeCell
+from signals_notebook.entities.tables.compact_row import CompactRow
+from signals_notebook.entities.tables.index import ColumnIndex
 from signals_notebook.entities.tables.row import Row
 
 DIGEST = '123'
@@ -246,6 +249,123 @@ def test_reload_data(api_mock, reload_data_response, table):
         assert isinstance(row, Row)
 
 
+@pytest.fixture()
+def reload_data_response_mixed_types(table):
+    columns = [
+        ('text', {'value': 5}),
+        ('boolean', {'value': 'true'}),
+        ('boolean', {'value': 0}),
+        ('multiSelect', {'value': '1, a', 'values': [1, 'a']}),
+        ('autotextList', {'value': 2.5}),
+        ('integer', {'value': '3'}),
+    ]
+    rows = []
+    for i in range(2):
+        row_id = str(UUID(int=i + 1))
+        cells = [
+            {'key': str(UUID(int=100 + j)), 'type': _type, 'name': f'Column {j}', 'content': content}
+            for j, (_type, content) in enumerate(columns)
+        ]
+        rows.append(
+            {
+                'type': 'adtRow',
+                'id': row_id,
+                'links': {'self': f'https://example.com/{table.eid}/{row_id}'},
+                'attributes': {'id': row_id, 'type': 'adtRow', 'cells': cells},
+            }
+        )
+
+    return {'links': {'self': f'https://example.com/{table.eid}'}, 'data': rows}
+
+
+@pytest.mark.parametrize('response', ['reload_data_response', 'reload_data_response_mixed_types'])
+def test_reload_data_compact_rows(api_mock, table, table_factory, request, response):
+    api_mock.call.return_value.json.return_value = request.getfixturevalue(response)
+    table.use_compact_rows()
+    regular_table = table_factory(eid=table.eid)
+
+    assert table.as_raw_data() == regular_table.as_raw_data()
+    assert table.as_dataframe().equals(regular_table.as_dataframe())
+    assert all(isinstance(row, CompactRow) and not row.is_materialized for row in table._rows)
+
+    for row in table:
+        assert isinstance(row, Row)
+    assert all(row.is_materialized for row in table._rows)
+    assert table.as_raw_data() == regular_table.as_raw_data()
+
+
+def test_compact_rows_query_without_materializing(api_mock, reload_data_response_square_table, table):
+    api_mock.call.return_value.json.return_value = reload_data_response_square_table
+    table.use_compact_rows()
+    table.create_index('Column 1')
+
+    result = table.where('Column 1', '==', 'Temp 1')
+
+    assert isinstance(result[0], Row)
+    assert [row.is_materialized for row in table._rows] == [False, True]
+
+
+def test_compact_rows_save(api_mock, reload_data_response_square_table, table):
+    api_mock.call.return_value.json.return_value = reload_data_response_square_table
+    table.use_compact_rows()
+    reload_data = reload_data_response_square_table['data']
+
+    table[0]['Column 2'].set_value('Updated Text 2')
+    table.save()
+
+    api_mock.call.assert_any_call(
+        method='PATCH',
+        path=('adt', table.eid),
+        params={
+            'digest': None,
+            'force': 'true',
+        },
+        data=json.dumps(
+            {
+                'data': [
+                    {
+                        'type': 'adtRow',
+                        'id': reload_data[0]['id'],
+                        'attributes': {
+                            'action': 'update',
+                            'cells': [
+                                {
+                                    'key': reload_data[0]['attributes']['cells'][1]['key'],
+                                    'content': {'value': 'Updated Text 2'},
+                                }
+                            ],
+                        },
+                    },
+                ]
+            }
+        ),
+    )
+
+
+def test_compact_rows_memory_per_row(api_mock, reload_data_response, table, table_factory):
+    response = json.loads(json.dumps(reload_data_response))
+    row_template = response['data'][0]
+    response['data'] = []
+    for i in range(200):
+        row = json.loads(json.dumps(row_template))
+        row['id'] = row['attributes']['id'] = str(UUID(int=i))
+        response['data'].append(row)
+    api_mock.call.return_value.json.return_value = response
+
+    def bytes_per_row(_table):
+        tracemalloc.start()
+        _table._reload_data()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return size / len(response['data'])
+
+    regular_size = bytes_per_row(table_factory())
+    table.use_compact_rows()
+    compact_size = bytes_per_row(table)
+
+    assert compact_size * 3 < regular_size
+
+
 def test_get_column_definitions_list(api_mock, all_column_types_definitions_response, table):
     api_mock.call.return_value.json.return_value = all_column_types_definitions_response
 
@@ -351,6 +471,209 @@ def test_delete_row_by_id(api_mock, reload_data_response, table, digest, force):
     )
 
 
+@pytest.mark.parametrize('digest, force', [(DIGEST, False), (None, True)])
+def test_delete_rows(api_mock, reload_data_response, table, digest, force):
+    api_mock.call.return_value.json.return_value = reload_data_response
+    row_ids = [item['id'] for item in reload_data_response['data']]
+
+    table.delete_rows(row_ids, digest=digest, force=force)
+
+    assert api_mock.call.call_count == 2
+    api_mock.call.assert_any_call(
+        method='PATCH',
+        path=('adt', table.eid),
+        params={
+            'digest': digest,
+            'force': 'true' if force else 'false',
+        },
+        data=json.dumps(
+            {'data': [{'type': 'adtRow', 'id': row_id, 'attributes': {'action': 'delete'}} for row_id in row_ids]}
+        ),
+    )
+    api_mock.call.assert_called_with(
+        method='GET',
+        path=('adt', table.eid),
+        params={
+            'value': 'normalized',
+        },
+    )
+
+
+def test_delete_rows_without_reload(api_mock, reload_data_response, table):
+    api_mock.call.return_value.json.return_value = reload_data_response
+    table._reload_data()
+    api_mock.call.reset_mock()
+    row_id = UUID(reload_data_response['data'][0]['id'])
+
+    table.delete_rows([row_id], reload=False)
+
+    api_mock.call.assert_called_once()
+    assert row_id not in table._rows_by_id
+    assert all(row.id != row_id for row in table._rows)
+    assert len(table._rows) == len(reload_data_response['data']) - 1
+
+
+def test_delete_rows_is_chunked(api_mock, reload_data_response, table, mocker):
+    mocker.patch('signals_notebook.entities.tables.table.MAX_ROW_REQUESTS_PER_PATCH', 2)
+    api_mock.call.return_value.json.return_value = reload_data_response
+    row_ids = [UUID(int=i) for i in range(5)]
+
+    table.delete_rows(row_ids)
+
+    patch_calls = [call for call in api_mock.call.call_args_list if call.kwargs['method'] == 'PATCH']
+    assert len(patch_calls) == 3
+    assert api_mock.call.call_count == 4
+
+
+def test_delete_rows_with_digest_in_several_chunks(api_mock, reload_data_response, table_with_digest, mocker):
+    mocker.patch('signals_notebook.entities.tables.table.MAX_ROW_REQUESTS_PER_PATCH', 2)
+    row_ids = [UUID(int=i) for i in range(5)]
+
+    with pytest.raises(ValueError):
+        table_with_digest.delete_rows(row_ids, digest=DIGEST, force=False)
+
+    api_mock.call.assert_not_called()
+
+    api_mock.call.return_value.json.return_value = reload_data_response
+    table_with_digest.delete_rows(row_ids[:2], digest=DIGEST, force=False)
+
+    api_mock.call.assert_any_call(
+        method='PATCH',
+        path=('adt', table_with_digest.eid),
+        params={'digest': DIGEST, 'force': 'false'},
+        data=mocker.ANY,
+    )
+
+
+def test_delete_rows_call_count_compared_to_delete_row_by_id(api_mock, reload_data_response, table):
+    api_mock.call.return_value.json.return_value = reload_data_response
+    row_ids = [UUID(int=i) for i in range(50)]
+
+    for row_id in row_ids:
+        table.delete_row_by_id(row_id)
+    one_by_one_calls = api_mock.call.call_count
+    api_mock.call.reset_mock()
+
+    table.delete_rows(row_ids)
+
+    assert one_by_one_calls == 2 * len(row_ids)
+    assert api_mock.call.call_count == 2
+
+
+@pytest.mark.parametrize('kind', [None, 'hash', 'sorted'])
+def test_where(api_mock, reload_data_response_square_table, table, kind):
+    api_mock.call.return_value.json.return_value = reload_data_response_square_table
+    if kind:
+        table.create_index('Column 1', kind=kind)
+
+    result = table.where('Column 1', '==', 'Temp 1')
+
+    assert len(result) == 1
+    assert result[0]['Column 2'].value == 'Temp 2'
+    assert [row['Column 1'].value for row in table.where('Column 1', 'in', ['Text 1', 'Temp 1'])] == [
+        'Text 1',
+        'Temp 1',
+    ]
+    assert table.where('Column 1', '==', 'Unknown') == []
+    api_mock.call.assert_called_once()
+
+
+@pytest.mark.parametrize('kind', [None, 'sorted'])
+@pytest.mark.parametrize(
+    'op, value, expected',
+    [
+        ('<', 'Text 1', ['Temp 1']),
+        ('<=', 'Text 1', ['Text 1', 'Temp 1']),
+        ('>', 'Temp 1', ['Text 1']),
+        ('>=', 'Temp 1', ['Text 1', 'Temp 1']),
+        ('!=', 'Temp 1', ['Text 1']),
+    ],
+)
+def test_where_range(api_mock, reload_data_response_square_table, table, kind, op, value, expected):
+    api_mock.call.return_value.json.return_value = reload_data_response_square_table
+    if kind:
+        table.create_index('Column 1', kind=kind)
+
+    result = table.where('Column 1', op, value)
+
+    assert [row['Column 1'].value for row in result] == expected
+
+
+def test_query_several_conditions(api_mock, reload_data_response_square_table, table):
+    api_mock.call.return_value.json.return_value = reload_data_response_square_table
+    table.create_index('Column 1')
+
+    assert len(table.query(('Column 1', '>=', 'Temp 1'), ('Column 2', '==', 'Text 2'))) == 1
+    assert table.query(('Column 1', '==', 'Temp 1'), ('Column 2', '==', 'Text 2')) == []
+    assert len(table.query()) == 2
+
+
+def test_index_is_invalidated_after_add_row(
+    api_mock, column_definitions_response, reload_data_response_square_table, table
+):
+    api_mock.call.return_value.json.return_value = reload_data_response_square_table
+    table.create_index('Column 1')
+    assert len(table.where('Column 1', '==', 'Text 1')) == 1
+
+    api_mock.call.return_value.json.return_value = column_definitions_response
+    table.add_row({'Column 1': dict(value='Text 1'), 'Column 2': dict(value='Text 3')})
+
+    result = table.where('Column 1', '==', 'Text 1')
+    assert [row['Column 2'].value for row in result] == ['Text 2', 'Text 3']
+
+
+def test_index_is_invalidated_after_reload(api_mock, reload_data_response_square_table, table):
+    api_mock.call.return_value.json.return_value = reload_data_response_square_table
+    table.create_index('Column 1', kind='sorted')
+    assert len(table.where('Column 1', '==', 'Text 1')) == 1
+
+    response = json.loads(json.dumps(reload_data_response_square_table))
+    response['data'][0]['attributes']['cells'][0]['content']['value'] = 'Changed'
+    api_mock.call.return_value.json.return_value = response
+    table._reload_data()
+
+    assert table.where('Column 1', '==', 'Text 1') == []
+    assert len(table.where('Column 1', '==', 'Changed')) == 1
+
+
+def test_index_multi_value_cell(api_mock, reload_data_response, table):
+    api_mock.call.return_value.json.return_value = reload_data_response
+    table.create_index('Col. Multi Select List')
+
+    assert len(table.where('Col. Multi Select List', '==', 'Multi Option 2')) == 1
+    table.drop_index('Col. Multi Select List')
+    assert len(table.where('Col. Multi Select List', '==', 'Multi Option 2')) == 1
+
+
+@pytest.mark.parametrize('kind', [None, 'hash', 'sorted'])
+@pytest.mark.parametrize(
+    'op, value, expected',
+    [
+        ('==', 5, [5]),
+        ('==', 5.0, [5]),
+        ('in', [5, 'Temp 1'], [5]),
+        ('<', 10, [5]),
+        ('>=', 'A', ['Text 1']),
+        ('>', pd.Timestamp('2023-01-01'), []),
+    ],
+)
+def test_where_mixed_types(api_mock, reload_data_response_square_table, table, kind, op, value, expected):
+    response = json.loads(json.dumps(reload_data_response_square_table))
+    response['data'][1]['attributes']['cells'][0].update(type='integer', content={'value': 5})
+    api_mock.call.return_value.json.return_value = response
+    if kind:
+        table.create_index('Column 1', kind=kind)
+
+    result = table.where('Column 1', op, value)
+
+    assert [row['Column 1'].value for row in result] == expected
+
+
+def test_column_index_is_abstract():
+    with pytest.raises(TypeError):
+        ColumnIndex('Column 1')
+
+
 def test_add_row(api_mock, column_definitions_response, table):
     api_mock.call.return_value.json.return_value = column_definitions_response
 
@@ -510,6 +833,278 @@ def test_save_after_change_cell_and_delete_row(
     )
 
 
+@pytest.fixture()
+def square_table_column_definitions_response(table, reload_data_response_square_table):
+    cells = reload_data_response_square_table['data'][0]['attributes']['cells']
+    return {
+        'links': {'self': f'https://example.com/{table.eid}'},
+        'data': {
+            'type': ObjectType.COLUMN_DEFINITIONS,
+            'id': table.eid,
+            'attributes': {
+                'id': table.eid,
+                'type': ObjectType.COLUMN_DEFINITIONS,
+                'columns': [{'key': cell['key'], 'title': cell['name'], 'type': 'text'} for cell in cells],
+            },
+        },
+    }
+
+
+def test_update_from_dataframe_without_changes(
+    api_mock, get_response_object, square_table_column_definitions_response, reload_data_response_square_table, table
+):
+    api_mock.call.side_effect = [
+        get_response_object(square_table_column_definitions_response),
+        get_response_object(reload_data_response_square_table),
+    ]
+    df = pd.DataFrame({'Column 1': ['Temp 1', 'Text 1'], 'Column 2': ['Temp 2', 'Text 2']})
+
+    table.update_from_dataframe(df, key_column='Column 1')
+
+    assert api_mock.call.call_count == 2
+    for call in api_mock.call.call_args_list:
+        assert call.kwargs['method'] == 'GET'
+
+
+@pytest.mark.parametrize('digest, force', [(DIGEST, False), (None, True)])
+def test_update_from_dataframe(
+    api_mock,
+    get_response_object,
+    square_table_column_definitions_response,
+    reload_data_response_square_table,
+    table_with_digest,
+    digest,
+    force,
+):
+    api_mock.call.side_effect = [
+        get_response_object(square_table_column_definitions_response),
+        get_response_object(reload_data_response_square_table),
+        get_response_object({}),
+        get_response_object(reload_data_response_square_table),
+    ]
+    reload_data = reload_data_response_square_table['data']
+    column_1_id, column_2_id = [cell['key'] for cell in reload_data[0]['attributes']['cells']]
+    df = pd.DataFrame({'Column 1': ['Text 1', 'New 1'], 'Column 2': ['Changed 2', None], 'Unknown': [1, 2]})
+
+    table_with_digest.update_from_dataframe(df, key_column='Column 1', force=force)
+
+    api_mock.call.assert_any_call(
+        method='PATCH',
+        path=('adt', table_with_digest.eid),
+        params={
+            'digest': digest,
+            'force': 'true' if force else 'false',
+        },
+        data=json.dumps(
+            {
+                'data': [
+                    {
+                        'type': 'adtRow',
+                        'id': reload_data[0]['id'],
+                        'attributes': {
+                            'action': 'update',
+                            'cells': [{'key': column_2_id, 'content': {'value': 'Changed 2'}}],
+                        },
+                    },
+                    {
+                        'type': 'adtRow',
+                        'attributes': {
+                            'action': 'create',
+                            'cells': [{'key': column_1_id, 'content': {'value': 'New 1'}}],
+                        },
+                    },
+                    {
+                        'type': 'adtRow',
+                        'id': reload_data[1]['id'],
+                        'attributes': {'action': 'delete'},
+                    },
+                ]
+            }
+        ),
+    )
+    assert api_mock.call.call_count == 4
+
+
+def test_update_from_dataframe_keep_missing(
+    api_mock, get_response_object, square_table_column_definitions_response, reload_data_response_square_table, table
+):
+    api_mock.call.side_effect = [
+        get_response_object(square_table_column_definitions_response),
+        get_response_object(reload_data_response_square_table),
+    ]
+    df = pd.DataFrame({'Column 1': ['Text 1'], 'Column 2': ['Text 2']})
+
+    table.update_from_dataframe(df, key_column='Column 1', delete_missing=False)
+
+    assert api_mock.call.call_count == 2
+
+
+@pytest.fixture()
+def typed_table_responses(table):
+    columns = [
+        {'key': str(UUID(int=1)), 'title': 'Key', 'type': 'text'},
+        {'key': str(UUID(int=2)), 'title': 'Tags', 'type': 'multiSelect', 'options': ['a', 'b']},
+        {'key': str(UUID(int=3)), 'title': 'Choice', 'type': 'list', 'options': ['x', 'y']},
+        {'key': str(UUID(int=4)), 'title': 'Date', 'type': 'datetime'},
+        {'key': str(UUID(int=5)), 'title': 'Count', 'type': 'integer'},
+        {'key': str(UUID(int=6)), 'title': 'Amount', 'type': 'number'},
+    ]
+    contents = [
+        {'value': 'K1'},
+        {'value': 'a, b', 'values': ['a', 'b']},
+        {'value': 'x', 'values': ['x']},
+        {'value': '2023-01-02T03:04:05Z'},
+        {'value': 3},
+        {'value': 2},
+    ]
+    column_definitions = {
+        'links': {'self': f'https://example.com/{table.eid}'},
+        'data': {
+            'type': ObjectType.COLUMN_DEFINITIONS,
+            'id': table.eid,
+            'attributes': {'id': table.eid, 'type': ObjectType.COLUMN_DEFINITIONS, 'columns': columns},
+        },
+    }
+    row_id = str(UUID(int=100))
+    reload_data = {
+        'links': {'self': f'https://example.com/{table.eid}'},
+        'data': [
+            {
+                'type': 'adtRow',
+                'id': row_id,
+                'links': {'self': f'https://example.com/{table.eid}/{row_id}'},
+                'attributes': {
+                    'id': row_id,
+                    'type': 'adtRow',
+                    'cells': [
+                        {'key': column['key'], 'type': column['type'], 'name': column['title'], 'content': content}
+                        for column, content in zip(columns, contents)
+                    ],
+                },
+            }
+        ],
+    }
+    return column_definitions, reload_data
+
+
+@pytest.mark.parametrize(
+    'values, changed_columns',
+    [
+        ({'Tags': [['a', 'b']], 'Choice': ['x'], 'Date': ['2023-01-02 03:04:05+00:00'], 'Count': [3.0]}, []),
+        ({'Date': [pd.Timestamp('2023-01-02T03:04:05Z')], 'Count': [3], 'Amount': [2.0]}, []),
+        ({'Choice': [['x']], 'Amount': [2]}, []),
+        ({'Tags': [['b', 'a']], 'Date': ['2023-01-03'], 'Count': [4.0]}, ['Tags', 'Date', 'Count']),
+        ({'Date': ['n/a'], 'Count': [None], 'Amount': ['2.0 mg']}, ['Date', 'Amount']),
+    ],
+)
+def test_update_from_dataframe_compares_typed_values(
+    api_mock, get_response_object, typed_table_responses, table, values, changed_columns
+):
+    column_definitions, reload_data = typed_table_responses
+    api_mock.call.side_effect = [
+        get_response_object(column_definitions),
+        get_response_object(reload_data),
+        get_response_object({}),
+        get_response_object(reload_data),
+    ]
+    df = pd.DataFrame({'Key': ['K1'], **values})
+
+    table.update_from_dataframe(df, key_column='Key')
+
+    patch_calls = [call for call in api_mock.call.call_args_list if call.kwargs['method'] == 'PATCH']
+    if not changed_columns:
+        assert not patch_calls
+        return
+
+    cells = json.loads(patch_calls[0].kwargs['data'])['data'][0]['attributes']['cells']
+    keys_by_title = {column['title']: column['key'] for column in column_definitions['data']['attributes']['columns']}
+    assert [cell['key'] for cell in cells] == [keys_by_title[column] for column in changed_columns]
+
+
+@pytest.mark.parametrize(
+    'key_column, keys',
+    [
+        ('Key', [0]),
+        ('Count', ['3']),
+        ('Count', [3.0]),
+        ('Date', [pd.Timestamp('2023-01-02T04:04:05+01:00')]),
+    ],
+)
+def test_update_from_dataframe_compares_typed_keys(
+    api_mock, get_response_object, typed_table_responses, table, key_column, keys
+):
+    column_definitions, reload_data = typed_table_responses
+    reload_data['data'][0]['attributes']['cells'][0]['content'] = {'value': '0'}
+    api_mock.call.side_effect = [
+        get_response_object(column_definitions),
+        get_response_object(reload_data),
+    ]
+    df = pd.DataFrame({key_column: keys, 'Amount': [2]})
+
+    table.update_from_dataframe(df, key_column=key_column)
+
+    assert api_mock.call.call_count == 2
+    for call in api_mock.call.call_args_list:
+        assert call.kwargs['method'] == 'GET'
+
+
+@pytest.mark.parametrize(
+    'df',
+    [
+        pd.DataFrame({'Column 2': ['Text 2']}),
+        pd.DataFrame({'Column 1': ['Text 1', 'Text 1']}),
+        pd.DataFrame({'Column 1': ['Text 1', None]}),
+    ],
+)
+def test_update_from_dataframe_invalid_key(api_mock, square_table_column_definitions_response, table, df):
+    api_mock.call.return_value.json.return_value = square_table_column_definitions_response
+
+    with pytest.raises(ValueError):
+        table.update_from_dataframe(df, key_column='Column 1')
+
+
+def test_from_dataframe(api_mock, experiment_factory, eid_factory):
+    container = experiment_factory()
+    eid = eid_factory(type=EntityType.UPLOADED_RESOURCE)
+    file_name = 'file.json'
+    api_mock.call.return_value.json.return_value = {
+        'links': {'self': f'https://example.com/{eid}'},
+        'data': {
+            'type': ObjectType.ENTITY,
+            'id': eid,
+            'attributes': {
+                'eid': eid,
+                'name': file_name,
+                'description': '',
+                'type': EntityType.UPLOADED_RESOURCE,
+                'createdAt': '2019-09-06T03:12:35.129Z',
+                'editedAt': '2019-09-06T15:22:47.309Z',
+                'digest': '222',
+            },
+        },
+    }
+    df = pd.DataFrame({'Column 1': ['Text 1', None], 'Column 2': [1, 2]})
+
+    Table.from_dataframe(container=container, name=file_name, df=df)
+
+    content = [
+        {'Column 1': {'value': 'Text 1'}, 'Column 2': {'value': 1}},
+        {'Column 2': {'value': 2}},
+    ]
+    api_mock.call.assert_called_once_with(
+        method='POST',
+        path=('entities', container.eid, 'children', file_name),
+        params={
+            'digest': None,
+            'force': 'true',
+        },
+        headers={
+            'Content-Type': Table.ContentType.JSON,
+        },
+        data=json.dumps({'data': content}, default=str).encode('utf-8'),
+    )
+
+
 @pytest.fixture()
 def get_column_definitions_list_mock(mocker):
     column_definitions = [
@@ -816,6 +1411,133 @@ def test_dump(table_factory, mocker, api_mock, reload_data_response, column_defi
     )
 
 
+@pytest.fixture()
+def reload_data_column_definitions_response(table, reload_data_response):
+    columns = []
+    for cell in reload_data_response['data'][0]['attributes']['cells']:
+        column = {'key': cell['key'], 'title': cell['name'], 'type': cell['type']}
+        if cell['type'] == 'attributeList':
+            column.update(
+                options=[],
+                attributeListEid='attributeList:945e5287-1e1f-4310-b42a-43ed0405a4b4',
+                multiSelect='values' in cell['content'],
+            )
+        columns.append(column)
+
+    return {
+        'links': {'self': f'https://example.com/{table.eid}'},
+        'data': {
+            'type': ObjectType.COLUMN_DEFINITIONS,
+            'id': table.eid,
+            'attributes': {'id': table.eid, 'type': ObjectType.COLUMN_DEFINITIONS, 'columns': columns},
+        },
+    }
+
+
+def test_to_arrow(
+    api_mock, get_response_object, reload_data_response, reload_data_column_definitions_response, table
+):
+    pa = pytest.importorskip('pyarrow')
+    api_mock.call.side_effect = [
+        get_response_object(reload_data_response),
+        get_response_object(reload_data_column_definitions_response),
+    ]
+
+    result = table.to_arrow()
+
+    assert isinstance(result, pa.Table)
+    assert result.num_rows == 1
+    assert result.schema.field('Col. Number').type == pa.float64()
+    assert result.schema.field('Col. Integer').type == pa.int64()
+    assert result.schema.field('Col. Checkbox').type == pa.bool_()
+    assert result.schema.field('Col. Date/Time').type == pa.timestamp('us', tz='UTC')
+    assert result.schema.field('Col. Attribute List').type == pa.string()
+    assert result.schema.field('Col. Multi Attribute List').type == pa.list_(pa.string())
+    row = result.to_pylist()[0]
+    assert row['Col. Integer'] == 123
+    assert row['Col. Multi Select List'] == ['Multi Option 1', 'Multi Option 2']
+    assert row['Col. Text'] == 'Text'
+
+
+def test_to_parquet_and_create_from_parquet(
+    api_mock,
+    mocker,
+    get_response_object,
+    experiment_factory,
+    reload_data_response,
+    reload_data_column_definitions_response,
+    table,
+):
+    pytest.importorskip('pyarrow')
+    import io
+
+    api_mock.call.side_effect = [
+        get_response_object(reload_data_response),
+        get_response_object(reload_data_column_definitions_response),
+    ]
+    buffer = io.BytesIO()
+    table.to_parquet(buffer, row_group_size=1)
+
+    create_mock = mocker.patch('signals_notebook.entities.tables.table.Table.create')
+    container = experiment_factory()
+    buffer.seek(0)
+    Table.create_from_parquet(container=container, name='name', path=buffer)
+
+    content = create_mock.call_args.kwargs['content']
+    assert len(content) == 1
+    assert content[0]['Col. Text'] == {'value': 'Text'}
+    assert content[0]['Col. Multi Select List'] == {
+        'value': 'Multi Option 1, Multi Option 2',
+        'values': ['Multi Option 1', 'Multi Option 2'],
+    }
+
+
+def test_dump_parquet(
+    mocker, api_mock, get_response_object, reload_data_response, reload_data_column_definitions_response, table
+):
+    pytest.importorskip('pyarrow')
+    api_mock.call.side_effect = [
+        get_response_object(reload_data_response),
+        get_response_object(reload_data_column_definitions_response),
+        get_response_object(reload_data_column_definitions_response),
+    ]
+    fs_handler_mock = mocker.MagicMock()
+
+    table.dump(base_path='./', fs_handler=fs_handler_mock, content_type=Table.ContentType.PARQUET.value)
+
+    fs_handler_mock.join_path.assert_any_call('./', table.eid, f'{table.name}.parquet')
+    metadata = json.loads(fs_handler_mock.write.call_args_list[0].args[1])
+    assert metadata['content_type'] == Table.ContentType.PARQUET.value
+    assert fs_handler_mock.write.call_args_list[1].args[1].startswith(b'PAR1')
+
+
+def test_load_parquet(mocker, api_mock, experiment_factory, templates):
+    pa = pytest.importorskip('pyarrow')
+    import io
+
+    import pyarrow.parquet as pq
+
+    buffer = io.BytesIO()
+    pq.write_table(pa.table({'Column 1': ['Text 1'], 'Column 2': [None]}), buffer)
+    metadata = {
+        'file_name': 'name.parquet',
+        'name': 'name',
+        'columns': ['Column 1', 'Column 2'],
+        'content_type': Table.ContentType.PARQUET.value,
+    }
+    fs_handler_mock = mocker.MagicMock()
+    fs_handler_mock.read.side_effect = [json.dumps(metadata), buffer.getvalue()]
+    mocker.patch('signals_notebook.entities.tables.table.EntityStore.get_list', return_value=[])
+    create_mock = mocker.patch('signals_notebook.entities.tables.table.Table.create')
+    container = experiment_factory()
+
+    Table.load(path='./', fs_handler=fs_handler_mock, parent=container)
+
+    create_mock.assert_called_once_with(
+        container=container, name='name', content=[{'Column 1': {'value': 'Text 1'}}], force=True
+    )
+
+
 def test_load_table(
     api_mock,
     experiment_factory,
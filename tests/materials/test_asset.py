@@ -3,8 +3,11 @@ import json
 import arrow
 import pytest
 
-from signals_notebook.common_types import ChemicalDrawingFormat, File, MaterialType, MID, ObjectType
+from signals_notebook.common_types import ChemicalDrawingFormat, File, MaterialType, ObjectType
+from signals_notebook.entities import Entity
 from signals_notebook.materials import Batch
+from signals_notebook.materials.field import AssetConfig, MaterialFieldType, Numbering
+from signals_notebook.materials.material import Material
 
 
 @pytest.fixture()
@@ -180,15 +183,14 @@ def test_get_batches__several_pages(api_mock, mocker, get_response_object, asset
 def test_library_property(asset_factory, library_factory, mocker):
     library = library_factory()
 
-    mock = mocker.patch('signals_notebook.materials.material_store.MaterialStore')
-    mock.get.return_value = library
+    mock = mocker.patch('signals_notebook.materials.library.Library.get_list', return_value=[library])
 
-    asset = asset_factory(_library=None)
+    asset = asset_factory(_library=None, asset_type_id=library.asset_type_id)
+    other_asset = asset_factory(_library=None, asset_type_id=library.asset_type_id)
 
-    result = asset.library
-
-    assert result == library
-    mock.get.assert_called_once_with(MID(f'{MaterialType.LIBRARY}:{asset.asset_type_id}'))
+    assert asset.library == library
+    assert other_asset.library == library
+    mock.assert_called_once_with()
 
 
 def test_get_chemical_drawing(asset_factory, api_mock):
@@ -304,9 +306,12 @@ def test_save_changes(asset_factory, api_mock, force):
     asset = asset_factory(digest='1234')
 
     asset['Name'] = 'New name'
+    assert asset.is_changed
 
     asset.save(force=force)
 
+    assert not asset.is_changed
+
     api_mock.call.assert_called_once_with(
         method='PATCH',
         path=('materials', asset.eid, 'properties'),
@@ -341,3 +346,65 @@ def test_delete(api_mock, digest, force, asset_factory):
             'force': 'true' if force else 'false',
         },
     )
+
+
+@pytest.fixture()
+def library_with_links(library_factory):
+    return library_factory(
+        _asset_config=AssetConfig(
+            numbering=Numbering(format='AST-###'),
+            fields=[
+                {'id': '1', 'name': 'Name', 'mandatory': True, 'hidden': False, 'dataType': MaterialFieldType.TEXT},
+                {'id': '2', 'name': 'Link', 'mandatory': False, 'hidden': False, 'dataType': MaterialFieldType.LINK},
+                {
+                    'id': '3',
+                    'name': 'File',
+                    'mandatory': False,
+                    'hidden': False,
+                    'dataType': MaterialFieldType.ATTACHED_FILE,
+                },
+            ],
+            display_name='Asset',
+        )
+    )
+
+
+def test_field_representation_is_memoized(asset_factory, library_with_links, mocker):
+    entity_store_get_mock = mocker.patch('signals_notebook.entities.entity_store.EntityStore.get')
+    asset = asset_factory(_library=library_with_links, fields={'Link': {'value': {'eid': 'text:1'}}})
+
+    assert asset['Link'] is entity_store_get_mock.return_value
+    assert asset['Link'] is entity_store_get_mock.return_value
+    entity_store_get_mock.assert_called_once_with('text:1')
+
+    new_entity = mocker.Mock(spec=Entity, eid='text:2', type='text')
+    new_entity.name = 'Text 2'
+    asset['Link'] = new_entity
+    entity_store_get_mock.return_value = new_entity
+
+    assert asset['Link'] is new_entity
+    entity_store_get_mock.assert_called_with('text:2')
+    assert entity_store_get_mock.call_count == 2
+
+
+def test_prefetch_fields(asset_factory, library_with_links, mocker):
+    entity_store_get_mock = mocker.patch('signals_notebook.entities.entity_store.EntityStore.get')
+    get_attachment_mock = mocker.patch('signals_notebook.materials.material.Material.get_attachment')
+    assets = [
+        asset_factory(
+            _library=library_with_links,
+            fields={'Link': {'value': {'eid': 'text:1'}}, 'File': {'value': {'filename': f'{i}.png'}}},
+        )
+        for i in range(3)
+    ]
+    asset_without_links = asset_factory(_library=library_with_links, fields={'Name': {'value': 'Name'}})
+
+    Material.prefetch_fields([*assets, asset_without_links], concurrency=2)
+
+    entity_store_get_mock.assert_called_once_with('text:1')
+    assert get_attachment_mock.call_count == 3
+    for asset in assets:
+        assert asset['Link'] is entity_store_get_mock.return_value
+        assert asset['File'] is get_attachment_mock.return_value
+    assert entity_store_get_mock.call_count == 1
+    assert get_attachment_mock.call_count == 3
@@ -2,21 +2,20 @@ import json
 
 import pytest
 
-from signals_notebook.common_types import ChemicalDrawingFormat, File, MaterialType, MID
+from signals_notebook.common_types import ChemicalDrawingFormat, File
 
 
 def test_library_property(batch_factory, library_factory, mocker):
     library = library_factory()
 
-    mock = mocker.patch('signals_notebook.materials.material_store.MaterialStore')
-    mock.get.return_value = library
+    mock = mocker.patch('signals_notebook.materials.library.Library.get_list', return_value=[library])
 
-    batch = batch_factory(_library=None)
+    batch = batch_factory(_library=None, asset_type_id=library.asset_type_id)
+    other_batch = batch_factory(_library=None, asset_type_id=library.asset_type_id)
 
-    result = batch.library
-
-    assert result == library
-    mock.get.assert_called_once_with(MID(f'{MaterialType.LIBRARY}:{batch.asset_type_id}'))
+    assert batch.library == library
+    assert other_batch.library == library
+    mock.assert_called_once_with()
 
 
 def test_get_chemical_drawing(batch_factory, api_mock):
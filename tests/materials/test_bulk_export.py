@@ -0,0 +1,110 @@
+import pytest
+
+from signals_notebook.exceptions import BulkExportJobAlreadyRunningError
+from signals_notebook.materials import BulkExportManager, ExportJobStatus
+
+
+@pytest.fixture()
+def download_response(mocker):
+    def _f(name, content):
+        response = mocker.Mock()
+        response.headers = {'content-disposition': f'attachment; filename={name}.csv'}
+        response.iter_content.return_value = iter([content[:5], content[5:]])
+        type(response).content = mocker.PropertyMock(side_effect=AssertionError('Content is not streamed'))
+        return response
+
+    return _f
+
+
+def test_export(library_factory, download_response, mocker, dict_fs_handler):
+    libraries = [library_factory(name='Library'), library_factory(name='Library')]
+    running = []
+
+    def start_export(library):
+        if running:
+            raise BulkExportJobAlreadyRunningError()
+        running.append(library)
+        return f'file-{library.asset_type_id}', f'report-{library.asset_type_id}'
+
+    checks = {library.asset_type_id: 0 for library in libraries}
+
+    def is_file_ready(library, report_id):
+        assert report_id == f'report-{library.asset_type_id}'
+        checks[library.asset_type_id] += 1
+        if checks[library.asset_type_id] < 3:
+            return {'success': False, 'error': None}
+        running.remove(library)
+        return {'success': True, 'error': None}
+
+    def download_file(library, file_id, stream=False):
+        assert file_id == f'file-{library.asset_type_id}'
+        assert stream
+        return download_response(library.name, f'content of {library.name}'.encode())
+
+    start_export_mock = mocker.patch(
+        'signals_notebook.materials.library.Library._start_export', autospec=True, side_effect=start_export
+    )
+    mocker.patch('signals_notebook.materials.library.Library._is_file_ready', autospec=True, side_effect=is_file_ready)
+    mocker.patch('signals_notebook.materials.library.Library._download_file', autospec=True, side_effect=download_file)
+
+    manager = BulkExportManager(dict_fs_handler, 'exports', min_period=0.01, max_period=0.02)
+    jobs = manager.export(libraries)
+
+    assert [job.library for job in jobs] == libraries
+    for job in jobs:
+        assert job.status == ExportJobStatus.COMPLETED
+        assert job.path == f'exports/{job.library.asset_type_id}_Library.csv'
+        assert dict_fs_handler.files[job.path] == b'content of Library'
+        assert job.interval == 0.02
+    assert len(dict_fs_handler.files) == len(libraries)
+    assert start_export_mock.call_count > len(libraries)
+    assert list(checks.values()) == [3, 3]
+
+
+def test_export_failed_jobs(library_factory, mocker, dict_fs_handler):
+    empty_library, broken_library, slow_library = library_factory(), library_factory(), library_factory()
+
+    def is_file_ready(library, report_id):
+        if library is empty_library:
+            return {'success': False, 'error': 'Nothing to export.'}
+        return {'success': False, 'error': None}
+
+    mocker.patch(
+        'signals_notebook.materials.library.Library._start_export', return_value=('file_id', 'report_id')
+    )
+    mocker.patch('signals_notebook.materials.library.Library._is_file_ready', autospec=True, side_effect=is_file_ready)
+    mocker.patch(
+        'signals_notebook.materials.library.Library._download_file', side_effect=AssertionError('Unexpected call')
+    )
+
+    manager = BulkExportManager(dict_fs_handler, timeout=0.05, min_period=0.01, max_period=0.01)
+    manager.submit(empty_library)
+    manager.submit(slow_library)
+    broken_job = manager.submit(broken_library)
+    broken_job.library = mocker.Mock(_start_export=mocker.Mock(side_effect=ValueError('Error')))
+
+    empty_job, slow_job, broken_job = manager.run()
+
+    assert all(job.status == ExportJobStatus.FAILED for job in (empty_job, slow_job, broken_job))
+    assert isinstance(empty_job.error, FileNotFoundError)
+    assert isinstance(slow_job.error, TimeoutError)
+    assert isinstance(broken_job.error, ValueError)
+
+
+def test_export_without_chunked_writes(library_factory, download_response, mocker):
+    library = library_factory(name='Library')
+    fs_handler = mocker.Mock(spec=['write', 'join_path'])
+    fs_handler.join_path.side_effect = lambda *paths: '/'.join(paths)
+    mocker.patch('signals_notebook.materials.library.Library._start_export', return_value=('file', 'report'))
+    mocker.patch(
+        'signals_notebook.materials.library.Library._is_file_ready', return_value={'success': True, 'error': None}
+    )
+    mocker.patch(
+        'signals_notebook.materials.library.Library._download_file',
+        return_value=download_response('Library', b'content of Library'),
+    )
+
+    jobs = BulkExportManager(fs_handler, min_period=0.01).export([library])
+
+    assert jobs[0].status == ExportJobStatus.COMPLETED
+    fs_handler.write.assert_called_once_with(f'exports/{library.asset_type_id}_Library.csv', b'content of Library')
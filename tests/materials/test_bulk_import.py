@@ -0,0 +1,83 @@
+import io
+import zipfile
+
+import pytest
+
+from signals_notebook.common_types import File
+from signals_notebook.materials.bulk_import import iter_file_chunks, iter_json_chunks, merge_failure_reports
+
+
+def _unzip(file):
+    with zipfile.ZipFile(io.BytesIO(file.content)) as zip_file:
+        return {name: zip_file.read(name) for name in zip_file.namelist()}
+
+
+def test_iter_json_chunks():
+    items = ({'data': {'id': i}} for i in range(10))
+
+    chunks = list(iter_json_chunks(items, max_size=60))
+
+    assert [item['data']['id'] for chunk in chunks for item in chunk] == list(range(10))
+    assert len(chunks) > 1
+    assert all(len(str(chunk)) < 60 for chunk in chunks)
+
+
+def test_iter_json_chunks_too_large_item():
+    with pytest.raises(ValueError):
+        list(iter_json_chunks([{'data': 'x' * 100}], max_size=60))
+
+
+def test_iter_file_chunks_small_file():
+    file = File(name='materials.zip', content=b'content', content_type='application/octet-stream')
+
+    assert list(iter_file_chunks(file, max_size=100)) == [file]
+
+
+def test_iter_file_chunks_sdf():
+    records = [f'mol{i}\n\n\n> <Name>\nname{i}\n\n$$$$\n'.encode() for i in range(6)]
+    file = File(name='materials.sdf', content=b''.join(records), content_type='chemical/x-mdl-sdfile')
+
+    chunks = list(iter_file_chunks(file, max_size=2 * len(records[0])))
+
+    assert [chunk.name for chunk in chunks] == ['materials_0.zip', 'materials_1.zip', 'materials_2.zip']
+    assert b''.join(_unzip(chunk)['materials.sdf'] for chunk in chunks) == file.content
+
+
+def test_iter_file_chunks_zipped_csv():
+    header = b'Name,Description\n'
+    rows = [b'a,"multi\nline"\n', b'b,text\n', b'c,text\n']
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
+        zip_file.writestr('materials.csv', header + b''.join(rows))
+    file = File(name='materials.zip', content=zip_buffer.getvalue(), content_type='application/zip')
+
+    chunks = list(iter_file_chunks(file, max_size=len(header) + len(rows[0]) + len(rows[1])))
+
+    assert [_unzip(chunk) for chunk in chunks] == [
+        {'materials.csv': header + rows[0] + rows[1]},
+        {'materials.csv': header + rows[2]},
+    ]
+
+
+def test_iter_file_chunks_with_attachments():
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
+        zip_file.writestr('materials.csv', b'Name\n' + b'a\n' * 100)
+        zip_file.writestr('attachment.png', b'image')
+    file = File(name='materials.zip', content=zip_buffer.getvalue(), content_type='application/zip')
+
+    with pytest.raises(ValueError):
+        list(iter_file_chunks(file, max_size=10))
+
+
+def test_merge_failure_reports():
+    reports = [
+        File(name='report', content=b'Name,Error\na,error\n', content_type='text/csv'),
+        File(name='report', content=b'Name,Error\nb,error', content_type='text/csv'),
+    ]
+
+    result = merge_failure_reports(reports)
+
+    assert result.name == 'report'
+    assert result.content == b'Name,Error\na,error\nb,error\n'
+    assert merge_failure_reports([]) is None
@@ -0,0 +1,103 @@
+import pytest
+
+from signals_notebook.materials.export_reader import (
+    FieldNameMapper,
+    get_encoding,
+    is_sdf,
+    iter_csv_records,
+    iter_lines,
+    iter_sdf_records,
+)
+from signals_notebook.materials.field import AssetConfig, MaterialFieldType, Numbering
+
+
+@pytest.fixture()
+def field_name():
+    fields = [
+        ('1', 'Structure', MaterialFieldType.CHEMICAL_DRAWING),
+        ('2', 'Chemical Name', MaterialFieldType.TEXT),
+        ('3', 'Purity %', MaterialFieldType.DECIMAL),
+    ]
+    config = AssetConfig(
+        numbering=Numbering(format='AST-###'),
+        fields=[
+            {'id': _id, 'name': name, 'mandatory': False, 'hidden': False, 'dataType': data_type}
+            for _id, name, data_type in fields
+        ],
+        display_name='Compound',
+    )
+    return FieldNameMapper([config])
+
+
+def test_iter_lines():
+    chunks = [b'first\r', b'\nsec', 'ond é\n'.encode()[:-2], 'ond é\n'.encode()[-2:], b'last']
+
+    assert list(iter_lines(chunks)) == ['first\r\n', 'second é\n', 'last']
+
+
+def test_iter_lines_strips_bom():
+    chunks = ['\ufeffName\n\ufeffvalue\n'.encode()]
+
+    assert list(iter_lines(chunks)) == ['Name\n', '\ufeffvalue\n']
+    assert list(iter_lines([])) == []
+
+
+@pytest.mark.parametrize(
+    'content_type, expected',
+    [
+        ('text/csv', 'utf-8'),
+        (None, 'utf-8'),
+        ('text/csv; charset=windows-1252', 'windows-1252'),
+    ],
+)
+def test_get_encoding(content_type, expected):
+    assert get_encoding(content_type) == expected
+
+
+def test_iter_sdf_records(field_name):
+    content = (
+        'mol1\n  header\n\n  0  0  0  0  0  0            999 V2000\nM  END\n'
+        '> <Chemical_Name>\nWater\n\n'
+        '>  <Purity__> (1)\n99.5\n\n'
+        '> <Comment>\nline 1\nline 2\n\n'
+        '$$$$\n'
+        'mol2\n\n\nM  END\n'
+        '> <Chemical_Name>\nEthanol\n\n'
+        '$$$$\n'
+    )
+
+    records = list(iter_sdf_records(iter_lines([content.encode()]), field_name))
+
+    assert records == [
+        {
+            'Structure': 'mol1\n  header\n\n  0  0  0  0  0  0            999 V2000\nM  END\n',
+            'Chemical Name': 'Water',
+            'Purity %': '99.5',
+            'Comment': 'line 1\nline 2',
+        },
+        {'Structure': 'mol2\n\n\nM  END\n', 'Chemical Name': 'Ethanol'},
+    ]
+
+
+def test_iter_csv_records(field_name):
+    content = b'Chemical Name,Purity %,Comment\nWater,99.5,"line 1\nline 2"\nEthanol,,\n'
+
+    records = list(iter_csv_records(iter_lines([content[:30], content[30:]]), field_name))
+
+    assert records == [
+        {'Chemical Name': 'Water', 'Purity %': '99.5', 'Comment': 'line 1\nline 2'},
+        {'Chemical Name': 'Ethanol'},
+    ]
+
+
+@pytest.mark.parametrize(
+    'file_name,content_type,expected',
+    [
+        ('Compounds.sdf', None, True),
+        ('Plasmids.csv', 'text/csv', False),
+        ('', 'text/csv', False),
+        ('', 'chemical/x-mdl-sdfile', True),
+    ],
+)
+def test_is_sdf(file_name, content_type, expected):
+    assert is_sdf(file_name, content_type) is expected
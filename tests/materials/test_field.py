@@ -0,0 +1,44 @@
+from signals_notebook.materials.field import AttributeFieldDefinition, MaterialFieldType
+
+
+def test_attribute_is_fetched_once(mocker):
+    attribute_get_mock = mocker.patch('signals_notebook.attributes.Attribute.get')
+    definition = AttributeFieldDefinition(
+        id='1',
+        name='Color',
+        mandatory=False,
+        hidden=False,
+        dataType=MaterialFieldType.ATTRIBUTE,
+        attribute='attribute:1',
+    )
+
+    assert definition.attribute is attribute_get_mock.return_value
+    assert definition.attribute is attribute_get_mock.return_value
+    attribute_get_mock.assert_called_once_with('attribute:1')
+
+
+def test_attribute_is_shared(mocker):
+    attribute_get_mock = mocker.patch('signals_notebook.attributes.Attribute.get')
+    definitions = [
+        AttributeFieldDefinition(id=str(i), name=f'Field {i}', attribute='attribute:1', mandatory=False, hidden=False)
+        for i in range(2)
+    ]
+
+    assert definitions[0].attribute is definitions[1].attribute
+    attribute_get_mock.assert_called_once_with('attribute:1')
+
+
+def test_attribute_follows_registry(mocker, attribute_registry):
+    attribute_get_mock = mocker.patch('signals_notebook.attributes.Attribute.get')
+    definition = AttributeFieldDefinition(id='1', name='Color', attribute='attribute:1', mandatory=False, hidden=False)
+    assert definition.attribute is attribute_get_mock.return_value
+
+    changed_attribute = mocker.Mock(id='attribute:1')
+    attribute_registry.update(changed_attribute)
+
+    assert definition.attribute is changed_attribute
+
+    mocker.patch.object(attribute_registry, 'ttl', -1)
+
+    assert definition.attribute is attribute_get_mock.return_value
+    assert attribute_get_mock.call_count == 2
@@ -586,6 +586,7 @@ def test_get_content(library_factory, api_mock, mocker, get_response):
             mocker.call(
                 method='GET',
                 path=('materials', 'bulkExport', 'download', file_id),
+                stream=False,
             ),
         ],
         any_order=False,
@@ -1012,3 +1013,126 @@ def test_bulk_import_zip_format_timeout(
     assert result.name == f'{library.name}_failure_report'
     assert result.content == content
     assert result.content_type == content_type
+
+
+def test_bulk_import_unfinished_job(library_factory, file_factory, api_mock, get_response):
+    library = library_factory()
+    file = file_factory(content=b'content', content_type='application/octet-stream')
+    job_id = '62be94847f79d37108f6df6c'
+    import_response = get_response({'data': {'id': job_id, 'attributes': {'status': 'IMPORTING', 'report': {}}}})
+    api_mock.call.return_value = import_response
+
+    with pytest.raises(TimeoutError, match=job_id):
+        library.bulk_import(materials=file, import_type='zip', timeout=0.001)
+
+
+def test_bulk_import_chunks(library_factory, api_mock, mocker, get_response):
+    library = library_factory()
+    posted_chunks = []
+
+    def call(method, path, **kwargs):
+        if method == 'POST':
+            posted_chunks.append(kwargs['json'])
+            return get_response({'data': {'id': f'job{len(posted_chunks)}'}})
+        if path[-1] == 'failures':
+            response = get_response({})
+            response.content = f'Name,Error\n{path[-2]},error\n'.encode()
+            response.headers = {
+                'content-type': 'text/csv',
+                'content-disposition': f'attachment; filename={library.name}_failure_report',
+            }
+            return response
+        failed = 1 if path[-1] != 'job1' else 0
+        return get_response({'data': {'attributes': {'status': 'COMPLETED', 'report': {'failed': failed}}}})
+
+    api_mock.call.side_effect = call
+    materials = ({'asset': {'Name': f'Asset {i}'}, 'batch': {}} for i in range(9))
+
+    result = library.bulk_import(materials=materials, max_chunk_size=400, concurrency=2)
+
+    assert len(posted_chunks) > 2
+    assert sum(len(chunk) for chunk in posted_chunks) == 9
+    assert isinstance(result, File)
+    assert result.name == f'{library.name}_failure_report'
+    assert result.content == b'Name,Error\n' + b''.join(
+        f'job{i},error\n'.encode() for i in range(2, len(posted_chunks) + 1)
+    )
+
+
+def test_iter_export_records(library_factory, api_mock, mocker, get_response):
+    library = library_factory()
+    export_response = get_response({'data': {'attributes': {'fileId': 'file_id', 'reportId': 'report_id'}}})
+    report_response = get_response({'data': {'attributes': {'status': 'COMPLETED'}}})
+    content_response = get_response({})
+    # requests guesses ISO-8859-1 for text content without charset
+    content_response.encoding = 'ISO-8859-1'
+    content_response.headers = {
+        'content-type': 'text/csv',
+        'content-disposition': f'attachment; filename={library.name}.csv',
+    }
+    content_response.iter_content.return_value = [
+        '\ufeffName,Link Name\nAST-1,'.encode(),
+        'EXP-1\nAST-é,\n'.encode(),
+    ]
+
+    api_mock.call.side_effect = [export_response, report_response, content_response]
+
+    result = library.iter_export_records(chunk_size=1024)
+
+    assert list(result) == [{'Name': 'AST-1', 'Link Name': 'EXP-1'}, {'Name': 'AST-é'}]
+    api_mock.call.assert_called_with(
+        method='GET', path=('materials', 'bulkExport', 'download', 'file_id'), stream=True
+    )
+    content_response.iter_content.assert_called_once_with(chunk_size=1024)
+    content_response.close.assert_called_once_with()
+
+
+def _get_batch_page(library, names, next_link=None, start=1):
+    return {
+        'links': {'self': 'https://example.com/page', **({'next': next_link} if next_link else {})},
+        'data': [
+            {
+                'type': ObjectType.MATERIAL,
+                'id': f'batch:{number}',
+                'links': {'self': f'https://example.com/batch:{number}'},
+                'attributes': {
+                    'assetTypeId': library.asset_type_id,
+                    'library': library.name,
+                    'eid': f'batch:{number}',
+                    'name': name,
+                    'type': MaterialType.BATCH,
+                    'createdAt': '2019-09-06T03:12:35.129Z',
+                    'editedAt': '2019-09-06T15:22:47.309Z',
+                    'fields': {'Name': {'value': name}},
+                },
+            }
+            for number, name in enumerate(names, start)
+        ],
+    }
+
+
+def test_iter_asset_batches(api_mock, library_factory, get_response, mocker):
+    library = library_factory()
+    next_link = 'https://example.com/api/rest/v1.0/materials/batches?page[offset]=2&page[limit]=2'
+    api_mock.call.side_effect = [
+        get_response(_get_batch_page(library, ['AST-1-1', 'AST-1-2'], next_link)),
+        get_response(_get_batch_page(library, ['AST-1-3'], start=3)),
+    ]
+    batch_config_mock = mocker.patch.object(
+        type(library), 'batch_config', new_callable=mocker.PropertyMock, return_value=library.batch_config
+    )
+
+    result = library.iter_asset_batches('AST-1')
+
+    first_batch = next(result)
+    assert first_batch.name == 'AST-1-1'
+    api_mock.call.assert_called_once_with(method='GET', path=('materials', library.name, 'assets', 'AST-1', 'batches'))
+
+    batches = [first_batch, *result]
+    assert [batch.name for batch in batches] == ['AST-1-1', 'AST-1-2', 'AST-1-3']
+    api_mock.call.assert_called_with(method='GET', path=next_link)
+    assert api_mock.call.call_count == 2
+    batch_config_mock.assert_not_called()
+
+    assert batches[2]['Name'] == 'AST-1-3'
+    batch_config_mock.assert_called_once_with()
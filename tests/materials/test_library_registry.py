@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+
+from signals_notebook.common_types import MaterialType, MID
+from signals_notebook.materials import LibraryRegistry
+
+
+@pytest.fixture()
+def get_list_mock(mocker, library_factory):
+    libraries = [library_factory(), library_factory()]
+    return mocker.patch('signals_notebook.materials.library.Library.get_list', return_value=libraries)
+
+
+def test_get(get_list_mock):
+    libraries = get_list_mock.return_value
+
+    for library in libraries:
+        assert LibraryRegistry.get(library.asset_type_id) is library
+        assert LibraryRegistry.get(library.asset_type_id) is library
+
+    get_list_mock.assert_called_once_with()
+
+
+def test_get_expired(get_list_mock, mocker):
+    library = get_list_mock.return_value[0]
+    LibraryRegistry.get(library.asset_type_id)
+    mocker.patch.object(LibraryRegistry, 'ttl', -1)
+
+    assert LibraryRegistry.get(library.asset_type_id) is library
+    assert get_list_mock.call_count == 2
+
+
+def test_refresh_keeps_libraries_with_same_digest(get_list_mock, library_factory):
+    library, changed_library = get_list_mock.return_value
+    LibraryRegistry.refresh()
+
+    new_library = library_factory(asset_type_id=library.asset_type_id, digest=library.digest)
+    new_changed_library = library_factory(asset_type_id=changed_library.asset_type_id)
+    get_list_mock.return_value = [new_library, new_changed_library]
+    LibraryRegistry.refresh()
+
+    assert LibraryRegistry.get(library.asset_type_id) is library
+    assert LibraryRegistry.get(changed_library.asset_type_id) is new_changed_library
+
+
+def test_get_unknown_library(get_list_mock, library_factory, mocker):
+    library = library_factory()
+    material_store_mock = mocker.patch('signals_notebook.materials.material_store.MaterialStore')
+    material_store_mock.get.return_value = library
+
+    assert LibraryRegistry.get(library.asset_type_id) is library
+    assert LibraryRegistry.get(library.asset_type_id) is library
+
+    material_store_mock.get.assert_called_once_with(MID(f'{MaterialType.LIBRARY}:{library.asset_type_id}'))
+    get_list_mock.assert_called_once_with()
+
+
+def test_unknown_library_is_remembered(get_list_mock):
+    assert LibraryRegistry.lookup('unknown') is None
+    assert LibraryRegistry.lookup('unknown') is None
+
+    get_list_mock.assert_called_once_with()
+
+
+def test_concurrent_lookups_refresh_once(get_list_mock):
+    libraries = get_list_mock.return_value
+
+    def get_list():
+        time.sleep(0.05)
+        return libraries
+
+    get_list_mock.side_effect = get_list
+    threads = [threading.Thread(target=LibraryRegistry.lookup, args=(f'unknown-{i}',)) for i in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert get_list_mock.call_count == 1
+    assert LibraryRegistry.lookup(libraries[0].asset_type_id) is libraries[0]
+    assert get_list_mock.call_count == 1
+
+
+def test_invalidate(get_list_mock):
+    library = get_list_mock.return_value[0]
+    LibraryRegistry.get(library.asset_type_id)
+
+    LibraryRegistry.invalidate()
+    LibraryRegistry.get(library.asset_type_id)
+
+    assert get_list_mock.call_count == 2
+
+
+def test_library_configs_are_loaded_from_registry(get_list_mock, library_factory):
+    cached_library = get_list_mock.return_value[0]
+    library = library_factory(asset_type_id=cached_library.asset_type_id, _asset_config=None, _batch_config=None)
+    library._asset_config = None
+    library._batch_config = None
+
+    assert library.asset_config == cached_library.asset_config
+    assert library.batch_config == cached_library.batch_config
+    get_list_mock.assert_called_once_with()
@@ -0,0 +1,84 @@
+import pytest
+
+from signals_notebook.materials import MaterialIndex
+from signals_notebook.materials.field import AssetConfig, MaterialFieldType, Numbering
+
+RECORDS = [
+    {'Name': 'Water', 'CAS Number': '7732-18-5', 'Formula': 'H2O', 'Mass': '18.015'},
+    {'Name': 'Ethanol', 'CAS Number': '64-17-5', 'Formula': 'C2H6O', 'Mass': '46.07 g/mol'},
+    {'Name': 'Ethylene', 'CAS Number': '74-85-1', 'Formula': 'C2H4', 'Mass': '28.05'},
+    {'Name': 'Methanol', 'CAS Number': '67-56-1', 'Formula': 'CH4O', 'Mass': '32.04'},
+]
+
+
+@pytest.fixture()
+def library(library_factory):
+    fields = [
+        ('1', 'Name', MaterialFieldType.TEXT),
+        ('2', 'CAS Number', MaterialFieldType.CAS_NUMBER),
+        ('3', 'Formula', MaterialFieldType.MOLECULAR_FORMULA),
+        ('4', 'Mass', MaterialFieldType.MOLECULAR_MASS),
+    ]
+    return library_factory(
+        _asset_config=AssetConfig(
+            numbering=Numbering(format='AST-###'),
+            fields=[
+                {'id': _id, 'name': name, 'mandatory': False, 'hidden': False, 'dataType': data_type}
+                for _id, name, data_type in fields
+            ],
+            display_name='Compound',
+        )
+    )
+
+
+@pytest.fixture()
+def index(library):
+    index = MaterialIndex(library)
+    index.update(RECORDS)
+    return index
+
+
+def test_find(index):
+    assert index.find({'CAS Number': '64-17-5'}) == [RECORDS[1]]
+    assert index.find(Formula='C2H4', Name='Ethylene') == [RECORDS[2]]
+    assert index.find(Formula='C2H4', Name='Water') == []
+    assert index.find(Unknown='value') == []
+    assert index.find() == RECORDS
+
+
+def test_find_prefix(index):
+    assert index.find_prefix('Name', 'Eth') == [RECORDS[1], RECORDS[2]]
+    assert index.find_prefix('Formula', 'C2') == [RECORDS[1], RECORDS[2]]
+    assert index.find_prefix('Name', 'X') == []
+
+
+def test_find_range(index):
+    assert index.find_range('Mass', 20, 40) == [RECORDS[2], RECORDS[3]]
+    assert index.find_range('Mass', low=30) == [RECORDS[1], RECORDS[3]]
+    assert index.find_range('Mass', high=18.015) == [RECORDS[0]]
+    assert index.find_range('Name', 'F', 'N') == [RECORDS[3]]
+
+
+def test_update(index):
+    ethanol = {**RECORDS[1], 'Mass': '46.07'}
+
+    assert index.update([RECORDS[0], ethanol, RECORDS[3]]) == (1, 2)
+
+    assert len(index) == 3
+    assert index.find(Name='Ethanol') == [ethanol]
+    assert index.find(Name='Ethylene') == []
+    assert index.find_range('Mass', 40, 50) == [ethanol]
+    assert index.update([RECORDS[0], ethanol, RECORDS[3]]) == (0, 0)
+
+
+def test_library_find(library, mocker):
+    iter_export_records_mock = mocker.patch.object(
+        type(library), 'iter_export_records', side_effect=lambda **kwargs: iter(RECORDS)
+    )
+
+    assert library.find({'CAS Number': '7732-18-5'}) == [RECORDS[0]]
+    assert library.find(Name='Methanol') == [RECORDS[3]]
+    iter_export_records_mock.assert_called_once_with(timeout=600, period=5)
+
+    library.get_index(refresh=True)
+    assert iter_export_records_mock.call_count == 2
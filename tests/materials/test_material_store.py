@@ -107,3 +107,108 @@ def test_get_library(api_mock, mid_factory):
     assert result.name == response['data']['attributes']['name']
     assert result.created_at == arrow.get(response['data']['attributes']['createdAt'])
     assert result.edited_at == arrow.get(response['data']['attributes']['editedAt'])
+
+
+def _get_material_response(eid, asset_type_id):
+    return {
+        'links': {'self': f'https://example.com/{eid}'},
+        'data': {
+            'type': ObjectType.MATERIAL,
+            'id': eid,
+            'links': {'self': f'https://example.com/{eid}'},
+            'attributes': {
+                'assetTypeId': asset_type_id,
+                'library': 'Plasmids',
+                'eid': eid,
+                'name': eid.id,
+                'description': 'test description',
+                'type': eid.type,
+                'createdAt': '2019-09-06T03:12:35.129Z',
+                'editedAt': '2019-09-06T15:22:47.309Z',
+                'digest': '1234234',
+                'fields': {
+                    'Name': {
+                        'value': 'test',
+                    },
+                },
+            },
+        },
+    }
+
+
+def test_get_many(api_mock, mid_factory, library_factory, mocker):
+    libraries = [library_factory(), library_factory()]
+    get_list_mock = mocker.patch('signals_notebook.materials.library.Library.get_list', return_value=libraries)
+
+    eids = [
+        mid_factory(type=MaterialType.ASSET),
+        mid_factory(type=MaterialType.BATCH),
+        mid_factory(type=MaterialType.ASSET),
+        mid_factory(type=MaterialType.BATCH),
+    ]
+    missing_eid = mid_factory(type=MaterialType.ASSET)
+    responses = {
+        eid: _get_material_response(eid, libraries[i % 2].asset_type_id) for i, eid in enumerate(eids)
+    }
+
+    def call(method, path):
+        eid = path[1]
+        if eid == missing_eid:
+            raise ValueError('Not found')
+        response = mocker.Mock()
+        response.json.return_value = responses[eid]
+        return response
+
+    api_mock.call.side_effect = call
+
+    result = MaterialStore.get_many([eids[0], missing_eid, *eids[1:], eids[0]], concurrency=3)
+
+    assert api_mock.call.call_count == 5
+    get_list_mock.assert_called_once_with()
+
+    assert len(result) == 6
+    assert isinstance(result[1], ValueError)
+    assert result[0] is result[5]
+    for material, eid, expected_class, library in zip(
+        [result[0], *result[2:5]], eids, [Asset, Batch, Asset, Batch], [*libraries, *libraries]
+    ):
+        assert isinstance(material, expected_class)
+        assert material.eid == eid
+        assert material.library is library
+        assert material['Name'] == 'test'
+
+
+def test_get_many_raise_exception(api_mock, mid_factory):
+    eid = mid_factory(type=MaterialType.ASSET)
+    api_mock.call.side_effect = ValueError('Not found')
+
+    with pytest.raises(ValueError):
+        MaterialStore.get_many([eid], return_exceptions=False)
+
+
+def test_save_many(api_mock, asset_factory, batch_factory, mocker):
+    assets = [asset_factory(), asset_factory(), batch_factory(), asset_factory()]
+    failed_asset = assets[2]
+    for material in assets[1:]:
+        material['Name'] = f'New {material.name}'
+
+    def call(method, path, **kwargs):
+        if path[1] == failed_asset.eid:
+            raise ValueError('Conflict')
+        return mocker.Mock()
+
+    api_mock.call.side_effect = call
+    progress = mocker.Mock()
+
+    result = MaterialStore.save_many([*assets, assets[1]], concurrency=2, progress=progress)
+
+    assert result[:2] == [None, None]
+    assert isinstance(result[2], ValueError)
+    assert result[3:] == [None, None]
+    assert api_mock.call.call_count == 3
+    assert {call.kwargs['path'][1] for call in api_mock.call.call_args_list} == {
+        material.eid for material in assets[1:]
+    }
+    assert sorted(progress.call_args_list) == [mocker.call(i, 3) for i in range(1, 4)]
+    assert not assets[1].is_changed
+    assert failed_asset.is_changed
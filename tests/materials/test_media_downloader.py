@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from signals_notebook.common_types import File
+from signals_notebook.materials import MaterialMedia
+
+
+@pytest.fixture()
+def get_chemical_drawing_mock(mocker):
+    return mocker.patch(
+        'signals_notebook.materials.material.Material.get_chemical_drawing',
+        autospec=True,
+        side_effect=lambda material, format=None: File(
+            name=f'{material.name}.{format}', content=material.name.encode(), content_type='chemical/x-cdxml'
+        ),
+    )
+
+
+def test_download_assets_media(library_factory, asset_factory, get_chemical_drawing_mock, mocker, dict_fs_handler):
+    library = library_factory()
+    assets = [asset_factory(_library=library) for _ in range(3)]
+    progress = mocker.Mock()
+
+    report = library.download_assets_media(
+        assets, dict_fs_handler, 'media', drawing_format='cdxml', concurrency=2, progress=progress
+    )
+
+    paths = [f'media/{library.name}/{asset.name}/{asset.name}.cdxml' for asset in assets]
+    assert sorted(report.downloaded) == sorted(paths)
+    assert report.skipped == []
+    assert report.failed == {}
+    for asset, path in zip(assets, paths):
+        assert dict_fs_handler.files[path] == asset.name.encode()
+    manifest = json.loads(dict_fs_handler.files[f'media/{library.name}/media.json'])
+    assert manifest[f'{assets[0].eid}/{MaterialMedia.CHEMICAL_DRAWING.value}'] == {
+        'path': paths[0],
+        'digest': assets[0].digest,
+    }
+    assert sorted(progress.call_args_list) == [mocker.call(i, 3) for i in range(1, 4)]
+
+
+def test_download_assets_media_skip_existing(
+    library_factory, asset_factory, get_chemical_drawing_mock, mocker, dict_fs_handler
+):
+    library = library_factory()
+    asset, changed_asset = asset_factory(_library=library), asset_factory(_library=library)
+    library.download_assets_media([asset, changed_asset], dict_fs_handler, 'media')
+    changed_asset = asset_factory(_library=library, eid=changed_asset.eid, name=changed_asset.name, digest='new')
+    get_asset_mock = mocker.patch.object(type(library), 'get_asset', side_effect=ValueError('Not found'))
+
+    report = library.download_assets_media([asset, changed_asset, 'AST-404'], dict_fs_handler, 'media')
+
+    assert report.skipped == [f'media/{library.name}/{asset.name}/{asset.name}.None']
+    assert report.downloaded == [f'media/{library.name}/{changed_asset.name}/{changed_asset.name}.None']
+    assert report.failed == {'AST-404': 'Not found'}
+    assert get_chemical_drawing_mock.call_count == 3
+    get_asset_mock.assert_called_once_with('AST-404')
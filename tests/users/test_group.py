@@ -1,6 +1,7 @@
 import json
 
 import arrow
+import pytest
 
 from signals_notebook.users.group import Group
 from signals_notebook.users.user import User
@@ -351,3 +352,108 @@ def test_delete_member(api_mock, group_factory, user_factory):
         method='DELETE',
         path=('groups', group.id, 'members', user.id),
     )
+
+
+def _members_response(users, next_link=None):
+    return {
+        'links': {'self': 'https://example.com/api/rest/v1.0/groups/103/members', 'next': next_link},
+        'data': [
+            {
+                'type': 'user',
+                'id': user.id,
+                'attributes': {
+                    'userId': user.id,
+                    'userName': user.username,
+                    'email': user.email,
+                    'firstName': user.first_name,
+                    'lastName': user.last_name,
+                },
+            }
+            for user in users
+        ],
+    }
+
+
+def test_get_members_cached(api_mock, group_factory, get_response_object, mocker, user_factory, user_registry):
+    group = group_factory()
+    users = user_factory.create_batch(3)
+    for user in users:
+        user_registry.put(user)
+    next_link = 'https://example.com/api/rest/v1.0/groups/103/members?page[offset]=2'
+    api_mock.call.side_effect = [
+        get_response_object(_members_response(users[:2], next_link)),
+        get_response_object(_members_response(users[1:])),
+    ]
+
+    group_members = group.get_members()
+
+    assert group_members == users
+    api_mock.call.assert_has_calls(
+        [
+            mocker.call(method='GET', path=('groups', group.id, 'members')),
+            mocker.call(method='GET', path=next_link),
+        ]
+    )
+    assert api_mock.call.call_count == 2
+
+
+def test_add_users(api_mock, group_factory, get_response_object, mocker, user_factory):
+    group = group_factory()
+    users = user_factory.create_batch(3)
+
+    def _call(method, path, **kwargs):
+        if method == 'POST':
+            return get_response_object({})
+        return get_response_object(_members_response(users))
+
+    api_mock.call.side_effect = _call
+
+    group_members = group.add_users(users + users[:1], concurrency=2)
+
+    assert group_members == users
+    for user in users:
+        api_mock.call.assert_any_call(
+            method='POST',
+            path=('groups', group.id, 'members'),
+            params={'force': json.dumps(True)},
+            json={'data': {'attributes': {'userId': user.id}}},
+        )
+    assert api_mock.call.call_count == 4
+    assert api_mock.call.call_args == mocker.call(method='GET', path=('groups', group.id, 'members'))
+
+
+def test_add_users_error(api_mock, group_factory, user_factory):
+    group = group_factory()
+    users = user_factory.create_batch(2)
+    api_mock.call.side_effect = [None, ValueError('Forbidden')]
+
+    with pytest.raises(ValueError):
+        group.add_users(users, concurrency=1)
+
+    assert api_mock.call.call_count == 2
+
+
+@pytest.mark.parametrize(
+    'change_members',
+    [
+        lambda group, user: group.add_user(user),
+        lambda group, user: group.add_users([user]),
+        lambda group, user: group.delete_user(user),
+    ],
+)
+def test_change_members_invalidates_user_groups(
+    api_mock, group_factory, get_response_object, user_factory, user_registry, change_members
+):
+    group = group_factory()
+    user = user_factory()
+    cached_user = user.copy()
+    user_registry.put(cached_user)
+    user._groups = cached_user._groups = []
+    api_mock.call.side_effect = lambda method, path, **kwargs: get_response_object(
+        _members_response([user]) if method == 'GET' else {}
+    )
+
+    change_members(group, user)
+
+    assert user._groups is None
+    assert cached_user._groups is None
@@ -0,0 +1,94 @@
+import pytest
+
+from signals_notebook.users.membership_graph import MembershipGraph
+
+
+def _group_item(group):
+    return {
+        'type': 'group',
+        'id': group.id,
+        'attributes': {
+            'id': group.id,
+            'name': group.name,
+            'description': group.description,
+            'createdAt': '2019-12-02T04:58:45.069Z',
+            'editedAt': '2019-12-02T04:58:45.069Z',
+            'type': 'group',
+            'digest': group.digest,
+            'isSystem': 'false',
+        },
+    }
+
+
+@pytest.fixture()
+def groups(group_factory):
+    return group_factory.create_batch(3)
+
+
+@pytest.fixture()
+def members(groups):
+    return {groups[0].id: ['1', '2'], groups[1].id: ['2', '3'], groups[2].id: []}
+
+
+@pytest.fixture()
+def groups_api(api_mock, get_response_object, groups, members):
+    def _call(method, path, **kwargs):
+        if path == ('groups',):
+            return get_response_object(
+                {
+                    'links': {'self': 'https://example.com/api/rest/v1.0/groups'},
+                    'data': [_group_item(group) for group in groups],
+                }
+            )
+        return get_response_object({'data': [{'id': user_id, 'type': 'user'} for user_id in members[path[1]]]})
+
+    api_mock.call.side_effect = _call
+    return api_mock
+
+
+def test_build(groups_api, groups):
+    graph = MembershipGraph.build(concurrency=2)
+
+    assert [group.id for group in graph.groups] == [group.id for group in groups]
+    assert graph.get_member_ids(groups[0].id) == {'1', '2'}
+    assert graph.get_group_ids('2') == {groups[0].id, groups[1].id}
+    assert [group.id for group in graph.get_groups('3')] == [groups[1].id]
+    assert graph.get_groups('unknown') == []
+    assert graph.users_in_any([groups[0].id, groups[1].id]) == {'1', '2', '3'}
+    assert graph.users_in_all([groups[0].id, groups[1].id]) == {'2'}
+    assert graph.users_in_all([groups[0].id, groups[2].id]) == set()
+    assert graph.users_in_all([]) == set()
+    assert groups_api.call.call_count == 4
+
+
+def test_refresh_group(groups_api, groups, members):
+    graph = MembershipGraph.build()
+    members[groups[0].id] = ['3']
+    groups_api.call.reset_mock()
+
+    graph.refresh_group(groups[0])
+
+    groups_api.call.assert_called_once()
+    assert graph.get_member_ids(groups[0].id) == {'3'}
+    assert graph.get_group_ids('1') == set()
+    assert graph.get_group_ids('3') == {groups[0].id, groups[1].id}
+
+
+def test_refresh_removes_deleted_groups(groups_api, groups):
+    graph = MembershipGraph.build()
+    deleted_group = groups.pop(1)
+
+    graph.refresh()
+
+    assert graph.get_group(deleted_group.id) is None
+    assert graph.get_group_ids('3') == set()
+    assert graph.get_group_ids('2') == {groups[0].id}
+
+
+def test_get_members(groups_api, groups, user_factory, user_registry):
+    users = [user_factory(id=user_id) for user_id in ('1', '2')]
+    for user in users:
+        user_registry.put(user)
+    graph = MembershipGraph.build()
+
+    assert graph.get_members(groups[0].id) == users
@@ -0,0 +1,65 @@
+import json
+
+from signals_notebook.users.picture_exporter import export_pictures
+
+
+def _picture_response(mocker, content, status_code=200, etag='"1"'):
+    response = mocker.Mock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = {'content-type': 'image/jpeg', 'etag': etag} if content else {}
+    return response
+
+
+def test_export_pictures(api_mock, user_factory, mocker, dict_fs_handler):
+    users = user_factory.create_batch(3)
+    contents = {users[0].id: b'first', users[1].id: b'second', users[2].id: b''}
+    api_mock.call.side_effect = lambda method, path, **kwargs: _picture_response(mocker, contents[path[1]])
+    progress = mocker.Mock()
+
+    report = export_pictures(users + users[:1], dict_fs_handler, concurrency=2, progress=progress)
+
+    paths = [f'pictures/{user.id}/{user.first_name}_{user.last_name}.jpg' for user in users[:2]]
+    assert sorted(report.exported) == sorted(paths)
+    assert report.skipped == []
+    assert report.failed == {}
+    assert dict_fs_handler.files[paths[0]] == b'first'
+    assert users[0].picture.content == b'first'
+    manifest = json.loads(dict_fs_handler.files['pictures/pictures.json'])
+    assert set(manifest) == {users[0].id, users[1].id}
+    assert manifest[users[0].id]['etag'] == '"1"'
+    assert api_mock.call.call_count == 3
+    assert progress.call_args == mocker.call(3, 3)
+
+
+def test_export_pictures_conditional(api_mock, user_factory, mocker, dict_fs_handler):
+    users = user_factory.create_batch(2)
+    api_mock.call.side_effect = lambda method, path, **kwargs: _picture_response(mocker, b'picture')
+    export_pictures(users, dict_fs_handler)
+
+    api_mock.call.side_effect = [
+        _picture_response(mocker, b'', status_code=304),
+        ValueError('Server error'),
+    ]
+    report = export_pictures(users, dict_fs_handler, concurrency=1)
+
+    assert report.exported == []
+    assert report.skipped == [f'pictures/{users[0].id}/{users[0].first_name}_{users[0].last_name}.jpg']
+    assert list(report.failed) == [users[1].id]
+    api_mock.call.assert_any_call(
+        method='GET', path=('users', users[0].id, 'picture'), headers={'If-None-Match': '"1"'}
+    )
+
+
+def test_export_pictures_unchanged_content(api_mock, user_factory, mocker, dict_fs_handler):
+    user = user_factory()
+    api_mock.call.side_effect = lambda method, path, **kwargs: _picture_response(mocker, b'picture', etag='')
+    export_pictures([user], dict_fs_handler)
+    dict_fs_handler.files.clear()
+
+    report = export_pictures([user], dict_fs_handler, skip_unchanged=False)
+    assert len(report.exported) == 1
+
+    report = export_pictures([user], dict_fs_handler)
+    assert report.exported == []
+    assert len(report.skipped) == 1
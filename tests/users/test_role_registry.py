@@ -0,0 +1,71 @@
+import pytest
+
+from signals_notebook.users.role import Role
+from signals_notebook.users.role_registry import RoleRegistry
+
+
+def _role_item(role):
+    return {'type': 'role', 'id': role.id, 'attributes': {'id': role.id, 'name': role.name}}
+
+
+@pytest.fixture()
+def roles(role_factory):
+    return role_factory.create_batch(2)
+
+
+@pytest.fixture()
+def roles_api(api_mock, get_response_object, roles):
+    def _call(method, path):
+        if path == ('roles',):
+            return get_response_object(
+                {
+                    'links': {'self': 'https://example.com/api/rest/v1.0/roles'},
+                    'data': [_role_item(role) for role in roles],
+                }
+            )
+        return get_response_object({'data': _role_item(Role(id=path[1], name='Unknown'))})
+
+    api_mock.call.side_effect = _call
+    return api_mock
+
+
+def test_get_cached(roles_api, roles, mocker):
+    role = RoleRegistry.get(roles[0].id)
+
+    assert isinstance(role, Role)
+    assert role.id == roles[0].id
+    assert RoleRegistry.get(roles[1].id).name == roles[1].name
+    assert RoleRegistry.get(roles[0].id) is role
+    roles_api.call.assert_called_once_with(method='GET', path=('roles',))
+
+
+def test_get_unknown(roles_api, mocker):
+    role = RoleRegistry.get('unknown')
+
+    assert role.id == 'unknown'
+    roles_api.call.assert_has_calls(
+        [mocker.call(method='GET', path=('roles',)), mocker.call(method='GET', path=('roles', 'unknown'))]
+    )
+    roles_api.call.reset_mock()
+
+    assert RoleRegistry.get('unknown') is role
+    roles_api.call.assert_not_called()
+
+
+def test_refresh_expired(roles_api, roles, mocker):
+    RoleRegistry.get(roles[0].id)
+    mocker.patch.object(RoleRegistry, 'ttl', -1)
+
+    RoleRegistry.get(roles[0].id)
+
+    assert roles_api.call.call_count == 2
+
+
+def test_shared_by_users(roles_api, roles, user_factory):
+    users = user_factory.create_batch(3)
+    for user in users:
+        user.set_relationships({'roles': {'data': [{'id': role.id, 'type': 'role'} for role in roles]}})
+
+    assert [[role.id for role in user.roles] for user in users] == [[role.id for role in roles]] * 3
+    roles_api.call.assert_called_once()
+    assert RoleRegistry.get_list() == users[0].roles
@@ -385,11 +385,14 @@ def test_get_roles(api_mock, user_factory, role_factory):
     }
     user.set_relationships(relationships)
 
-    api_mock.call.return_value.json.return_value = role_response
+    api_mock.call.return_value.json.return_value = {
+        'links': {'self': 'https://example.com/api/rest/v1.0/roles'},
+        'data': [role_response['data']],
+    }
 
     roles = user.roles
 
-    api_mock.call.assert_called_once_with(method='GET', path=('roles', role.id))
+    api_mock.call.assert_called_once_with(method='GET', path=('roles',))
 
     assert isinstance(roles, list)
     for role in roles:
@@ -525,6 +528,7 @@ def test_picture(api_mock, user_factory):
     api_mock.call.assert_called_once_with(
         method='GET',
         path=('users', user.id, 'picture'),
+        headers=None,
     )
 
     assert isinstance(result, File)
@@ -588,3 +592,20 @@ def test_get_system_groups(api_mock, user_factory):
         assert item.created_at == arrow.get(raw_item['attributes']['createdAt'])
         assert item.edited_at == arrow.get(raw_item['attributes']['editedAt'])
         assert item.digest == raw_item['attributes']['digest']
+
+
+def test_get_system_groups_memoized(api_mock, user_factory):
+    user = user_factory()
+    api_mock.call.return_value.json.return_value = {
+        'links': {'self': f'https://example.com/api/rest/v1.0/users/{user.id}/systemGroups'},
+        'data': [],
+    }
+
+    assert user.groups == []
+    assert user.groups == []
+    api_mock.call.assert_called_once_with(method='GET', path=('users', user.id, 'systemGroups'))
+
+    user.invalidate_groups()
+    user.groups
+
+    assert api_mock.call.call_count == 2
@@ -0,0 +1,133 @@
+import pytest
+
+from signals_notebook.users.user_directory import UserDirectory
+
+
+def _user_item(user):
+    return {
+        'id': user.id,
+        'type': 'user',
+        'attributes': {
+            'isEnabled': True,
+            'userId': user.id,
+            'userName': user.username,
+            'email': user.email,
+            'firstName': user.first_name,
+            'lastName': user.last_name,
+            'country': user.country,
+            'organization': user.organization,
+            'createdAt': '2020-07-17T21:48:33.262Z',
+        },
+        'relationships': {'roles': {'data': [{'id': '1', 'type': 'role'}]}},
+    }
+
+
+def _users_response(users, next_link=None):
+    return {
+        'links': {'self': 'https://example.com/api/rest/v1.0/users', 'next': next_link},
+        'data': [_user_item(user) for user in users],
+    }
+
+
+def _group_item(group):
+    return {
+        'type': 'group',
+        'id': group.id,
+        'attributes': {
+            'id': group.id,
+            'name': group.name,
+            'description': group.description,
+            'createdAt': '2019-12-02T04:58:45.069Z',
+            'editedAt': '2019-12-02T04:58:45.069Z',
+            'type': 'group',
+            'digest': group.digest,
+            'isSystem': 'false',
+        },
+    }
+
+
+@pytest.fixture()
+def users(user_factory):
+    return user_factory.create_batch(3)
+
+
+def test_lookups(api_mock, users, get_response_object, mocker, user_registry):
+    next_link = 'https://example.com/api/rest/v1.0/users?page[offset]=2'
+    api_mock.call.side_effect = [
+        get_response_object(_users_response(users[:2], next_link)),
+        get_response_object(_users_response(users[2:])),
+    ]
+    directory = UserDirectory(page_size=2)
+
+    assert directory.get(users[0].id).id == users[0].id
+    assert directory.get_by_email(users[1].email.upper()).id == users[1].id
+    assert directory.get_by_username(f' {users[2].username} ').id == users[2].id
+    assert [user.id for user in directory.find_by_name(users[0].first_name, users[0].last_name)] == [users[0].id]
+    assert directory.get_by_email('unknown@example.com') is None
+    assert len(directory) == 3
+    assert user_registry.lookup(users[0].id) is directory.get(users[0].id)
+
+    assert api_mock.call.call_count == 2
+    api_mock.call.assert_has_calls(
+        [
+            mocker.call(
+                method='GET', path=('users',), params={'q': '', 'enabled': 'true', 'offset': 0, 'limit': 2}
+            ),
+            mocker.call(method='GET', path=next_link),
+        ]
+    )
+
+
+def test_delta_refresh(api_mock, users, user_factory, get_response_object, mocker):
+    api_mock.call.return_value = get_response_object(_users_response(users))
+    directory = UserDirectory(refresh_interval=None)
+    unchanged_user = directory.get(users[1].id)
+
+    new_user = user_factory()
+    changed_user = users[0].copy(update={'email': 'changed@example.com'})
+    api_mock.call.return_value = get_response_object(_users_response([changed_user, users[1], new_user]))
+
+    assert directory.refresh() == (1, 1, 1)
+    assert directory.get(users[1].id) is unchanged_user
+    assert directory.get_by_email('changed@example.com').id == users[0].id
+    assert directory.get_by_email(users[0].email) is None
+    assert directory.get(users[2].id) is None
+    assert directory.get_by_username(new_user.username).id == new_user.id
+
+
+def test_periodic_refresh(api_mock, users, get_response_object):
+    api_mock.call.return_value = get_response_object(_users_response(users))
+    directory = UserDirectory(refresh_interval=-1)
+
+    directory.get(users[0].id)
+    directory.get(users[0].id)
+
+    assert api_mock.call.call_count == 2
+
+
+def test_get_groups(api_mock, users, group_factory, get_response_object):
+    groups = group_factory.create_batch(2)
+
+    def _call(method, path, **kwargs):
+        if path == ('groups',):
+            return get_response_object(
+                {
+                    'links': {'self': 'https://example.com/api/rest/v1.0/groups'},
+                    'data': [_group_item(group) for group in groups],
+                }
+            )
+        members = users[:2] if path[1] == groups[0].id else users[1:]
+        return get_response_object({'links': {}, 'data': [{'id': user.id, 'type': 'user'} for user in members]})
+
+    api_mock.call.side_effect = _call
+    directory = UserDirectory()
+
+    assert [group.id for group in directory.get_groups(users[0].id)] == [groups[0].id]
+    assert [group.id for group in directory.get_groups(users[1].id)] == [groups[0].id, groups[1].id]
+    assert directory.get_groups('unknown') == []
+    assert api_mock.call.call_count == 3
+
+    directory.invalidate_groups()
+    directory.get_groups(users[2].id)
+
+    assert api_mock.call.call_count == 6
@@ -0,0 +1,151 @@
+import pytest
+
+from signals_notebook.exceptions import SignalsNotebookError
+from signals_notebook.users.user import User
+from signals_notebook.users.user_directory import UserDirectory
+from signals_notebook.users.user_provisioning import UpsertAction, UserRecord
+
+
+def _user_item(user_id, email, country='USA'):
+    return {
+        'id': user_id,
+        'type': 'user',
+        'attributes': {
+            'isEnabled': True,
+            'userId': user_id,
+            'userName': email,
+            'email': email,
+            'firstName': 'Foo',
+            'lastName': 'Bar',
+            'country': country,
+            'organization': 'Org',
+            'createdAt': '2020-07-17T21:48:33.262Z',
+        },
+        'relationships': {'roles': {'data': [{'id': '1', 'type': 'role'}]}},
+    }
+
+
+def _error_response(mocker, status):
+    response = mocker.Mock()
+    response.json.return_value = {'errors': [{'status': str(status), 'code': 'Error', 'title': 'Error'}]}
+    return response
+
+
+def _record(email, country='USA', roles=()):
+    return UserRecord(
+        email=email, first_name='Foo', last_name='Bar', country=country, organization='Org', roles=list(roles)
+    )
+
+
+@pytest.fixture()
+def server(api_mock, get_response_object, mocker):
+    state = {
+        'users': [_user_item('1', 'existing@example.com'), _user_item('2', 'same@example.com')],
+        'failures': [],
+        'created': [],
+    }
+
+    def _call(method, path, **kwargs):
+        if path == ('roles',):
+            return get_response_object(
+                {
+                    'links': {'self': 'https://example.com/api/rest/v1.0/roles'},
+                    'data': [{'type': 'role', 'id': '3', 'attributes': {'id': '3', 'name': 'Standard User'}}],
+                }
+            )
+        if state['failures']:
+            raise state['failures'].pop(0)
+        if method == 'GET':
+            q = kwargs['params']['q']
+            users = [user for user in state['users'] if user['attributes']['email'].startswith(q)]
+            return get_response_object({'links': {'self': 'https://example.com/api/rest/v1.0/users'}, 'data': users})
+        if method == 'POST':
+            attributes = kwargs['json']['data']['attributes']
+            user = _user_item(str(len(state['users']) + 1), attributes['emailAddress'], attributes['country'])
+            state['users'].append(user)
+            state['created'].append(attributes)
+            return get_response_object({'data': user})
+        return get_response_object({})
+
+    api_mock.call.side_effect = _call
+    state['mock'] = api_mock
+    return state
+
+
+def test_bulk_upsert(server, mocker):
+    records = [
+        _record('new@example.com', roles=['standard user']),
+        _record('Existing@example.com', country='Canada'),
+        _record('same@example.com'),
+        _record('new@example.com'),
+        _record('other@example.com', roles=['Admin']),
+    ]
+    directory = UserDirectory()
+
+    results = User.bulk_upsert(records, directory=directory, concurrency=2)
+
+    assert [result.action for result in results] == [
+        UpsertAction.CREATED,
+        UpsertAction.UPDATED,
+        UpsertAction.UNCHANGED,
+        UpsertAction.CREATED,
+        UpsertAction.FAILED,
+    ]
+    assert results[0] == results[3]
+    assert results[4].error == 'Unknown role: Admin'
+    assert server['created'][0]['roles'] == [{'id': '3', 'name': 'Standard User'}]
+    assert len(server['created']) == 1
+    assert directory.get_by_email('new@example.com').id == results[0].user_id
+    assert directory.get_by_email('existing@example.com').country == 'Canada'
+    server['mock'].call.assert_any_call(
+        method='PATCH',
+        path=('users', '1'),
+        json={
+            'data': {
+                'attributes': {
+                    'alias': None,
+                    'country': 'Canada',
+                    'firstName': 'Foo',
+                    'lastName': 'Bar',
+                    'organization': 'Org',
+                }
+            }
+        },
+    )
+
+
+def test_bulk_upsert_retries(server, mocker):
+    mocker.patch('signals_notebook.users.user_provisioning.time.sleep')
+    directory = UserDirectory()
+    directory.get_list()
+    server['failures'] = [SignalsNotebookError(_error_response(mocker, 503))]
+
+    results = User.bulk_upsert([_record('new@example.com')], directory=directory)
+
+    assert results[0].action == UpsertAction.CREATED
+    assert len(server['created']) == 1
+
+
+def test_bulk_upsert_not_retried(server, mocker):
+    directory = UserDirectory()
+    directory.get_list()
+    server['failures'] = [SignalsNotebookError(_error_response(mocker, 400))]
+
+    results = User.bulk_upsert([_record('existing@example.com', country='Canada')], directory=directory)
+
+    assert results[0].action == UpsertAction.FAILED
+    assert directory.get_by_email('existing@example.com').country == 'USA'
+
+
+def test_bulk_upsert_renamed_user(server):
+    directory = UserDirectory()
+    user = directory.get_by_email('existing@example.com')
+    record = _record('existing@example.com')
+    record.first_name = 'New'
+
+    results = User.bulk_upsert([record], directory=directory)
+
+    assert results[0].action == UpsertAction.UPDATED
+    assert directory.find_by_name('Foo', 'Bar') == [directory.get_by_email('same@example.com')]
+    assert [renamed.id for renamed in directory.find_by_name('New', 'Bar')] == [user.id]
+    assert user.first_name == 'Foo'
@@ -0,0 +1,91 @@
+import pytest
+
+from signals_notebook.users.user import User
+from signals_notebook.users.user_registry import UserRegistry
+
+
+def _user_response(user_id):
+    return {
+        'links': {'self': f'https://example.com/api/rest/v1.0/users/{user_id}'},
+        'data': {
+            'id': user_id,
+            'type': 'user',
+            'attributes': {
+                'isEnabled': True,
+                'userId': user_id,
+                'userName': f'user{user_id}',
+                'email': f'user{user_id}@example.com',
+                'firstName': 'Foo',
+                'lastName': 'Bar',
+                'country': 'USA',
+                'organization': 'Perkinelmer',
+                'createdAt': '2020-07-17T21:48:33.262Z',
+            },
+            'relationships': {'roles': {'data': [{'id': '1', 'type': 'role'}]}},
+        },
+    }
+
+
+@pytest.fixture()
+def users_api(api_mock, get_response_object):
+    def _call(method, path, **kwargs):
+        if path[1] == 'missing':
+            raise ValueError('User not found')
+        return get_response_object(_user_response(path[1]))
+
+    api_mock.call.side_effect = _call
+    return api_mock
+
+
+def test_get_many(users_api, mocker):
+    users = UserRegistry.get_many(['1', '2', '1'], concurrency=2)
+
+    assert [user.id for user in users] == ['1', '2', '1']
+    assert all(isinstance(user, User) for user in users)
+    assert users[0] is users[2]
+    assert users_api.call.call_count == 2
+    users_api.call.assert_has_calls(
+        [mocker.call(method='GET', path=('users', '1')), mocker.call(method='GET', path=('users', '2'))],
+        any_order=True,
+    )
+
+
+def test_get_cached(users_api):
+    user = UserRegistry.get('1')
+
+    assert UserRegistry.get('1') is user
+    assert UserRegistry.lookup('1') is user
+    users_api.call.assert_called_once()
+
+
+def test_get_expired(users_api, mocker):
+    UserRegistry.get('1')
+    mocker.patch.object(UserRegistry, 'ttl', -1)
+
+    assert UserRegistry.lookup('1') is None
+    UserRegistry.get('1')
+
+    assert users_api.call.call_count == 2
+
+
+def test_put_and_invalidate(users_api, user_factory):
+    user = user_factory()
+    UserRegistry.put(user)
+
+    assert UserRegistry.get(user.id) is user
+    users_api.call.assert_not_called()
+
+    UserRegistry.invalidate(user.id)
+
+    assert UserRegistry.lookup(user.id) is None
+
+
+def test_get_many_errors(users_api):
+    users = UserRegistry.get_many(['1', 'missing'], return_exceptions=True)
+
+    assert isinstance(users[0], User)
+    assert isinstance(users[1], ValueError)
+    assert UserRegistry.lookup('missing') is None
+
+    with pytest.raises(ValueError):
+        UserRegistry.get_many(['1', 'missing'])